@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+전략 커널 AOT(사전) 컴파일 스크립트
+
+modules/ 아래에 _strategy_kernels_aot 확장 모듈을 생성한다.
+확장 모듈이 있으면 modules._strategy_kernels가 JIT 대신 이를 사용하여
+첫 거래 결정의 JIT 컴파일 지연을 없앤다.
+
+사용법: python build_kernels.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+MODULES_DIR = project_root / 'modules'
+AOT_MODULE_NAME = '_strategy_kernels_aot'
+
+
+def main():
+    """메인 실행 함수"""
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        print("❌ numba.pycc를 사용할 수 없습니다 (numba 설치 필요)")
+        return 1
+    
+    # 이전 빌드 결과가 로드되지 않도록 먼저 제거 (JIT 커널 원본으로 컴파일)
+    for path in MODULES_DIR.glob(f'{AOT_MODULE_NAME}*'):
+        path.unlink()
+    
+    from modules import _strategy_kernels as kernels
+    
+    cc = CC(AOT_MODULE_NAME)
+    cc.output_dir = str(MODULES_DIR)
+    cc.verbose = True
+    
+    cc.export('hybrid_select', 'i8(f8, i8, f8, i8, f8, f8)')(kernels.hybrid_select.py_func)
+    cc.export('hybrid_select_batch', 'i1[:](f8[:], i1[:], f8[:], i1[:], f8[:], f8)')(
+        kernels.hybrid_select_batch.py_func
+    )
+    
+    cc.compile()
+    print(f"✅ 커널 사전 컴파일 완료: {MODULES_DIR / AOT_MODULE_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
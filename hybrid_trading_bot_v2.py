@@ -153,7 +153,7 @@ class HybridTradingBotV2:
 <i>하이브리드 포트폴리오 전략으로 시작합니다!</i>
             """.strip()
             
-            self.telegram.telegram.send_message(message)
+            self.telegram.send_text(message)
             
         except Exception as e:
             self.logger.error(f"시작 알림 전송 실패: {e}")
@@ -255,20 +255,25 @@ class HybridTradingBotV2:
             
             # 신호 실행
             self.logger.info(f"생성된 신호 수: {len(signals)}개")
-            for i, signal in enumerate(signals[:5]):  # 최대 5개까지만
+            top_signals = signals[:5]  # 최대 5개까지만
+            
+            # 리스크 일괄 검증 (공매도 한도를 신호 순서대로 누적 반영)
+            orders = [
+                {
+                    'symbol': signal['symbol'],
+                    'side': signal['action'],
+                    'size': signal['size'],
+                    'price': market_data.get(signal['symbol'], {}).get(f"{signal['exchange_type']}_ticker", {}).get('last', 0),
+                    'exchange_type': signal['exchange_type']
+                }
+                for signal in top_signals
+            ]
+            risk_checks = self.risk_manager.validate_trades_batch(orders, portfolio_state['current_balance'])
+            
+            for i, (signal, order, risk_check) in enumerate(zip(top_signals, orders, risk_checks)):
                 self.logger.info(f"신호 #{i+1}: {signal['symbol']} {signal['action']} "
                                f"({signal['exchange_type']}) - 신뢰도: {signal.get('confidence', 0):.2f}")
-                
-                # 리스크 검증
-                current_price = market_data.get(signal['symbol'], {}).get(f"{signal['exchange_type']}_ticker", {}).get('last', 0)
-                risk_check = self.risk_manager.validate_trade(
-                    symbol=signal['symbol'],
-                    side=signal['action'],
-                    size=signal['size'],
-                    price=current_price,
-                    current_balance=portfolio_state['current_balance'],
-                    exchange_type=signal['exchange_type']
-                )
+                current_price = order['price']
                 
                 if risk_check['is_valid']:
                     self.logger.info(f"리스크 검증 통과: {signal['symbol']} - 거래 실행 중...")
@@ -384,7 +389,7 @@ class HybridTradingBotV2:
 <i>{signal['strategy']} 전략으로 거래 완료</i>
             """.strip()
             
-            self.telegram.telegram.send_message(message)
+            self.telegram.send_text(message)
             
         except Exception as e:
             self.logger.error(f"거래 알림 전송 실패: {e}")
@@ -414,7 +419,7 @@ class HybridTradingBotV2:
 {'🟢 균형 상태' if not metrics.get('rebalancing_needed') else '🟡 리밸런싱 필요'}
             """.strip()
             
-            self.telegram.telegram.send_message(message)
+            self.telegram.send_text(message)
             self.last_portfolio_update = datetime.now()
             
         except Exception as e:
@@ -0,0 +1,103 @@
+"""
+성과 지표 계산 커널 모듈
+"""
+import math
+import numpy as np
+from utils._njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def perf_kernel(values, periods_per_year=252.0):
+    """잔고 시계열 단일 패스 성과 계산
+
+    누적 최대값(드로우다운)과 Welford 알고리즘(로그 수익률 평균/표준편차)을
+    한 번의 순회로 계산한다. 샤프 비율은 sqrt(periods_per_year)로 연율화한다.
+    어느 한쪽 값이 0 이하인 구간은 로그 수익률을 정의할 수 없으므로 건너뛴다.
+
+    Returns:
+        (max_drawdown, avg_return, volatility, sharpe_ratio)
+    """
+    n_values = values.shape[0]
+    if n_values < 2:
+        return 0.0, 0.0, 0.0, 0.0
+
+    peak = values[0]
+    max_dd = 0.0
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(1, n_values):
+        prev_value = values[i - 1]
+        value = values[i]
+
+        # 최대 드로우다운
+        if value > peak:
+            peak = value
+        elif peak > 0.0:
+            drawdown = (peak - value) / peak
+            if drawdown > max_dd:
+                max_dd = drawdown
+
+        # 로그 수익률 평균/분산 (Welford)
+        if value <= 0.0 or prev_value <= 0.0:
+            continue
+        ret = math.log(value / prev_value)
+        n += 1
+        delta = ret - mean
+        mean += delta / n
+        m2 += delta * (ret - mean)
+
+    # 표본 표준편차 (ddof=1)
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    sharpe = mean / std * math.sqrt(periods_per_year) if std > 0 else 0.0
+
+    return max_dd, mean, std, sharpe
+
+
+def to_value_array(records, key: str = 'total_value') -> np.ndarray:
+    """기록 리스트에서 커널 입력용 float64 배열 생성"""
+    return np.fromiter((record[key] for record in records), dtype=np.float64, count=len(records))
+
+
+def kelly_fraction(win_rate: float, avg_win: float, avg_loss: float) -> float:
+    """기본 Kelly 비율 계산 (최대 25%로 제한)"""
+    fraction = (win_rate * avg_win - (1.0 - win_rate) * avg_loss) / avg_win
+    return max(0.0, min(fraction, 0.25))
+
+
+@njit(cache=True, fastmath=True)
+def kelly_size_kernel(signal_strength, balance, price, volatility, risk_per_trade, kelly_fraction):
+    """Kelly Criterion + 변동성 조정 포지션 크기 계산
+
+    kelly_fraction은 설정값에서 미리 계산된 기본 Kelly 비율 (kelly_fraction 함수 참고)
+    """
+    adjusted_fraction = kelly_fraction * signal_strength / (1.0 + volatility * 10.0)
+    position_value = min(balance * adjusted_fraction, balance * risk_per_trade)
+    return position_value / price
+
+
+@njit(cache=True, fastmath=True)
+def stop_loss_kernel(is_buy, entry_price, volatility, stop_loss_pct):
+    """변동성/ATR 기반 스탑로스 가격 계산"""
+    volatility_adjustment = max(volatility * 2.0, stop_loss_pct)
+    atr_stop_loss = volatility * 2.0
+    distance = max(stop_loss_pct, min(volatility_adjustment, atr_stop_loss))
+
+    if is_buy:
+        return entry_price * (1.0 - distance)
+    return entry_price * (1.0 + distance)
+
+
+@njit(cache=True, fastmath=True)
+def take_profit_kernel(is_buy, entry_price, signal_strength, take_profit_pct, risk_reward_distance):
+    """신호 강도/손익비 기반 테이크프로핏 가격 계산
+
+    risk_reward_distance는 스탑로스 거리 x 손익비 (2:1)
+    """
+    strength_adjustment = take_profit_pct * (1.0 + signal_strength)
+    distance = min(strength_adjustment, risk_reward_distance)
+
+    if is_buy:
+        return entry_price * (1.0 + distance)
+    return entry_price * (1.0 - distance)
@@ -0,0 +1,138 @@
+"""
+전략 결정 계산 커널 모듈
+"""
+import numpy as np
+from utils._njit import njit
+
+# 거래 행동 코드 (decision_kernel 반환값 인덱스)
+ACTION_HOLD = 0
+ACTION_BUY = 1
+ACTION_SELL = 2
+ACTIONS = ('hold', 'buy', 'sell')
+ACTION_CODES = {'hold': ACTION_HOLD, 'buy': ACTION_BUY, 'sell': ACTION_SELL}
+
+# 하이브리드 전략 코드 (hybrid_select 반환값)
+STRATEGY_ARBITRAGE = 0
+STRATEGY_TREND = 1
+STRATEGY_HEDGE = 2
+STRATEGY_SPOT_ONLY = 3
+STRATEGY_FUTURES_ONLY = 4
+
+# 설정값별 특수화 결정 커널 캐시
+_specialized_decision_kernels = {}
+
+
+@njit(cache=True)
+def decision_kernel(signal, premium, allocation, max_leverage, signal_threshold,
+                    premium_threshold, premium_factor, premium_action):
+    """단일 시장 거래 결정 계산
+
+    신호가 임계값을 넘으면 매수/매도를 결정하고, 프리미엄이 +임계값을 넘으면
+    premium_action 쪽, -임계값 미만이면 반대쪽 행동의 신뢰도에 premium_factor를 곱한다.
+
+    Returns:
+        (action_code, confidence, size, leverage)
+    """
+    if signal > signal_threshold:
+        action = 1
+        confidence = min(signal, 1.0)
+    elif signal < -signal_threshold:
+        action = 2
+        confidence = min(-signal, 1.0)
+    else:
+        action = 0
+        confidence = 0.0
+
+    if premium > premium_threshold:
+        if action == premium_action:
+            confidence *= premium_factor
+    elif premium < -premium_threshold:
+        if action != 0 and action != premium_action:
+            confidence *= premium_factor
+
+    confidence = min(confidence, 1.0)
+    leverage = min(int(confidence * max_leverage), max_leverage)
+    return action, confidence, confidence * allocation, leverage
+
+
+def specialize_decision_kernel(allocation, max_leverage, signal_threshold, premium_threshold,
+                               premium_factor, premium_action):
+    """설정 상수를 고정한 decision_kernel 생성 (설정값별 캐시)
+
+    클로저 변수는 numba 컴파일 시 상수로 취급되어 상수 폴딩된다.
+
+    Returns:
+        (signal, premium) -> (action_code, confidence, size, leverage)
+    """
+    key = (allocation, max_leverage, signal_threshold, premium_threshold, premium_factor, premium_action)
+    kernel = _specialized_decision_kernels.get(key)
+    if kernel is None:
+        @njit
+        def kernel(signal, premium):
+            return decision_kernel(signal, premium, allocation, max_leverage, signal_threshold,
+                                   premium_threshold, premium_factor, premium_action)
+
+        _specialized_decision_kernels[key] = kernel
+    return kernel
+
+
+def decision_batch(signals, premiums, allocation, max_leverage, signal_threshold,
+                   premium_threshold, premium_factor, premium_action):
+    """심볼 배열에 대한 거래 결정 일괄 계산 (decision_kernel의 벡터화 버전)
+
+    Returns:
+        (action_codes, confidences, sizes, leverages)
+    """
+    actions = np.where(signals > signal_threshold, ACTION_BUY,
+                       np.where(signals < -signal_threshold, ACTION_SELL, ACTION_HOLD)).astype(np.int8)
+    confidences = np.where(actions != ACTION_HOLD, np.minimum(np.abs(signals), 1.0), 0.0)
+
+    # 프리미엄 구간별 신뢰도 조정 배수
+    opposite_action = ACTION_BUY + ACTION_SELL - premium_action
+    factors = np.where((premiums > premium_threshold) & (actions == premium_action), premium_factor, 1.0)
+    factors = np.where((premiums < -premium_threshold) & (actions == opposite_action), premium_factor, factors)
+
+    confidences = np.minimum(confidences * factors, 1.0)
+    leverages = np.minimum((confidences * max_leverage).astype(np.int64), max_leverage)
+    return actions, confidences, confidences * allocation, leverages
+
+
+@njit(cache=True)
+def hybrid_select(premium, spot_action, spot_confidence, futures_action, futures_confidence,
+                  arbitrage_threshold):
+    """하이브리드 전략 선택
+
+    우선순위: 아비트라지 > 트렌드 추종(행동 일치) > 헤지(양쪽 모두 진입) > 단일 시장
+
+    Returns:
+        strategy_code
+    """
+    if abs(premium) > arbitrage_threshold:
+        return STRATEGY_ARBITRAGE
+    if spot_action == futures_action:
+        return STRATEGY_TREND
+    if spot_action != ACTION_HOLD and futures_action != ACTION_HOLD:
+        return STRATEGY_HEDGE
+    if spot_confidence > futures_confidence:
+        return STRATEGY_SPOT_ONLY
+    return STRATEGY_FUTURES_ONLY
+
+
+@njit(cache=True)
+def hybrid_select_batch(premiums, spot_actions, spot_confidences, futures_actions,
+                        futures_confidences, arbitrage_threshold):
+    """심볼 배열에 대한 하이브리드 전략 일괄 선택"""
+    n = premiums.shape[0]
+    strategies = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        strategies[i] = hybrid_select(premiums[i], spot_actions[i], spot_confidences[i],
+                                      futures_actions[i], futures_confidences[i],
+                                      arbitrage_threshold)
+    return strategies
+
+
+# build_kernels.py로 사전 컴파일한 확장 모듈이 있으면 JIT 커널 대신 사용
+try:
+    from ._strategy_kernels_aot import hybrid_select, hybrid_select_batch
+except ImportError:
+    pass
@@ -0,0 +1,404 @@
+"""
+기술적 지표 계산 커널 모듈
+"""
+import numpy as np
+from utils._njit import njit, prange
+
+
+# 이동평균 기간 (SMA/EMA 공통)
+MA_PERIODS = (5, 10, 20, 50)
+
+# 전체 지표 출력 버퍼 dtype (임계값 비교에는 단정밀도로 충분, 내부 계산은 float64)
+OUTPUT_DTYPE = np.float32
+
+# 출력 배열 행 인덱스 (OBV는 누적값 정밀도를 위해 별도 float64 배열)
+RSI = 0
+MACD = 1
+MACD_SIGNAL = 2
+MACD_HIST = 3
+BB_UPPER = 4
+BB_MIDDLE = 5
+BB_LOWER = 6
+ATR = 7
+SLOWK = 8
+SLOWD = 9
+WILLR = 10
+VWAP = 11
+SMA_BASE = 12
+EMA_BASE = SMA_BASE + len(MA_PERIODS)
+N_OUTPUTS = EMA_BASE + len(MA_PERIODS)
+
+
+@njit(cache=True, fastmath=True)
+def _smas_emas(close, out):
+    """SMA/EMA 전체 기간 단일 패스 계산
+
+    out은 (2 * len(MA_PERIODS), n) 배열로 앞쪽 행에 SMA, 뒤쪽 행에 EMA를 기록한다.
+    SMA는 이동 합계, EMA는 첫 period개 SMA로 시드한 재귀식(talib과 동일)을 사용하며
+    모든 기간이 같은 종가 읽기를 공유한다. 워밍업 구간은 NaN으로 채운다.
+    """
+    n = close.shape[0]
+    n_ma = len(MA_PERIODS)
+    ma_sum = np.zeros(n_ma)
+    ema = np.zeros(n_ma)
+    for i in range(n):
+        c = close[i]
+        for j in range(n_ma):
+            p = MA_PERIODS[j]
+            ma_sum[j] += c
+            if i >= p:
+                ma_sum[j] -= close[i - p]
+            if i < p - 1:
+                out[j, i] = np.nan
+                out[n_ma + j, i] = np.nan
+                continue
+            if i == p - 1:
+                ema[j] = ma_sum[j] / p
+            else:
+                ema[j] += (c - ema[j]) * (2.0 / (p + 1))
+            out[j, i] = ma_sum[j] / p
+            out[n_ma + j, i] = ema[j]
+    return out
+
+
+@njit(cache=True)
+def _all_indicators(close, high, low, volume, rsi_p, macd_f, macd_s, macd_sig,
+                    bb_p, bb_std, atr_p, stoch_k, stoch_d):
+    """전체 지표 단일 패스 계산
+
+    Returns:
+        ((N_OUTPUTS, n) OUTPUT_DTYPE 배열 (행 순서는 모듈 상수 참조), (n,) float64 OBV 배열)
+    """
+    n = close.shape[0]
+    out = np.full((N_OUTPUTS, n), np.nan, dtype=OUTPUT_DTYPE)
+    obv_out = np.empty(n)
+    _write_all_indicators(close, high, low, volume, rsi_p, macd_f, macd_s, macd_sig,
+                          bb_p, bb_std, atr_p, stoch_k, stoch_d, out, obv_out)
+    return out, obv_out
+
+
+@njit(cache=True, parallel=True)
+def _all_indicators_batch(close_2d, high_2d, low_2d, volume_2d, rsi_p, macd_f, macd_s, macd_sig,
+                          bb_p, bb_std, atr_p, stoch_k, stoch_d):
+    """여러 심볼 전체 지표 병렬 계산 (0축이 심볼인 같은 길이의 2차원 입력)
+
+    Returns:
+        ((n_symbols, N_OUTPUTS, n) OUTPUT_DTYPE 배열, (n_symbols, n) float64 OBV 배열)
+    """
+    n_symbols, n = close_2d.shape
+    out = np.full((n_symbols, N_OUTPUTS, n), np.nan, dtype=OUTPUT_DTYPE)
+    obv_out = np.empty((n_symbols, n))
+    for s in prange(n_symbols):
+        _write_all_indicators(close_2d[s], high_2d[s], low_2d[s], volume_2d[s], rsi_p, macd_f, macd_s,
+                              macd_sig, bb_p, bb_std, atr_p, stoch_k, stoch_d, out[s], obv_out[s])
+    return out, obv_out
+
+
+@njit(cache=True)
+def _write_all_indicators(close, high, low, volume, rsi_p, macd_f, macd_s, macd_sig,
+                          bb_p, bb_std, atr_p, stoch_k, stoch_d, out, obv_out):
+    """전체 지표 단일 패스 계산 결과를 NaN으로 초기화된 out과 obv_out에 기록
+
+    OHLCV 배열을 한 번만 순회하며 RSI/ATR(Wilder 평활), MACD(지수 평활),
+    볼린저 밴드(이동 Welford 평균/분산), 스토캐스틱/Williams %R, OBV/VWAP를
+    함께 계산한다. 이동평균 행은 _smas_emas가 채운다.
+    워밍업 구간은 talib과 동일하게 NaN으로 남긴다. 상태는 모두 float64로 유지하고
+    out에는 기록만 하므로 out이 단정밀도여도 오차가 누적되지 않는다.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+
+    # 이동평균 (SMA/EMA 8개 행을 한 번에 기록)
+    _smas_emas(close, out[SMA_BASE:EMA_BASE + len(MA_PERIODS)])
+
+    # MACD 상태 (talib과 동일하게 빠른 EMA도 느린 EMA 워밍업 끝에서 시작)
+    if macd_s < macd_f:
+        macd_f, macd_s = macd_s, macd_f
+    k_fast = 2.0 / (macd_f + 1)
+    k_slow = 2.0 / (macd_s + 1)
+    k_sig = 2.0 / (macd_sig + 1)
+    macd_start = macd_s - 1
+    macd_out = macd_start + macd_sig - 1
+    fast_sum = 0.0
+    slow_sum = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    sig_sum = 0.0
+    signal = 0.0
+
+    # RSI/ATR 상태
+    avg_gain = 0.0
+    avg_loss = 0.0
+    tr_sum = 0.0
+    atr = 0.0
+
+    # 볼린저 밴드 상태
+    bb_mean = 0.0
+    bb_m2 = 0.0
+
+    # 스토캐스틱 상태
+    fastk = np.empty(n)
+    slowk_values = np.empty(n)
+    fastk_sum = 0.0
+    slowk_sum = 0.0
+    stoch_out = stoch_k + 2 * stoch_d - 3
+
+    # 거래량 상태
+    obv = volume[0]
+    pv_cum = 0.0
+    v_cum = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # MACD
+        fast_sum += c
+        if i >= macd_f:
+            fast_sum -= close[i - macd_f]
+        slow_sum += c
+        if i >= macd_s:
+            slow_sum -= close[i - macd_s]
+        if i == macd_start:
+            ema_fast = fast_sum / macd_f
+            ema_slow = slow_sum / macd_s
+        elif i > macd_start:
+            ema_fast += (c - ema_fast) * k_fast
+            ema_slow += (c - ema_slow) * k_slow
+        if i >= macd_start:
+            macd = ema_fast - ema_slow
+            if i < macd_out:
+                sig_sum += macd
+            else:
+                if i == macd_out:
+                    signal = (sig_sum + macd) / macd_sig
+                else:
+                    signal += (macd - signal) * k_sig
+                out[MACD, i] = macd
+                out[MACD_SIGNAL, i] = signal
+                out[MACD_HIST, i] = macd - signal
+
+        # 볼린저 밴드 (이동 윈도우 Welford)
+        if i < bb_p:
+            delta = c - bb_mean
+            bb_mean += delta / (i + 1)
+            bb_m2 += delta * (c - bb_mean)
+        else:
+            old = close[i - bb_p]
+            prev_mean = bb_mean
+            bb_mean += (c - old) / bb_p
+            bb_m2 += (c - old) * (c - bb_mean + old - prev_mean)
+        if i >= bb_p - 1:
+            variance = bb_m2 / bb_p
+            band = bb_std * np.sqrt(variance) if variance > 0.0 else 0.0
+            out[BB_MIDDLE, i] = bb_mean
+            out[BB_UPPER, i] = bb_mean + band
+            out[BB_LOWER, i] = bb_mean - band
+
+        if i > 0:
+            prev_close = close[i - 1]
+
+            # RSI (Wilder 평활)
+            change = c - prev_close
+            gain = change if change > 0.0 else 0.0
+            loss = -change if change < 0.0 else 0.0
+            if i <= rsi_p:
+                avg_gain += gain
+                avg_loss += loss
+                if i == rsi_p:
+                    avg_gain /= rsi_p
+                    avg_loss /= rsi_p
+            else:
+                avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+                avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+            if i >= rsi_p:
+                total = avg_gain + avg_loss
+                out[RSI, i] = 100.0 * avg_gain / total if total != 0.0 else 0.0
+
+            # ATR (Wilder 평활)
+            tr = high[i] - low[i]
+            tr_high = abs(high[i] - prev_close)
+            tr_low = abs(low[i] - prev_close)
+            if tr_high > tr:
+                tr = tr_high
+            if tr_low > tr:
+                tr = tr_low
+            if i <= atr_p:
+                tr_sum += tr
+                if i == atr_p:
+                    atr = tr_sum / atr_p
+                    out[ATR, i] = atr
+            else:
+                atr = (atr * (atr_p - 1) + tr) / atr_p
+                out[ATR, i] = atr
+
+            # OBV
+            if c > prev_close:
+                obv += volume[i]
+            elif c < prev_close:
+                obv -= volume[i]
+        obv_out[i] = obv
+
+        # VWAP
+        pv_cum += c * volume[i]
+        v_cum += volume[i]
+        out[VWAP, i] = c if v_cum == 0.0 else pv_cum / v_cum
+
+        # 스토캐스틱 / Williams %R (최고가/최저가 윈도우 공유)
+        if i >= stoch_k - 1:
+            highest = high[i]
+            lowest = low[i]
+            for j in range(i - stoch_k + 1, i):
+                if high[j] > highest:
+                    highest = high[j]
+                if low[j] < lowest:
+                    lowest = low[j]
+            price_range = highest - lowest
+            if price_range != 0.0:
+                fastk[i] = 100.0 * (c - lowest) / price_range
+                out[WILLR, i] = -100.0 * (highest - c) / price_range
+            else:
+                fastk[i] = 0.0
+                out[WILLR, i] = 0.0
+
+            fastk_sum += fastk[i]
+            if i >= stoch_k - 1 + stoch_d:
+                fastk_sum -= fastk[i - stoch_d]
+            if i >= stoch_k + stoch_d - 2:
+                slowk = fastk_sum / stoch_d
+                slowk_values[i] = slowk
+                out[SLOWK, i] = slowk
+                slowk_sum += slowk
+                if i > stoch_out:
+                    slowk_sum -= slowk_values[i - stoch_d]
+                if i >= stoch_out:
+                    out[SLOWD, i] = slowk_sum / stoch_d
+
+    # 스토캐스틱 출력 시작 이전의 slowK는 talib과 동일하게 NaN 처리
+    out[SLOWK, :min(stoch_out, n)] = np.nan
+
+
+@njit(cache=True)
+def _rsi_wilder(close, period, out):
+    """Wilder 평활 RSI 계산
+
+    talib.RSI와 동일한 재귀식을 사용하며, 워밍업 구간(index < period)은
+    중립값 50으로 채워 별도의 fillna 패스가 필요 없도록 한다.
+    """
+    n = close.shape[0]
+    limit = period if period < n else n
+    for i in range(limit):
+        out[i] = 50.0
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = close[i] - close[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            change = close[i] - close[i - 1]
+            gain = change if change > 0.0 else 0.0
+            loss = -change if change < 0.0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        total = avg_gain + avg_loss
+        out[i] = 100.0 * avg_gain / total if total != 0.0 else 0.0
+    return out
+
+
+@njit(cache=True)
+def _obv_vwap(close, volume, obv_out, vwap_out):
+    """OBV와 VWAP 단일 패스 계산
+
+    누적 거래량이 0인 구간의 VWAP는 해당 시점 종가로 채운다.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+    obv = volume[0]
+    pv_cum = 0.0
+    v_cum = 0.0
+    for i in range(n):
+        c = close[i]
+        v = volume[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            if c > prev_close:
+                obv += v
+            elif c < prev_close:
+                obv -= v
+        obv_out[i] = obv
+        pv_cum += c * v
+        v_cum += v
+        vwap_out[i] = c if v_cum == 0.0 else pv_cum / v_cum
+
+
+@njit(cache=True)
+def _ema_step(count, value, price, period):
+    """EMA 상태 1스텝 갱신 (count < period 동안 value는 누적합)"""
+    if count < period:
+        value += price
+        count += 1
+        if count == period:
+            value /= period
+    else:
+        value += (price - value) * (2.0 / (period + 1))
+        count += 1
+    return count, value
+
+
+@njit(cache=True)
+def _ema_state(prices, period, count, value):
+    """EMA 상태를 가격 배열만큼 진행"""
+    for i in range(prices.shape[0]):
+        count, value = _ema_step(count, value, prices[i], period)
+    return count, value
+
+
+@njit(cache=True)
+def _rsi_step(count, prev_close, avg_gain, avg_loss, price, period):
+    """Wilder RSI 상태 1스텝 갱신 (count는 지금까지 반영한 가격 수)"""
+    if count > 0:
+        change = price - prev_close
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if count <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if count == period:
+                avg_gain /= period
+                avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    return count + 1, price, avg_gain, avg_loss
+
+
+@njit(cache=True)
+def _rsi_state(prices, period, count, prev_close, avg_gain, avg_loss):
+    """Wilder RSI 상태를 가격 배열만큼 진행"""
+    for i in range(prices.shape[0]):
+        count, prev_close, avg_gain, avg_loss = _rsi_step(
+            count, prev_close, avg_gain, avg_loss, prices[i], period
+        )
+    return count, prev_close, avg_gain, avg_loss
+
+
+@njit(cache=True)
+def _macd_state(prices, fast, slow, signal, counts, values):
+    """MACD 상태를 가격 배열만큼 진행 (counts/values는 [fast, slow, signal] 순서, 제자리 갱신)"""
+    for i in range(prices.shape[0]):
+        price = prices[i]
+        counts[0], values[0] = _ema_step(counts[0], values[0], price, fast)
+        counts[1], values[1] = _ema_step(counts[1], values[1], price, slow)
+        if counts[1] >= slow:
+            counts[2], values[2] = _ema_step(counts[2], values[2], values[0] - values[1], signal)
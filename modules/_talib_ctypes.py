@@ -0,0 +1,201 @@
+"""
+TA-Lib C 라이브러리 ctypes 바인딩 모듈
+
+numba 미설치 환경에서는 _ta_kernels의 커널이 순수 파이썬 루프로 실행되므로
+대신 TA-Lib 공유 라이브러리의 함수를 직접 호출한다. talib 파이썬 래퍼의 호출당
+인자 검사/배열 변환을 거치지 않고 결과를 호출자가 준 배열에 바로 기록한다.
+"""
+import ctypes
+import ctypes.util
+import glob
+import os
+from typing import Optional
+import numpy as np
+from ._ta_kernels import (
+    MA_PERIODS, RSI, MACD, MACD_SIGNAL, MACD_HIST, BB_UPPER, BB_MIDDLE, BB_LOWER,
+    ATR, SLOWK, SLOWD, WILLR, VWAP, SMA_BASE, EMA_BASE, N_OUTPUTS, OUTPUT_DTYPE
+)
+
+
+_INT = ctypes.c_int
+_DOUBLE = ctypes.c_double
+_PTR = ctypes.c_void_p
+_INT_PTR = ctypes.POINTER(ctypes.c_int)
+
+# 공통 인자: (startIdx, endIdx) ... (outBegIdx, outNBElement)
+_RANGE = [_INT, _INT]
+_OUT_RANGE = [_INT_PTR, _INT_PTR]
+
+# 함수명 -> 입력 배열/옵션 인자 뒤의 argtypes
+_SIGNATURES = {
+    'TA_RSI': [_PTR, _INT] + _OUT_RANGE + [_PTR],
+    'TA_SMA': [_PTR, _INT] + _OUT_RANGE + [_PTR],
+    'TA_EMA': [_PTR, _INT] + _OUT_RANGE + [_PTR],
+    'TA_MACD': [_PTR, _INT, _INT, _INT] + _OUT_RANGE + [_PTR] * 3,
+    'TA_BBANDS': [_PTR, _INT, _DOUBLE, _DOUBLE, _INT] + _OUT_RANGE + [_PTR] * 3,
+    'TA_ATR': [_PTR] * 3 + [_INT] + _OUT_RANGE + [_PTR],
+    'TA_STOCH': [_PTR] * 3 + [_INT] * 5 + _OUT_RANGE + [_PTR] * 2,
+    'TA_WILLR': [_PTR] * 3 + [_INT] + _OUT_RANGE + [_PTR],
+    'TA_OBV': [_PTR, _PTR] + _OUT_RANGE + [_PTR],
+}
+
+
+def _find_library() -> Optional[str]:
+    """TA-Lib 공유 라이브러리 경로 탐색 (시스템 설치 -> talib 휠 동봉 라이브러리)"""
+    for name in ('ta-lib', 'ta_lib'):
+        path = ctypes.util.find_library(name)
+        if path:
+            return path
+    try:
+        import talib
+    except ImportError:
+        return None
+    site_dir = os.path.dirname(os.path.dirname(talib.__file__))
+    candidates = sorted(glob.glob(os.path.join(site_dir, 'ta_lib.libs', 'libta*lib*.so*')))
+    return candidates[0] if candidates else None
+
+
+def _load_library() -> Optional[ctypes.CDLL]:
+    """라이브러리 로드 및 함수 시그니처 1회 설정 (실패 시 None)"""
+    path = _find_library()
+    if path is None:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+        if lib.TA_Initialize() != 0:
+            return None
+        for name, argtypes in _SIGNATURES.items():
+            func = getattr(lib, name)
+            func.argtypes = _RANGE + argtypes
+            func.restype = _INT
+    except (OSError, AttributeError):
+        return None
+    return lib
+
+
+_lib = _load_library()
+TALIB_CTYPES_AVAILABLE = _lib is not None
+
+
+def _call(name, n, inputs, params, outputs):
+    """TA-Lib 함수 호출 후 결과를 talib과 같이 outBegIdx 위치로 정렬 (앞부분은 NaN)"""
+    if n == 0:
+        return
+    beg = _INT(0)
+    count = _INT(0)
+    ret_code = getattr(_lib, name)(
+        0, n - 1, *[array.ctypes.data for array in inputs], *params,
+        ctypes.byref(beg), ctypes.byref(count), *[out.ctypes.data for out in outputs]
+    )
+    if ret_code != 0:
+        raise RuntimeError(f"{name} 호출 실패: {ret_code}")
+    start = beg.value
+    end = start + count.value
+    for out in outputs:
+        out[start:end] = out[:count.value].copy()
+        out[:start] = np.nan
+        out[end:] = np.nan
+
+
+def rsi_ctypes(close, period, out):
+    """RSI 계산 (워밍업 구간 NaN)"""
+    _call('TA_RSI', close.shape[0], (close,), (period,), (out,))
+    return out
+
+
+def rsi_wilder_ctypes(close, period, out):
+    """_ta_kernels._rsi_wilder 대체 (워밍업 구간을 중립값 50으로 채움)"""
+    rsi_ctypes(close, period, out)
+    np.nan_to_num(out, copy=False, nan=50.0)
+    return out
+
+
+def sma_ctypes(close, period, out):
+    """단순이동평균 계산"""
+    _call('TA_SMA', close.shape[0], (close,), (period,), (out,))
+    return out
+
+
+def ema_ctypes(close, period, out):
+    """지수이동평균 계산"""
+    _call('TA_EMA', close.shape[0], (close,), (period,), (out,))
+    return out
+
+
+def macd_ctypes(close, fast, slow, signal, macd_out, signal_out, hist_out):
+    """MACD 계산"""
+    _call('TA_MACD', close.shape[0], (close,), (fast, slow, signal), (macd_out, signal_out, hist_out))
+
+
+def bbands_ctypes(close, period, stddev, upper_out, middle_out, lower_out):
+    """볼린저 밴드 계산 (단순이동평균 기준)"""
+    _call('TA_BBANDS', close.shape[0], (close,), (period, stddev, stddev, 0), (upper_out, middle_out, lower_out))
+
+
+def atr_ctypes(high, low, close, period, out):
+    """ATR 계산"""
+    _call('TA_ATR', close.shape[0], (high, low, close), (period,), (out,))
+    return out
+
+
+def stoch_ctypes(high, low, close, fastk_period, slow_period, slowk_out, slowd_out):
+    """슬로우 스토캐스틱 계산 (%K/%D 모두 단순이동평균)"""
+    _call('TA_STOCH', close.shape[0], (high, low, close),
+          (fastk_period, slow_period, 0, slow_period, 0), (slowk_out, slowd_out))
+
+
+def willr_ctypes(high, low, close, period, out):
+    """Williams %R 계산"""
+    _call('TA_WILLR', close.shape[0], (high, low, close), (period,), (out,))
+    return out
+
+
+def obv_ctypes(close, volume, out):
+    """OBV 계산"""
+    _call('TA_OBV', close.shape[0], (close, volume), (), (out,))
+    return out
+
+
+def all_indicators_ctypes(close, high, low, volume, rsi_p, macd_f, macd_s, macd_sig,
+                          bb_p, bb_std, atr_p, stoch_k, stoch_d):
+    """_ta_kernels._all_indicators 대체 (같은 인자, 같은 반환 형식)
+
+    TA-Lib은 double 배열에만 기록하므로 float64로 계산한 뒤 출력 dtype으로 한 번 변환한다.
+    """
+    n = close.shape[0]
+    out = np.full((N_OUTPUTS, n), np.nan)
+    obv = np.empty(n)
+    if n == 0:
+        return out.astype(OUTPUT_DTYPE), obv
+
+    for j, period in enumerate(MA_PERIODS):
+        sma_ctypes(close, period, out[SMA_BASE + j])
+        ema_ctypes(close, period, out[EMA_BASE + j])
+
+    rsi_ctypes(close, rsi_p, out[RSI])
+    macd_ctypes(close, macd_f, macd_s, macd_sig, out[MACD], out[MACD_SIGNAL], out[MACD_HIST])
+    bbands_ctypes(close, bb_p, bb_std, out[BB_UPPER], out[BB_MIDDLE], out[BB_LOWER])
+    atr_ctypes(high, low, close, atr_p, out[ATR])
+    stoch_ctypes(high, low, close, stoch_k, stoch_d, out[SLOWK], out[SLOWD])
+    willr_ctypes(high, low, close, stoch_k, out[WILLR])
+    obv_ctypes(close, volume, obv)
+
+    # VWAP (누적 거래량이 0인 구간은 종가)
+    pv_cum = np.cumsum(close * volume)
+    v_cum = np.cumsum(volume)
+    vwap = out[VWAP]
+    vwap[:] = close
+    np.divide(pv_cum, v_cum, out=vwap, where=v_cum != 0.0)
+    return out.astype(OUTPUT_DTYPE), obv
+
+
+def all_indicators_batch_ctypes(close_2d, high_2d, low_2d, volume_2d, rsi_p, macd_f, macd_s, macd_sig,
+                                bb_p, bb_std, atr_p, stoch_k, stoch_d):
+    """_ta_kernels._all_indicators_batch 대체 (심볼별 순차 호출)"""
+    n_symbols, n = close_2d.shape
+    out = np.empty((n_symbols, N_OUTPUTS, n), dtype=OUTPUT_DTYPE)
+    obv = np.empty((n_symbols, n))
+    for s in range(n_symbols):
+        out[s], obv[s] = all_indicators_ctypes(close_2d[s], high_2d[s], low_2d[s], volume_2d[s], rsi_p, macd_f,
+                                               macd_s, macd_sig, bb_p, bb_std, atr_p, stoch_k, stoch_d)
+    return out, obv
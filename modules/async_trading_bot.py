@@ -45,6 +45,9 @@ class AsyncTradingBot:
         self.market_data_cache = {}
         self.cache_ttl = 60  # 캐시 유효 시간 (초)
         
+        # 사이클 단위 티커 (거래소 유형 -> 심볼 -> 티커)
+        self._cycle_tickers: Dict[str, Dict[str, Any]] = {}
+        
         self.logger.info("비동기 트레이딩 봇 초기화 완료")
     
     def _initialize_components(self):
@@ -136,8 +139,25 @@ class AsyncTradingBot:
             self.logger.error(f"비동기 시장 데이터 수집 실패 ({symbol}): {e}")
             return {}
     
+    async def _prefetch_tickers_async(self, symbols: List[str]):
+        """현물/선물 티커 일괄 조회 (거래소별 1회 호출을 병렬 실행)"""
+        spot_tickers, futures_tickers = await asyncio.gather(
+            self.exchange.get_tickers_async(symbols, 'spot'),
+            self.exchange.get_tickers_async(symbols, 'future'),
+            return_exceptions=True
+        )
+        
+        self._cycle_tickers = {
+            'spot': spot_tickers if isinstance(spot_tickers, dict) else {},
+            'future': futures_tickers if isinstance(futures_tickers, dict) else {}
+        }
+    
     async def _fetch_ticker_async(self, symbol: str, exchange_type: str) -> Dict[str, Any]:
         """비동기 티커 데이터 수집"""
+        ticker = self._cycle_tickers.get(exchange_type, {}).get(symbol)
+        if ticker:
+            return ticker
+        
         return await asyncio.get_event_loop().run_in_executor(
             None, self.exchange.get_ticker, symbol, exchange_type
         )
@@ -208,6 +228,9 @@ class AsyncTradingBot:
     async def process_symbols_async(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """여러 심볼을 비동기로 병렬 처리"""
         try:
+            # 티커 일괄 조회 (심볼별 개별 조회 대체)
+            await self._prefetch_tickers_async(symbols)
+            
             # 시장 데이터 수집 (병렬)
             market_data_tasks = [
                 self.fetch_market_data_async(symbol) for symbol in symbols
@@ -1,9 +1,12 @@
 """
 거래소 인터페이스 모듈
 """
+import asyncio
 import ccxt
+import numpy as np
 import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 from utils.logger import logger
 from utils.decorators import retry_on_network_error, rate_limit, log_execution_time
@@ -12,6 +15,9 @@ from utils.decorators import retry_on_network_error, rate_limit, log_execution_t
 class ExchangeInterface:
     """거래소 인터페이스 클래스"""
     
+    # ccxt fetch_ohlcv 행 순서
+    OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.spot_exchange = None
@@ -147,16 +153,7 @@ class ExchangeInterface:
                 return {}
             
             ticker = exchange.fetch_ticker(symbol)
-            return {
-                'symbol': symbol,
-                'last': ticker['last'],
-                'bid': ticker['bid'],
-                'ask': ticker['ask'],
-                'volume': ticker['baseVolume'],
-                'change': ticker['change'],
-                'percentage': ticker['percentage'],
-                'timestamp': ticker['timestamp']
-            }
+            return self._format_ticker(symbol, ticker)
         except ccxt.BadSymbol as e:
             logger.warning(f"잘못된 심볼: {symbol} ({exchange_type}) - {e}")
             return {}
@@ -164,6 +161,56 @@ class ExchangeInterface:
             logger.error(f"가격 정보 조회 실패 ({symbol}): {e}")
             return {}
     
+    @retry_on_network_error(max_retries=3)
+    @rate_limit(calls_per_second=1.0)
+    def get_tickers(self, symbols: List[str], exchange_type: str = 'spot') -> Dict[str, Dict[str, Any]]:
+        """여러 심볼 가격 정보 일괄 조회"""
+        try:
+            exchange = self.spot_exchange if exchange_type == 'spot' else self.futures_exchange
+            
+            # 심볼 유효성 검사
+            available_symbols = [s for s in symbols if self._is_symbol_available(s, exchange_type)]
+            if not available_symbols:
+                return {}
+            
+            # 일괄 조회 미지원 거래소는 심볼별 조회를 병렬 실행
+            if not exchange.has.get('fetchTickers'):
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = executor.map(exchange.fetch_ticker, available_symbols)
+                    return {
+                        symbol: self._format_ticker(symbol, ticker)
+                        for symbol, ticker in zip(available_symbols, results)
+                    }
+            
+            requested = set(available_symbols)
+            tickers = exchange.fetch_tickers(available_symbols)
+            return {
+                symbol: self._format_ticker(symbol, ticker)
+                for symbol, ticker in tickers.items()
+                if symbol in requested
+            }
+        except Exception as e:
+            logger.error(f"가격 정보 일괄 조회 실패: {e}")
+            return {}
+    
+    async def get_tickers_async(self, symbols: List[str], exchange_type: str = 'spot') -> Dict[str, Dict[str, Any]]:
+        """여러 심볼 가격 정보 일괄 조회 (이벤트 루프 비차단)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_tickers, symbols, exchange_type)
+    
+    def _format_ticker(self, symbol: str, ticker: Dict[str, Any]) -> Dict[str, Any]:
+        """ccxt 티커를 내부 형식으로 변환"""
+        return {
+            'symbol': symbol,
+            'last': ticker['last'],
+            'bid': ticker['bid'],
+            'ask': ticker['ask'],
+            'volume': ticker['baseVolume'],
+            'change': ticker['change'],
+            'percentage': ticker['percentage'],
+            'timestamp': ticker['timestamp']
+        }
+    
     @retry_on_network_error(max_retries=3)
     @rate_limit(calls_per_second=0.5)
     def get_orderbook(self, symbol: str, limit: int = 100, exchange_type: str = 'spot') -> Dict[str, Any]:
@@ -181,35 +228,63 @@ class ExchangeInterface:
             logger.error(f"호가창 조회 실패 ({symbol}): {e}")
             return {}
     
-    @retry_on_network_error(max_retries=3)
-    @rate_limit(calls_per_second=0.2)
     def get_ohlcv(self, symbol: str, timeframe: str = '1h', limit: int = 500, exchange_type: str = 'spot') -> pd.DataFrame:
         """캔들 데이터 조회"""
+        return self.ohlcv_to_dataframe(self.get_ohlcv_arrays(symbol, timeframe, limit, exchange_type))
+    
+    @retry_on_network_error(max_retries=3)
+    @rate_limit(calls_per_second=0.2)
+    def get_ohlcv_arrays(self, symbol: str, timeframe: str = '1h', limit: int = 500,
+                         exchange_type: str = 'spot') -> Dict[str, np.ndarray]:
+        """캔들 데이터 조회 (컬럼별 NumPy 배열, timestamp는 ms 단위 int64)"""
         try:
             exchange = self.spot_exchange if exchange_type == 'spot' else self.futures_exchange
             
             # 심볼 유효성 검사
             if not self._is_symbol_available(symbol, exchange_type):
                 logger.warning(f"심볼이 존재하지 않음: {symbol} ({exchange_type})")
-                return pd.DataFrame()
+                return {}
             
             ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
             
             if not ohlcv:
                 logger.warning(f"OHLCV 데이터가 비어있음: {symbol}")
-                return pd.DataFrame()
+                return {}
             
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            data = np.asarray(ohlcv, dtype=np.float64)
+            arrays = {column: data[:, i] for i, column in enumerate(self.OHLCV_COLUMNS)}
+            arrays['timestamp'] = arrays['timestamp'].astype(np.int64)
             
-            return df
+            return arrays
         except ccxt.BadSymbol as e:
             logger.warning(f"잘못된 심볼: {symbol} ({exchange_type}) - {e}")
-            return pd.DataFrame()
+            return {}
         except Exception as e:
             logger.error(f"캔들 데이터 조회 실패 ({symbol}): {e}")
+            return {}
+    
+    @staticmethod
+    def ohlcv_to_dataframe(arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """컬럼별 캔들 배열을 timestamp 인덱스 DataFrame으로 변환"""
+        if not arrays:
             return pd.DataFrame()
+        
+        df = pd.DataFrame({column: arrays[column] for column in ExchangeInterface.OHLCV_COLUMNS[1:]},
+                          index=pd.to_datetime(arrays['timestamp'], unit='ms'))
+        df.index.name = 'timestamp'
+        return df
+    
+    async def get_ohlcv_async(self, symbol: str, timeframe: str = '1h', limit: int = 500,
+                              exchange_type: str = 'spot') -> pd.DataFrame:
+        """캔들 데이터 조회 (이벤트 루프 비차단)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_ohlcv, symbol, timeframe, limit, exchange_type)
+    
+    async def get_ohlcv_arrays_async(self, symbol: str, timeframe: str = '1h', limit: int = 500,
+                                     exchange_type: str = 'spot') -> Dict[str, np.ndarray]:
+        """컬럼별 캔들 배열 조회 (이벤트 루프 비차단)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_ohlcv_arrays, symbol, timeframe, limit, exchange_type)
     
     @retry_on_network_error(max_retries=3)
     @rate_limit(calls_per_second=0.5)
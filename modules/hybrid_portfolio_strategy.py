@@ -3,16 +3,10 @@
 현물 + 선물 하이브리드 포트폴리오 전략
 """
 
-import sys
-import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 import pandas as pd
-
-# 프로젝트 루트를 Python 경로에 추가
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils import logger
 
 
@@ -0,0 +1,158 @@
+"""
+상태형(증분) 기술적 지표 모듈
+
+라이브 사이클마다 전체 이력을 다시 계산하지 않고 마지막 상태에 새 캔들만 반영한다.
+warmup()은 가격 배열 전체를 커널로 진행하고, update()는 가격 1개를 확정 반영하며,
+peek()는 상태를 바꾸지 않고 진행 중인 캔들 가격으로 지표 값을 계산한다.
+"""
+from collections import deque
+from typing import Tuple
+import numpy as np
+from ._ta_kernels import _ema_step, _ema_state, _rsi_step, _rsi_state, _macd_state
+
+
+class IncrementalEMA:
+    """지수이동평균 상태 (talib.EMA와 동일하게 첫 period개 SMA로 시드)"""
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self.value = 0.0
+    
+    def _current(self, count: int, value: float) -> float:
+        return value if count >= self.period else np.nan
+    
+    def warmup(self, prices: np.ndarray) -> float:
+        """가격 배열만큼 상태 진행"""
+        self.count, self.value = _ema_state(prices, self.period, self.count, self.value)
+        return self._current(self.count, self.value)
+    
+    def update(self, price: float) -> float:
+        """가격 1개 확정 반영"""
+        self.count, self.value = _ema_step(self.count, self.value, price, self.period)
+        return self._current(self.count, self.value)
+    
+    def peek(self, price: float) -> float:
+        """상태 변경 없이 가격 반영 시 값 계산"""
+        return self._current(*_ema_step(self.count, self.value, price, self.period))
+
+
+class IncrementalRSI:
+    """Wilder RSI 상태 (워밍업 전에는 중립값 50 반환)"""
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._state = (0, 0.0, 0.0, 0.0)  # (가격 수, 직전 종가, 평균 상승폭, 평균 하락폭)
+    
+    def _current(self, state: tuple) -> float:
+        count, _, avg_gain, avg_loss = state
+        if count <= self.period:
+            return 50.0
+        total = avg_gain + avg_loss
+        return 100.0 * avg_gain / total if total != 0.0 else 0.0
+    
+    def warmup(self, prices: np.ndarray) -> float:
+        """가격 배열만큼 상태 진행"""
+        self._state = _rsi_state(prices, self.period, *self._state)
+        return self._current(self._state)
+    
+    def update(self, price: float) -> float:
+        """가격 1개 확정 반영"""
+        self._state = _rsi_step(*self._state, price, self.period)
+        return self._current(self._state)
+    
+    def peek(self, price: float) -> float:
+        """상태 변경 없이 가격 반영 시 값 계산"""
+        return self._current(_rsi_step(*self._state, price, self.period))
+
+
+class IncrementalMACD:
+    """MACD 상태 (빠른/느린 EMA와 시그널 EMA)
+    
+    빠른 EMA는 자체 SMA로 시드하므로 talib.MACD와는 워밍업 직후 값이 소폭 다르며
+    캔들이 쌓일수록 수렴한다.
+    """
+    
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._counts = np.zeros(3, dtype=np.int64)
+        self._values = np.zeros(3)
+    
+    def _current(self, counts: np.ndarray, values: np.ndarray) -> Tuple[float, float, float]:
+        if counts[2] < self.signal:
+            return np.nan, np.nan, np.nan
+        macd = values[0] - values[1]
+        return macd, values[2], macd - values[2]
+    
+    def warmup(self, prices: np.ndarray) -> Tuple[float, float, float]:
+        """가격 배열만큼 상태 진행"""
+        _macd_state(prices, self.fast, self.slow, self.signal, self._counts, self._values)
+        return self._current(self._counts, self._values)
+    
+    def update(self, price: float) -> Tuple[float, float, float]:
+        """가격 1개 확정 반영"""
+        return self.warmup(np.array([price], dtype=np.float64))
+    
+    def peek(self, price: float) -> Tuple[float, float, float]:
+        """상태 변경 없이 가격 반영 시 값 계산"""
+        counts = self._counts.copy()
+        values = self._values.copy()
+        _macd_state(np.array([price], dtype=np.float64), self.fast, self.slow, self.signal, counts, values)
+        return self._current(counts, values)
+
+
+class IncrementalBB:
+    """볼린저 밴드 상태 (최근 period개 가격 링 버퍼 + 이동 평균/분산)"""
+    
+    def __init__(self, period: int = 20, stddev: float = 2.0):
+        self.period = period
+        self.stddev = stddev
+        self._window = deque(maxlen=period)
+        self._mean = 0.0
+        self._m2 = 0.0
+    
+    def _advance(self, price: float) -> Tuple[float, float]:
+        """가격 반영 후 (평균, 제곱편차합) 계산 (윈도우는 변경하지 않음)"""
+        window = self._window
+        if len(window) < self.period:
+            delta = price - self._mean
+            mean = self._mean + delta / (len(window) + 1)
+            return mean, self._m2 + delta * (price - mean)
+        old = window[0]
+        mean = self._mean + (price - old) / self.period
+        return mean, self._m2 + (price - old) * (price - mean + old - self._mean)
+    
+    def _current(self, count: int, mean: float, m2: float) -> Tuple[float, float, float]:
+        if count < self.period:
+            return np.nan, np.nan, np.nan
+        variance = m2 / self.period
+        band = self.stddev * np.sqrt(variance) if variance > 0.0 else 0.0
+        return mean + band, mean, mean - band
+    
+    def warmup(self, prices: np.ndarray) -> Tuple[float, float, float]:
+        """가격 배열만큼 상태 진행 (마지막 period개만 사용)"""
+        tail = np.asarray(prices, dtype=np.float64)[-self.period:]
+        if len(tail) == self.period:
+            # 윈도우 전체가 교체되므로 새로 계산
+            self._window.clear()
+            self._window.extend(tail.tolist())
+            self._mean = float(tail.mean())
+            self._m2 = float(((tail - self._mean) ** 2).sum())
+            return self._current(self.period, self._mean, self._m2)
+        result = self._current(len(self._window), self._mean, self._m2)
+        for price in tail.tolist():
+            result = self.update(price)
+        return result
+    
+    def update(self, price: float) -> Tuple[float, float, float]:
+        """가격 1개 확정 반영"""
+        self._mean, self._m2 = self._advance(price)
+        self._window.append(price)
+        return self._current(len(self._window), self._mean, self._m2)
+    
+    def peek(self, price: float) -> Tuple[float, float, float]:
+        """상태 변경 없이 가격 반영 시 값 계산"""
+        mean, m2 = self._advance(price)
+        return self._current(min(len(self._window) + 1, self.period), mean, m2)
@@ -15,7 +15,7 @@ from pathlib import Path
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import logger
+from utils import logger, dumps
 from config import config
 
 
@@ -545,8 +545,7 @@ class WebDashboardServer:
                         self.send_response(200)
                         self.send_header('Content-type', 'application/json')
                         self.end_headers()
-                        data = json.dumps(server.dashboard.get_dashboard_data())
-                        self.wfile.write(data.encode('utf-8'))
+                        self.wfile.write(dumps(server.dashboard.get_dashboard_data()))
                     else:
                         self.send_response(404)
                         self.end_headers()
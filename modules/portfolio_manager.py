@@ -1,14 +1,18 @@
 """
 포트폴리오 관리 모듈
 """
+import time
+from collections import deque
+from itertools import islice
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Union
 from datetime import datetime, timedelta
 from utils.logger import logger
 from utils.decorators import log_execution_time, cache_result
 from .exchange_interface import ExchangeInterface
 from .risk_manager import RiskManager
+from ._perf_kernels import perf_kernel, to_value_array
 
 
 class PortfolioManager:
@@ -28,11 +32,34 @@ class PortfolioManager:
         
         # 포트폴리오 상태
         self.positions = {}
-        self.balance_history = []
-        self.trade_history = []
+        self.balance_history = deque(maxlen=config.get('balance_history_cap', 1000))
+        self.trade_history = deque(maxlen=config.get('trade_history_cap', 10000))
         self.performance_metrics = {}
+        self._last_portfolio_value: Optional[float] = None
+        
+        # 누적 체결 거래 수 (trade_history는 최대 길이/정리로 잘리므로 별도 집계)
+        self._executed_trades = 0
+        # 마지막 성과 메트릭 계산 시점의 (포트폴리오 가치, 누적 거래 수, 포지션 수)
+        self._metrics_key: Optional[Tuple[float, int, int]] = None
         self.last_rebalance = None
         
+        # 승률 카운터 (실현 손익이 확정된 거래 기준)
+        self._winning_trades = 0
+        self._total_closed_trades = 0
+        
+        # 샤프 비율 연율화 기간 수 (일별 기록 기준 252 거래일)
+        self.sharpe_periods_per_year = config.get('sharpe_periods_per_year', 252)
+        
+        # 가격 정보 캐시 (심볼 -> (조회 시각, 티커))
+        self.ticker_cache_ttl = config.get('ticker_cache_ttl', 1.0)
+        self._ticker_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # 최근 잔고 조회 결과 (요약 조회 시 재사용)
+        self.summary_cache_ttl = config.get('summary_cache_ttl', 2.0)
+        self._last_spot_balance: Dict[str, Any] = {}
+        self._last_futures_balance: Dict[str, Any] = {}
+        self._last_update: Optional[float] = None
+        
         # 수수료 설정
         self.fees = config.get('fees', {
             'spot_maker': 0.001,
@@ -42,34 +69,81 @@ class PortfolioManager:
             'slippage': 0.0005
         })
         
+        # (거래소 유형, 주문 유형) -> 슬리피지 포함 수수료율
+        slippage = self.fees['slippage']
+        self._fee_rate = {
+            ('spot', 'limit'): self.fees['spot_maker'] + slippage,
+            ('spot', 'market'): self.fees['spot_taker'] + slippage,
+            ('futures', 'limit'): self.fees['futures_maker'] + slippage,
+            ('futures', 'market'): self.fees['futures_taker'] + slippage
+        }
+        
         logger.info("포트폴리오 관리자 초기화 완료")
     
+    @property
+    def trading_symbols(self) -> List[str]:
+        """거래 심볼 목록"""
+        return self._trading_symbols
+    
+    @trading_symbols.setter
+    def trading_symbols(self, symbols: List[str]):
+        """거래 심볼 목록 설정 (조회용 집합 재구성)"""
+        self._trading_symbols = list(symbols)
+        self._symbols_set = set(self._trading_symbols)
+        self._base_symbols = {s.split('/')[0] for s in self._trading_symbols if s.endswith('/USDT')}
+    
     @log_execution_time
     def update_portfolio_state(self):
         """포트폴리오 상태 업데이트"""
         try:
+            now = datetime.now()
+            
             # 잔고 조회
             spot_balance = self.exchange.get_spot_balance()
             futures_balance = self.exchange.get_futures_balance()
             
+            self._last_spot_balance = spot_balance
+            self._last_futures_balance = futures_balance
+            self._last_update = time.monotonic()
+            
             # 포지션 조회
             futures_positions = self.exchange.get_positions()
             
+            # 거래 심볼 가격 일괄 조회 (사이클 내 중복 조회 방지)
+            self._prefetch_tickers()
+            
             # 현재 포트폴리오 가치 계산
             portfolio_value = self._calculate_portfolio_value(spot_balance, futures_balance, futures_positions)
             
             # 포트폴리오 상태 업데이트
-            self._update_positions(spot_balance, futures_positions)
-            self._update_balance_history(portfolio_value)
+            self._update_positions(spot_balance, futures_positions, now)
+            
+            # 가치가 바뀌지 않았으면 같은 값의 잔고 기록을 추가하지 않음
+            if portfolio_value != self._last_portfolio_value:
+                self._update_balance_history(portfolio_value, now)
+                self._last_portfolio_value = portfolio_value
             
             # 성과 메트릭 업데이트
-            self._update_performance_metrics(portfolio_value)
+            self._update_performance_metrics(portfolio_value, now)
             
             logger.debug(f"포트폴리오 상태 업데이트 완료: 총 가치 ${portfolio_value:.2f}")
             
         except Exception as e:
             logger.error(f"포트폴리오 상태 업데이트 실패: {e}")
     
+    def _refresh_balances(self):
+        """요약 조회용 잔고 재조회 (조회 실패 시 예외 발생)"""
+        spot_balance = self.exchange.get_spot_balance()
+        futures_balance = self.exchange.get_futures_balance()
+        
+        # 거래소 인터페이스는 조회 실패 시 빈 잔고를 반환하므로 0 잔고로 보고하지 않음
+        if not spot_balance.get('total') or not futures_balance.get('total'):
+            raise RuntimeError("잔고 조회 결과 없음")
+        
+        self._last_spot_balance = spot_balance
+        self._last_futures_balance = futures_balance
+        self._last_update = time.monotonic()
+    
     def _calculate_portfolio_value(self, spot_balance: Dict[str, Any], 
                                  futures_balance: Dict[str, Any], 
                                  futures_positions: List[Dict[str, Any]]) -> float:
@@ -79,11 +153,15 @@ class PortfolioManager:
             
             # 현물 잔고 (설정된 거래 심볼들만 처리)
             for symbol, amount in spot_balance.get('total', {}).items():
+                # 잔고가 없는 통화(더스트 포함 0 잔고)는 조회 없이 스킵
+                if not amount or amount < 0:
+                    continue
+                
                 if symbol == 'USDT':
                     total_value += amount
-                elif f"{symbol}/USDT" in self.trading_symbols:
+                elif symbol in self._base_symbols:
                     # 설정된 거래 심볼만 처리
-                    ticker = self.exchange.get_ticker(f"{symbol}/USDT", 'spot')
+                    ticker = self._get_ticker_cached(f"{symbol}/USDT")
                     if ticker.get('last'):
                         total_value += amount * ticker['last']
             
@@ -100,16 +178,58 @@ class PortfolioManager:
             logger.error(f"포트폴리오 가치 계산 실패: {e}")
             return 0.0
     
-    def _update_positions(self, spot_balance: Dict[str, Any], futures_positions: List[Dict[str, Any]]):
+    def _get_ticker_cached(self, symbol: str) -> Dict[str, Any]:
+        """현물 가격 정보 조회 (TTL 캐시 적용)"""
+        now = time.monotonic()
+        cached = self._ticker_cache.get(symbol)
+        if cached and now - cached[0] < self.ticker_cache_ttl:
+            return cached[1]
+        
+        ticker = self.exchange.get_ticker(symbol, 'spot')
+        self._ticker_cache[symbol] = (now, ticker)
+        return ticker
+    
+    def _get_tickers_cached(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 심볼 현물 가격 정보 조회 (만료/누락분만 일괄 조회)"""
+        now = time.monotonic()
+        tickers = {}
+        stale_symbols = []
+        
+        for symbol in symbols:
+            cached = self._ticker_cache.get(symbol)
+            if cached and now - cached[0] < self.ticker_cache_ttl:
+                tickers[symbol] = cached[1]
+            else:
+                stale_symbols.append(symbol)
+        
+        if stale_symbols:
+            fetched = self.exchange.get_tickers(stale_symbols, 'spot')
+            for symbol in stale_symbols:
+                ticker = fetched.get(symbol, {})
+                self._ticker_cache[symbol] = (now, ticker)
+                tickers[symbol] = ticker
+        
+        return tickers
+    
+    def _prefetch_tickers(self):
+        """거래 심볼 가격 정보 일괄 조회 후 캐시 적재"""
+        try:
+            self._get_tickers_cached(self.trading_symbols)
+        except Exception as e:
+            logger.warning(f"가격 일괄 조회 실패: {e}")
+    
+    def _update_positions(self, spot_balance: Dict[str, Any], futures_positions: List[Dict[str, Any]], 
+                          now: Optional[datetime] = None):
         """포지션 정보 업데이트"""
         try:
+            now = now or datetime.now()
             self.positions.clear()
             
             # 현물 포지션 (설정된 거래 심볼들만 처리)
             for symbol, amount in spot_balance.get('total', {}).items():
-                if amount > 0 and symbol != 'USDT' and f"{symbol}/USDT" in self.trading_symbols:
+                if amount > 0 and symbol in self._base_symbols:
                     # 설정된 거래 심볼만 처리
-                    ticker = self.exchange.get_ticker(f"{symbol}/USDT", 'spot')
+                    ticker = self._get_ticker_cached(f"{symbol}/USDT")
                     self.positions[f"{symbol}/USDT"] = {
                         'symbol': f"{symbol}/USDT",
                         'side': 'buy',
@@ -117,7 +237,7 @@ class PortfolioManager:
                         'current_price': ticker.get('last', 0),
                         'exchange_type': 'spot',
                         'unrealized_pnl': 0,
-                        'timestamp': datetime.now()
+                        'timestamp': now
                     }
             
             # 선물 포지션
@@ -129,55 +249,44 @@ class PortfolioManager:
                     'current_price': position['markPrice'],
                     'exchange_type': 'futures',
                     'unrealized_pnl': position['unrealizedPnl'],
-                    'timestamp': datetime.now()
+                    'timestamp': now
                 }
             
         except Exception as e:
             logger.error(f"포지션 업데이트 실패: {e}")
     
-    def _update_balance_history(self, portfolio_value: float):
+    def _update_balance_history(self, portfolio_value: float, now: Optional[datetime] = None):
         """잔고 기록 업데이트"""
         try:
             self.balance_history.append({
-                'timestamp': datetime.now(),
+                'timestamp': now or datetime.now(),
                 'total_value': portfolio_value,
                 'pnl': portfolio_value - self.initial_balance,
                 'pnl_pct': (portfolio_value - self.initial_balance) / self.initial_balance * 100
             })
             
-            # 기록 제한 (최근 1000개만 보관)
-            if len(self.balance_history) > 1000:
-                self.balance_history = self.balance_history[-1000:]
-                
         except Exception as e:
             logger.error(f"잔고 기록 업데이트 실패: {e}")
     
-    def _update_performance_metrics(self, portfolio_value: float):
+    def _update_performance_metrics(self, portfolio_value: float, now: Optional[datetime] = None):
         """성과 메트릭 업데이트"""
         try:
             if not self.balance_history:
                 return
             
+            # 가치/누적 거래 수/포지션 수가 직전 계산과 같으면 재계산 생략
+            metrics_key = (portfolio_value, self._executed_trades, len(self.positions))
+            if metrics_key == self._metrics_key and self.performance_metrics:
+                return
+            
             # 기본 메트릭
             total_return = (portfolio_value - self.initial_balance) / self.initial_balance
             
-            # 일일 수익률 계산
-            daily_returns = []
-            for i in range(1, len(self.balance_history)):
-                prev_value = self.balance_history[i-1]['total_value']
-                curr_value = self.balance_history[i]['total_value']
-                daily_return = (curr_value - prev_value) / prev_value
-                daily_returns.append(daily_return)
-            
-            if daily_returns:
-                avg_daily_return = np.mean(daily_returns)
-                volatility = np.std(daily_returns)
-                
-                # 샤프 비율 (무위험 수익률 0으로 가정)
-                sharpe_ratio = avg_daily_return / volatility if volatility > 0 else 0
-                
-                # 최대 드로우다운
-                max_drawdown = self._calculate_max_drawdown()
+            # 단일 패스 커널로 수익률/변동성/샤프/드로우다운 계산
+            values = to_value_array(self.balance_history)
+            
+            if len(values) > 1:
+                max_drawdown, avg_daily_return, volatility, sharpe_ratio = perf_kernel(values, self.sharpe_periods_per_year)
                 
                 # 승률 계산
                 win_rate = self._calculate_win_rate()
@@ -190,10 +299,11 @@ class PortfolioManager:
                     'sharpe_ratio': sharpe_ratio,
                     'max_drawdown': max_drawdown,
                     'win_rate': win_rate,
-                    'total_trades': len(self.trade_history),
+                    'total_trades': self._executed_trades,
                     'current_positions': len(self.positions),
-                    'last_updated': datetime.now()
+                    'last_updated': now or datetime.now()
                 }
+                self._metrics_key = metrics_key
             
         except Exception as e:
             logger.error(f"성과 메트릭 업데이트 실패: {e}")
@@ -204,16 +314,7 @@ class PortfolioManager:
             if len(self.balance_history) < 2:
                 return 0.0
             
-            values = [record['total_value'] for record in self.balance_history]
-            peak = values[0]
-            max_drawdown = 0.0
-            
-            for value in values[1:]:
-                if value > peak:
-                    peak = value
-                else:
-                    drawdown = (peak - value) / peak
-                    max_drawdown = max(max_drawdown, drawdown)
+            max_drawdown, _, _, _ = perf_kernel(to_value_array(self.balance_history))
             
             return max_drawdown
             
@@ -223,18 +324,30 @@ class PortfolioManager:
     
     def _calculate_win_rate(self) -> float:
         """승률 계산"""
-        try:
-            if not self.trade_history:
-                return 0.0
-            
-            winning_trades = sum(1 for trade in self.trade_history if trade.get('pnl', 0) > 0)
-            total_trades = len(self.trade_history)
-            
-            return winning_trades / total_trades * 100 if total_trades > 0 else 0.0
-            
-        except Exception as e:
-            logger.error(f"승률 계산 실패: {e}")
+        if self._total_closed_trades == 0:
             return 0.0
+        return self._winning_trades / self._total_closed_trades * 100
+    
+    def _calculate_realized_pnl(self, symbol: str, side: str, size: float, 
+                                price: float, fees: float) -> Optional[float]:
+        """청산 거래의 실현 손익 계산 (청산이 아니면 None)"""
+        position = self.risk_manager.positions.get(symbol)
+        if position is None or position.side == side:
+            return None
+        
+        closed_size = min(size, position.size)
+        if position.is_short:
+            pnl = (position.price - price) * closed_size
+        else:
+            pnl = (price - position.price) * closed_size
+        
+        return pnl - fees
+    
+    def _record_closed_trade(self, realized_pnl: float):
+        """승률 카운터 갱신"""
+        self._total_closed_trades += 1
+        if realized_pnl > 0:
+            self._winning_trades += 1
     
     @log_execution_time
     def execute_trade(self, symbol: str, side: str, size: float, price: float = None, 
@@ -285,7 +398,14 @@ class PortfolioManager:
                     'status': order_result.get('status')
                 }
                 
+                # 실현 손익 반영
+                realized_pnl = self._calculate_realized_pnl(symbol, side, adjusted_size, price, fees)
+                if realized_pnl is not None:
+                    trade_record['pnl'] = realized_pnl
+                    self._record_closed_trade(realized_pnl)
+                
                 self.trade_history.append(trade_record)
+                self._executed_trades += 1
                 
                 # 포지션 업데이트
                 self._update_position_from_trade(trade_record)
@@ -316,17 +436,13 @@ class PortfolioManager:
     def _calculate_fees(self, size: float, price: float, exchange_type: str, order_type: str) -> float:
         """수수료 계산"""
         try:
-            position_value = size * price
+            fee_rate = self._fee_rate.get((exchange_type, order_type))
+            if fee_rate is None:
+                # 지정가 외 주문 유형은 테이커 수수료 적용
+                fee_rate = self._fee_rate['spot' if exchange_type == 'spot' else 'futures', 
+                                          'limit' if order_type == 'limit' else 'market']
             
-            if exchange_type == 'spot':
-                fee_rate = self.fees['spot_maker'] if order_type == 'limit' else self.fees['spot_taker']
-            else:
-                fee_rate = self.fees['futures_maker'] if order_type == 'limit' else self.fees['futures_taker']
-            
-            # 슬리피지 추가
-            fee_rate += self.fees['slippage']
-            
-            return position_value * fee_rate
+            return size * price * fee_rate
             
         except Exception as e:
             logger.error(f"수수료 계산 실패: {e}")
@@ -399,8 +515,9 @@ class PortfolioManager:
                 if self._execute_rebalance_action(action):
                     executed_actions.append(action)
             
+            now = datetime.now()
             if executed_actions:
-                self.last_rebalance = datetime.now()
+                self.last_rebalance = now
                 logger.info(f"포트폴리오 리밸런싱 완료: {len(executed_actions)}개 조정")
             
             return {
@@ -408,7 +525,7 @@ class PortfolioManager:
                 'rebalance_needed': len(rebalance_actions) > 0,
                 'actions_needed': rebalance_actions,
                 'actions_executed': executed_actions,
-                'timestamp': datetime.now()
+                'timestamp': now
             }
             
         except Exception as e:
@@ -427,16 +544,17 @@ class PortfolioManager:
             if total_value == 0:
                 return {'spot': 0, 'futures': 0}
             
-            spot_value = 0
-            futures_value = 0
+            positions = self.positions.values()
+            count = len(self.positions)
             
-            for position in self.positions.values():
-                position_value = position['size'] * position['current_price']
-                
-                if position['exchange_type'] == 'spot':
-                    spot_value += position_value
-                else:
-                    futures_value += position_value
+            # 포지션별 가치를 배열로 계산 후 시장 유형별 합산
+            sizes = np.fromiter((p['size'] for p in positions), dtype=np.float64, count=count)
+            prices = np.fromiter((p['current_price'] for p in positions), dtype=np.float64, count=count)
+            is_spot = np.fromiter((p['exchange_type'] == 'spot' for p in positions), dtype=bool, count=count)
+            
+            values = sizes * prices
+            spot_value = float(values[is_spot].sum())
+            futures_value = float(values[~is_spot].sum())
             
             return {
                 'spot': spot_value / total_value,
@@ -450,16 +568,11 @@ class PortfolioManager:
     def _get_current_prices(self) -> Dict[str, float]:
         """현재 가격 정보 조회"""
         try:
-            prices = {}
-            for symbol in self.trading_symbols:
-                try:
-                    ticker = self.exchange.get_ticker(symbol, 'spot')
-                    if ticker and ticker.get('last'):
-                        prices[symbol] = ticker['last']
-                except Exception as e:
-                    logger.warning(f"가격 조회 실패 ({symbol}): {e}")
-                    prices[symbol] = 0
-            return prices
+            tickers = self._get_tickers_cached(self.trading_symbols)
+            return {
+                symbol: tickers.get(symbol, {}).get('last') or 0
+                for symbol in self.trading_symbols
+            }
         except Exception as e:
             logger.error(f"현재 가격 조회 실패: {e}")
             return {}
@@ -498,9 +611,12 @@ class PortfolioManager:
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """포트폴리오 요약 정보"""
         try:
-            # 실제 거래소 잔고 조회
-            spot_balance = self.exchange.get_spot_balance()
-            futures_balance = self.exchange.get_futures_balance()
+            # 최근 잔고 조회 결과가 만료된 경우에만 잔고 재조회 (이력/지표는 변경하지 않음)
+            if self._last_update is None or time.monotonic() - self._last_update > self.summary_cache_ttl:
+                self._refresh_balances()
+            
+            spot_balance = self._last_spot_balance
+            futures_balance = self._last_futures_balance
             
             # 현재 포트폴리오 가치 계산
             current_balance = self._calculate_portfolio_value(spot_balance, futures_balance, [])
@@ -550,40 +666,47 @@ class PortfolioManager:
                 'current_prices': {}
             }
     
-    def get_position_details(self) -> List[Dict[str, Any]]:
-        """포지션 상세 정보"""
+    def get_position_details(self, materialize: bool = True) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """포지션 상세 정보 (materialize=False 시 제너레이터 반환)"""
         try:
-            position_details = []
-            
-            for symbol, position in self.positions.items():
-                # 수익률 계산
-                if position['side'] == 'buy':
-                    pnl_pct = (position['current_price'] - position.get('entry_price', position['current_price'])) / position.get('entry_price', position['current_price']) * 100
-                else:
-                    pnl_pct = (position.get('entry_price', position['current_price']) - position['current_price']) / position.get('entry_price', position['current_price']) * 100
-                
-                position_details.append({
-                    'symbol': symbol,
-                    'side': position['side'],
-                    'size': position['size'],
-                    'current_price': position['current_price'],
-                    'market_value': position['size'] * position['current_price'],
-                    'unrealized_pnl': position.get('unrealized_pnl', 0),
-                    'pnl_pct': pnl_pct,
-                    'exchange_type': position['exchange_type'],
-                    'timestamp': position['timestamp']
-                })
-            
-            return position_details
+            details = self._iter_position_details()
+            return list(details) if materialize else details
             
         except Exception as e:
             logger.error(f"포지션 상세 정보 조회 실패: {e}")
             return []
     
-    def get_trade_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """거래 내역 조회"""
+    def _iter_position_details(self) -> Iterator[Dict[str, Any]]:
+        """포지션 상세 정보 생성"""
+        for symbol, position in self.positions.items():
+            current_price = position['current_price']
+            entry_price = position.get('entry_price', current_price)
+            
+            # 수익률 계산
+            if position['side'] == 'buy':
+                pnl_pct = (current_price - entry_price) / entry_price * 100
+            else:
+                pnl_pct = (entry_price - current_price) / entry_price * 100
+            
+            yield {
+                'symbol': symbol,
+                'side': position['side'],
+                'size': position['size'],
+                'current_price': current_price,
+                'market_value': position['size'] * current_price,
+                'unrealized_pnl': position.get('unrealized_pnl', 0),
+                'pnl_pct': pnl_pct,
+                'exchange_type': position['exchange_type'],
+                'timestamp': position['timestamp']
+            }
+    
+    def get_trade_history(self, limit: int = 100, 
+                          materialize: bool = True) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """거래 내역 조회 (materialize=False 시 이터레이터 반환)"""
         try:
-            return self.trade_history[-limit:] if self.trade_history else []
+            start = max(len(self.trade_history) - limit, 0)
+            records = islice(self.trade_history, start, None)
+            return list(records) if materialize else records
         except Exception as e:
             logger.error(f"거래 내역 조회 실패: {e}")
             return []
@@ -593,17 +716,14 @@ class PortfolioManager:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
             
+            # 기록은 시간순으로 쌓이므로 만료된 앞부분만 제거
             # 오래된 거래 내역 정리
-            self.trade_history = [
-                trade for trade in self.trade_history 
-                if trade['timestamp'] > cutoff_date
-            ]
+            while self.trade_history and self.trade_history[0]['timestamp'] <= cutoff_date:
+                self.trade_history.popleft()
             
             # 오래된 잔고 기록 정리
-            self.balance_history = [
-                record for record in self.balance_history 
-                if record['timestamp'] > cutoff_date
-            ]
+            while self.balance_history and self.balance_history[0]['timestamp'] <= cutoff_date:
+                self.balance_history.popleft()
             
             logger.info(f"오래된 기록 정리 완료: {days_to_keep}일 이전 데이터 삭제")
             
@@ -1,17 +1,80 @@
 """
 리스크 관리 모듈
 """
+import logging
+import time
 import pandas as pd
 import numpy as np
+from collections import deque
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from utils.logger import logger
 from utils.decorators import log_execution_time
+from modules._perf_kernels import kelly_fraction, kelly_size_kernel, stop_loss_kernel, take_profit_kernel
+
+
+class Position:
+    """리스크 관리 포지션 (__slots__ 기반 고정 속성)
+    
+    기존 딕셔너리 형식 접근(position['size'])도 지원한다.
+    """
+    
+    __slots__ = ('symbol', 'side', 'size', 'price', 'exchange_type', 'stop_loss_price',
+                 'take_profit_price', 'entry_time', 'entry_ns', 'last_update_ns',
+                 'current_price', 'unrealized_pnl', 'entry_notional', 'is_short',
+                 'is_futures_short', 'row_idx')
+    
+    def __init__(self, symbol: str, side: str, size: float, price: float, exchange_type: str,
+                 stop_loss_price: float, take_profit_price: float, row_idx: int):
+        self.symbol = symbol
+        self.side = side
+        self.size = size
+        self.price = price
+        self.exchange_type = exchange_type
+        self.stop_loss_price = stop_loss_price
+        self.take_profit_price = take_profit_price
+        self.entry_time = datetime.now()
+        self.entry_ns = time.monotonic_ns()
+        self.last_update_ns = self.entry_ns
+        self.current_price = price
+        self.unrealized_pnl = 0.0
+        self.entry_notional = size * price
+        self.is_short = side == 'sell'
+        self.is_futures_short = self.is_short and exchange_type == 'futures'
+        self.row_idx = row_idx
+    
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        setattr(self, key, value)
+    
+    def get(self, key: str, default=None):
+        """딕셔너리 호환 조회"""
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        return {key: getattr(self, key) for key in self.__slots__}
 
 
 class RiskManager:
     """리스크 관리 클래스"""
     
+    __slots__ = ('config', 'max_position_size', 'max_daily_loss', 'max_drawdown', 'stop_loss_pct',
+                 'take_profit_pct', 'position_timeout_hours', 'max_leverage', 'risk_per_trade',
+                 '_timeout_ns', 'kelly_win_rate', 'kelly_avg_win', 'kelly_avg_loss',
+                 '_base_kelly_fraction', '_tp_from_sl', 'short_position_limit',
+                 'short_squeeze_threshold', 'funding_rate_threshold', 'daily_pnl', 'peak_balance',
+                 'current_drawdown', 'positions', 'risk_alerts', '_short_notional_value',
+                 '_sym_idx', '_free_rows', '_row_symbols', '_sizes', '_prices', '_entry_prices',
+                 '_entry_ns', '_upnl',
+                 '_short_mask', '_is_short', '_sl', '_tp')
+    
+    # 포지션 행 단위로 관리되는 SoA 배열 속성
+    _SOA_FIELDS = ('_sizes', '_prices', '_entry_prices', '_entry_ns', '_upnl', '_short_mask',
+                   '_is_short', '_sl', '_tp')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         
@@ -24,6 +87,14 @@ class RiskManager:
         self.position_timeout_hours = config.get('position_timeout_hours', 24)  # 포지션 타임아웃 (24시간)
         self.max_leverage = config.get('max_leverage', 5)  # 최대 레버리지
         self.risk_per_trade = config.get('risk_per_trade', 0.02)  # 거래당 리스크 (2%)
+        self._timeout_ns = int(self.position_timeout_hours * 3_600_000_000_000)
+        
+        # Kelly Criterion 파라미터 (설정값 상수이므로 초기화 시 한 번만 계산)
+        self.kelly_win_rate = config.get('kelly_win_rate', 0.55)  # 예상 승률 (55%)
+        self.kelly_avg_win = config.get('kelly_avg_win', 0.15)  # 평균 수익률 (15%)
+        self.kelly_avg_loss = config.get('kelly_avg_loss', 0.08)  # 평균 손실률 (8%)
+        self._base_kelly_fraction = kelly_fraction(self.kelly_win_rate, self.kelly_avg_win, self.kelly_avg_loss)
+        self._tp_from_sl = self.stop_loss_pct * 2.0  # 2:1 손익비 기준 테이크프로핏 거리
         
         # 공매도 특화 리스크 관리
         self.short_position_limit = config.get('short_position_limit', 0.3)  # 공매도 포지션 한도 (30%)
@@ -35,7 +106,30 @@ class RiskManager:
         self.peak_balance = 0.0
         self.current_drawdown = 0.0
         self.positions = {}
-        self.risk_alerts = []
+        self.risk_alerts = deque(maxlen=config.get('max_alert_buffer', 10000))  # 소비 지연 시 오래된 알림부터 폐기
+        
+        # 선물 숏 포지션 진입 명목가치 합계 (추가/제거 시 증분 갱신)
+        self._short_notional_value = 0.0
+        
+        # 포지션 집계용 SoA 배열 (심볼 -> 행 인덱스)
+        capacity = config.get('position_capacity', 64)
+        self._sym_idx = {}
+        self._free_rows = deque(range(capacity))
+        self._sizes = np.zeros(capacity)
+        self._prices = np.zeros(capacity)
+        self._entry_prices = np.zeros(capacity)
+        self._entry_ns = np.zeros(capacity, dtype=np.int64)
+        self._upnl = np.zeros(capacity)
+        self._short_mask = np.zeros(capacity, dtype=bool)
+        self._is_short = np.zeros(capacity, dtype=bool)  # 0=매수, 1=매도
+        self._sl = np.zeros(capacity)
+        self._tp = np.zeros(capacity)
+        self._row_symbols = [None] * capacity
+        
+        # 계산 커널 사전 컴파일 (첫 거래 신호에서 JIT 지연 방지)
+        kelly_size_kernel(0.5, 1000.0, 1.0, 0.02, self.risk_per_trade, self._base_kelly_fraction)
+        stop_loss_kernel(True, 1.0, 0.02, self.stop_loss_pct)
+        take_profit_kernel(True, 1.0, 0.5, self.take_profit_pct, self._tp_from_sl)
         
         logger.info("리스크 관리자 초기화 완료")
     
@@ -44,46 +138,8 @@ class RiskManager:
                       current_balance: float, exchange_type: str = 'spot') -> Dict[str, Any]:
         """거래 유효성 검증"""
         try:
-            validation_result = {
-                'is_valid': True,
-                'warnings': [],
-                'errors': [],
-                'adjusted_size': size
-            }
-            
-            # 포지션 크기 검증
-            position_value = size * price
-            max_position_value = current_balance * self.max_position_size
-            
-            if position_value > max_position_value:
-                validation_result['warnings'].append(f"포지션 크기 초과: {position_value:.2f} > {max_position_value:.2f}")
-                validation_result['adjusted_size'] = max_position_value / price
-            
-            # 일일 손실 한도 검증
-            if self.daily_pnl < -current_balance * self.max_daily_loss:
-                validation_result['is_valid'] = False
-                validation_result['errors'].append(f"일일 손실 한도 초과: {self.daily_pnl:.2f}")
-            
-            # 드로우다운 검증
-            if self.current_drawdown > self.max_drawdown:
-                validation_result['is_valid'] = False
-                validation_result['errors'].append(f"최대 드로우다운 초과: {self.current_drawdown:.2%}")
-            
-            # 공매도 특화 검증
-            if side == 'sell' and exchange_type == 'futures':
-                short_validation = self._validate_short_position(symbol, size, price, current_balance)
-                validation_result['warnings'].extend(short_validation['warnings'])
-                validation_result['errors'].extend(short_validation['errors'])
-                if not short_validation['is_valid']:
-                    validation_result['is_valid'] = False
-            
-            # 레버리지 검증
-            if exchange_type == 'futures':
-                leverage_validation = self._validate_leverage(size, price, current_balance)
-                validation_result['warnings'].extend(leverage_validation['warnings'])
-                validation_result['errors'].extend(leverage_validation['errors'])
-            
-            return validation_result
+            return self._validate_trade(symbol, side, size, price, current_balance,
+                                        exchange_type, self._short_notional_value)
         except Exception as e:
             logger.error(f"거래 검증 실패: {e}")
             return {
@@ -93,181 +149,250 @@ class RiskManager:
                 'adjusted_size': 0
             }
     
+    @log_execution_time
+    def validate_trades_batch(self, orders: List[Dict[str, Any]], 
+                              current_balance: float) -> List[Dict[str, Any]]:
+        """여러 거래 일괄 검증
+        
+        공매도 한도는 기존 숏 명목가치 스냅샷에 통과한 주문을 순서대로 누적해 검증한다.
+        
+        Args:
+            orders: 우선순위 순으로 정렬된 주문 리스트 (symbol, side, size, price, exchange_type)
+            current_balance: 현재 잔고
+        """
+        results = []
+        short_value = self._short_notional_value
+        
+        for order in orders:
+            try:
+                side = order['side']
+                exchange_type = order.get('exchange_type', 'spot')
+                validation_result = self._validate_trade(
+                    order['symbol'], side, order['size'], order['price'],
+                    current_balance, exchange_type, short_value
+                )
+                
+                if validation_result['is_valid'] and side == 'sell' and exchange_type == 'futures':
+                    short_value += order['size'] * order['price']
+            except Exception as e:
+                logger.error(f"거래 검증 실패: {order.get('symbol')} - {e}")
+                validation_result = {
+                    'is_valid': False,
+                    'warnings': [],
+                    'errors': [f"검증 오류: {e}"],
+                    'adjusted_size': 0
+                }
+            results.append(validation_result)
+        
+        return results
+    
+    def _validate_trade(self, symbol: str, side: str, size: float, price: float,
+                        current_balance: float, exchange_type: str,
+                        current_short_value: float) -> Dict[str, Any]:
+        """거래 유효성 검증 (현재 숏 명목가치 기준)"""
+        validation_result = {
+            'is_valid': True,
+            'warnings': [],
+            'errors': [],
+            'adjusted_size': size
+        }
+        
+        # 포지션 크기 검증
+        position_value = size * price
+        max_position_value = current_balance * self.max_position_size
+        
+        if position_value > max_position_value:
+            validation_result['warnings'].append(f"포지션 크기 초과: {position_value:.2f} > {max_position_value:.2f}")
+            validation_result['adjusted_size'] = max_position_value / price
+        
+        # 일일 손실 한도 검증
+        if self.daily_pnl < -current_balance * self.max_daily_loss:
+            validation_result['is_valid'] = False
+            validation_result['errors'].append(f"일일 손실 한도 초과: {self.daily_pnl:.2f}")
+        
+        # 드로우다운 검증
+        if self.current_drawdown > self.max_drawdown:
+            validation_result['is_valid'] = False
+            validation_result['errors'].append(f"최대 드로우다운 초과: {self.current_drawdown:.2%}")
+        
+        # 공매도 특화 검증
+        if side == 'sell' and exchange_type == 'futures':
+            is_valid, warnings, errors = self._validate_short_position(
+                symbol, size, price, current_balance, current_short_value
+            )
+            if warnings:
+                validation_result['warnings'].extend(warnings)
+            if errors:
+                validation_result['errors'].extend(errors)
+            if not is_valid:
+                validation_result['is_valid'] = False
+        
+        # 레버리지 검증
+        if exchange_type == 'futures':
+            _, warnings, _ = self._validate_leverage(size, price, current_balance)
+            if warnings:
+                validation_result['warnings'].extend(warnings)
+        
+        return validation_result
+    
     def _validate_short_position(self, symbol: str, size: float, price: float, 
-                               current_balance: float) -> Dict[str, Any]:
-        """공매도 포지션 검증"""
+                               current_balance: float, 
+                               current_short_value: Optional[float] = None
+                               ) -> Tuple[bool, Optional[List[str]], Optional[List[str]]]:
+        """공매도 포지션 검증
+        
+        Returns:
+            (is_valid, warnings, errors) - 해당 내용이 없으면 None
+        """
         try:
-            validation_result = {
-                'is_valid': True,
-                'warnings': [],
-                'errors': []
-            }
+            warnings = None
+            errors = None
             
             # 공매도 포지션 한도 검증
-            current_short_value = sum(
-                pos['size'] * pos['price'] for pos in self.positions.values()
-                if pos['side'] == 'sell' and pos['exchange_type'] == 'futures'
-            )
+            if current_short_value is None:
+                current_short_value = self._short_notional_value
             new_short_value = current_short_value + (size * price)
             max_short_value = current_balance * self.short_position_limit
             
             if new_short_value > max_short_value:
-                validation_result['is_valid'] = False
-                validation_result['errors'].append(
-                    f"공매도 포지션 한도 초과: {new_short_value:.2f} > {max_short_value:.2f}"
-                )
+                errors = [f"공매도 포지션 한도 초과: {new_short_value:.2f} > {max_short_value:.2f}"]
             
             # 숏 스퀴즈 위험 검증
             if symbol in self.positions:
                 recent_price_change = self._calculate_recent_price_change(symbol)
                 if recent_price_change > self.short_squeeze_threshold:
-                    validation_result['warnings'].append(
-                        f"숏 스퀴즈 위험: 최근 가격 상승 {recent_price_change:.2%}"
-                    )
+                    warnings = [f"숏 스퀴즈 위험: 최근 가격 상승 {recent_price_change:.2%}"]
             
-            return validation_result
+            return errors is None, warnings, errors
         except Exception as e:
             logger.error(f"공매도 포지션 검증 실패: {e}")
-            return {
-                'is_valid': False,
-                'warnings': [],
-                'errors': [f"공매도 검증 오류: {e}"]
-            }
+            return False, None, [f"공매도 검증 오류: {e}"]
     
-    def _validate_leverage(self, size: float, price: float, current_balance: float) -> Dict[str, Any]:
-        """레버리지 검증"""
+    def _validate_leverage(self, size: float, price: float, current_balance: float
+                           ) -> Tuple[bool, Optional[List[str]], Optional[List[str]]]:
+        """레버리지 검증
+        
+        Returns:
+            (is_valid, warnings, errors) - 해당 내용이 없으면 None
+        """
         try:
-            validation_result = {
-                'is_valid': True,
-                'warnings': [],
-                'errors': []
-            }
-            
             position_value = size * price
             required_margin = position_value / self.max_leverage
             
             if required_margin > current_balance * 0.8:  # 잔고의 80% 이상 사용
-                validation_result['warnings'].append(
-                    f"높은 레버리지 사용: 필요 마진 {required_margin:.2f}"
-                )
+                return True, [f"높은 레버리지 사용: 필요 마진 {required_margin:.2f}"], None
             
-            return validation_result
+            return True, None, None
         except Exception as e:
             logger.error(f"레버리지 검증 실패: {e}")
-            return {
-                'is_valid': True,
-                'warnings': [],
-                'errors': []
-            }
+            return True, None, None
     
     def _calculate_recent_price_change(self, symbol: str) -> float:
         """최근 가격 변화 계산"""
-        try:
-            if symbol in self.positions:
-                position = self.positions[symbol]
-                entry_price = position['price']
-                current_price = position.get('current_price', entry_price)
-                return (current_price - entry_price) / entry_price
+        position = self.positions.get(symbol)
+        if position is None:
             return 0.0
-        except Exception as e:
-            logger.error(f"가격 변화 계산 실패: {e}")
+        entry_price = position.price
+        if entry_price == 0:
             return 0.0
+        return (position.current_price - entry_price) / entry_price
     
-    @log_execution_time
     def calculate_position_size(self, symbol: str, signal_strength: float, 
                                current_balance: float, current_price: float, 
                                volatility: float = 0.02) -> float:
         """포지션 크기 계산"""
         try:
-            # Kelly Criterion 기반 포지션 크기 계산
-            win_rate = 0.55  # 예상 승률 (55%)
-            avg_win = 0.15   # 평균 수익률 (15%)
-            avg_loss = 0.08  # 평균 손실률 (8%)
-            
-            kelly_fraction = (win_rate * avg_win - (1 - win_rate) * avg_loss) / avg_win
-            kelly_fraction = max(0, min(kelly_fraction, 0.25))  # 최대 25%로 제한
-            
-            # 신호 강도 적용
-            adjusted_fraction = kelly_fraction * signal_strength
-            
-            # 변동성 조정
-            volatility_adjustment = 1 / (1 + volatility * 10)
-            adjusted_fraction *= volatility_adjustment
-            
-            # 최대 리스크 제한
-            max_risk_amount = current_balance * self.risk_per_trade
-            position_value = current_balance * adjusted_fraction
-            
-            if position_value > max_risk_amount:
-                position_value = max_risk_amount
-            
-            position_size = position_value / current_price
+            # Kelly Criterion 기반 포지션 크기 계산 (신호 강도/변동성 조정 및 최대 리스크 제한)
+            position_size = kelly_size_kernel(
+                float(signal_strength), float(current_balance), float(current_price),
+                float(volatility), self.risk_per_trade, self._base_kelly_fraction
+            )
             
-            logger.debug(f"포지션 크기 계산: {symbol} - {position_size:.6f} (신호강도: {signal_strength:.2f})")
+            logger.debug("포지션 크기 계산: %s - %.6f (신호강도: %.2f)", symbol, position_size, signal_strength)
             return position_size
         except Exception as e:
             logger.error(f"포지션 크기 계산 실패: {e}")
             return 0.0
     
-    @log_execution_time
     def calculate_stop_loss(self, symbol: str, side: str, entry_price: float, 
                            volatility: float = 0.02) -> float:
         """스탑로스 가격 계산"""
         try:
-            # 기본 스탑로스
-            basic_stop_loss = self.stop_loss_pct
-            
-            # 변동성 기반 조정
-            volatility_adjustment = max(volatility * 2, basic_stop_loss)
-            
-            # ATR 기반 스탑로스 (더 정교한 방법)
-            atr_multiplier = 2.0
-            atr_stop_loss = volatility * atr_multiplier
-            
-            # 최종 스탑로스 거리 결정
-            stop_loss_distance = max(basic_stop_loss, min(volatility_adjustment, atr_stop_loss))
-            
-            if side == 'buy':
-                stop_loss_price = entry_price * (1 - stop_loss_distance)
-            else:  # sell
-                stop_loss_price = entry_price * (1 + stop_loss_distance)
+            # 기본/변동성/ATR 기반 스탑로스 거리 중 결정
+            stop_loss_price = stop_loss_kernel(
+                side == 'buy', float(entry_price), float(volatility), self.stop_loss_pct
+            )
             
-            logger.debug(f"스탑로스 계산: {symbol} {side} - {stop_loss_price:.6f}")
+            logger.debug("스탑로스 계산: %s %s - %.6f", symbol, side, stop_loss_price)
             return stop_loss_price
         except Exception as e:
             logger.error(f"스탑로스 계산 실패: {e}")
             return entry_price
     
-    @log_execution_time
     def calculate_take_profit(self, symbol: str, side: str, entry_price: float, 
                             signal_strength: float = 0.5) -> float:
         """테이크프로핏 가격 계산"""
         try:
-            # 기본 테이크프로핏
-            basic_take_profit = self.take_profit_pct
-            
-            # 신호 강도 기반 조정
-            strength_adjustment = basic_take_profit * (1 + signal_strength)
-            
-            # 리스크 대비 수익 비율 (Risk-Reward Ratio)
-            risk_reward_ratio = 2.0  # 2:1 비율
-            stop_loss_distance = self.stop_loss_pct
-            take_profit_distance = stop_loss_distance * risk_reward_ratio
-            
-            # 최종 테이크프로핏 거리 결정
-            final_take_profit_distance = min(strength_adjustment, take_profit_distance)
-            
-            if side == 'buy':
-                take_profit_price = entry_price * (1 + final_take_profit_distance)
-            else:  # sell
-                take_profit_price = entry_price * (1 - final_take_profit_distance)
+            # 신호 강도 기반 조정과 2:1 손익비 중 작은 거리 선택
+            take_profit_price = take_profit_kernel(
+                side == 'buy', float(entry_price), float(signal_strength),
+                self.take_profit_pct, self._tp_from_sl
+            )
             
-            logger.debug(f"테이크프로핏 계산: {symbol} {side} - {take_profit_price:.6f}")
+            logger.debug("테이크프로핏 계산: %s %s - %.6f", symbol, side, take_profit_price)
             return take_profit_price
         except Exception as e:
             logger.error(f"테이크프로핏 계산 실패: {e}")
             return entry_price
     
+    @log_execution_time
+    def calculate_position_sizes_batch(self, signal_strengths: np.ndarray, balances: np.ndarray,
+                                       prices: np.ndarray, volatilities: np.ndarray) -> np.ndarray:
+        """여러 심볼 포지션 크기 일괄 계산 (calculate_position_size 벡터화 버전)"""
+        try:
+            signal_strengths = np.asarray(signal_strengths, dtype=np.float64)
+            balances = np.asarray(balances, dtype=np.float64)
+            prices = np.asarray(prices, dtype=np.float64)
+            volatilities = np.asarray(volatilities, dtype=np.float64)
+            
+            adjusted_fraction = self._base_kelly_fraction * signal_strengths / (1.0 + volatilities * 10.0)
+            position_values = np.minimum(balances * adjusted_fraction, balances * self.risk_per_trade)
+            return position_values / prices
+        except Exception as e:
+            logger.error(f"포지션 크기 일괄 계산 실패: {e}")
+            return np.zeros(np.shape(prices))
+    
+    @log_execution_time
+    def calculate_stop_losses_batch(self, sides: np.ndarray, entry_prices: np.ndarray,
+                                    volatilities: np.ndarray) -> np.ndarray:
+        """여러 심볼 스탑로스 가격 일괄 계산"""
+        try:
+            is_buy = np.asarray(sides) == 'buy'
+            entry_prices = np.asarray(entry_prices, dtype=np.float64)
+            volatilities = np.asarray(volatilities, dtype=np.float64)
+            
+            volatility_adjustment = np.maximum(volatilities * 2.0, self.stop_loss_pct)
+            distances = np.maximum(self.stop_loss_pct, np.minimum(volatility_adjustment, volatilities * 2.0))
+            return entry_prices * np.where(is_buy, 1.0 - distances, 1.0 + distances)
+        except Exception as e:
+            logger.error(f"스탑로스 일괄 계산 실패: {e}")
+            return np.asarray(entry_prices, dtype=np.float64)
+    
+    @log_execution_time
+    def calculate_take_profits_batch(self, sides: np.ndarray, entry_prices: np.ndarray,
+                                     signal_strengths: np.ndarray) -> np.ndarray:
+        """여러 심볼 테이크프로핏 가격 일괄 계산"""
+        try:
+            is_buy = np.asarray(sides) == 'buy'
+            entry_prices = np.asarray(entry_prices, dtype=np.float64)
+            signal_strengths = np.asarray(signal_strengths, dtype=np.float64)
+            
+            distances = np.minimum(self.take_profit_pct * (1.0 + signal_strengths), self._tp_from_sl)
+            return entry_prices * np.where(is_buy, 1.0 + distances, 1.0 - distances)
+        except Exception as e:
+            logger.error(f"테이크프로핏 일괄 계산 실패: {e}")
+            return np.asarray(entry_prices, dtype=np.float64)
+    
     @log_execution_time
     def update_position_risk(self, symbol: str, current_price: float, 
                            unrealized_pnl: float = 0.0):
@@ -277,9 +402,15 @@ class RiskManager:
                 return
             
             position = self.positions[symbol]
-            position['current_price'] = current_price
-            position['unrealized_pnl'] = unrealized_pnl
-            position['last_update'] = datetime.now()
+            
+            row = position.row_idx
+            self._prices[row] = current_price
+            self._upnl[row] = unrealized_pnl
+            
+            position.current_price = current_price
+            position.unrealized_pnl = unrealized_pnl
+            now_ns = time.monotonic_ns()
+            position.last_update_ns = now_ns
             
             # 스탑로스 체크
             if self._should_stop_loss(position, current_price):
@@ -287,7 +418,7 @@ class RiskManager:
                     'type': 'stop_loss',
                     'symbol': symbol,
                     'message': f"스탑로스 발생: {symbol} 현재가 {current_price:.6f}",
-                    'timestamp': datetime.now()
+                    'timestamp_ns': now_ns
                 })
             
             # 테이크프로핏 체크
@@ -296,104 +427,237 @@ class RiskManager:
                     'type': 'take_profit',
                     'symbol': symbol,
                     'message': f"테이크프로핏 발생: {symbol} 현재가 {current_price:.6f}",
-                    'timestamp': datetime.now()
+                    'timestamp_ns': now_ns
                 })
             
             # 포지션 타임아웃 체크
-            if self._is_position_timeout(position):
+            if self._is_position_timeout(position, now_ns):
                 self.risk_alerts.append({
                     'type': 'timeout',
                     'symbol': symbol,
                     'message': f"포지션 타임아웃: {symbol} 보유시간 초과",
-                    'timestamp': datetime.now()
+                    'timestamp_ns': now_ns
                 })
             
         except Exception as e:
-            logger.error(f"포지션 리스크 업데이트 실패: {e}")
+            logger.error(f"포지션 리스크 업데이트 실패: {symbol} - {e}")
     
-    def _should_stop_loss(self, position: Dict[str, Any], current_price: float) -> bool:
-        """스탑로스 여부 확인"""
+    @log_execution_time
+    def update_positions_risk_bulk(self, updates: Dict[str, Tuple[float, float]]):
+        """여러 포지션 리스크 일괄 업데이트
+        
+        Args:
+            updates: {심볼: (현재가, 미실현 손익)}
+        """
+        # 루프 내 속성/메서드 조회를 지역 변수로 고정
+        positions = self.positions
+        prices = self._prices
+        upnl = self._upnl
+        append_alert = self.risk_alerts.append
+        should_stop_loss = self._should_stop_loss
+        should_take_profit = self._should_take_profit
+        is_position_timeout = self._is_position_timeout
+        now_ns = time.monotonic_ns()
+        
+        for symbol, (current_price, unrealized_pnl) in updates.items():
+            position = positions.get(symbol)
+            if position is None:
+                continue
+            
+            try:
+                row = position.row_idx
+                prices[row] = current_price
+                upnl[row] = unrealized_pnl
+                position.current_price = current_price
+                position.unrealized_pnl = unrealized_pnl
+                position.last_update_ns = now_ns
+                
+                if should_stop_loss(position, current_price):
+                    append_alert({
+                        'type': 'stop_loss',
+                        'symbol': symbol,
+                        'message': f"스탑로스 발생: {symbol} 현재가 {current_price:.6f}",
+                        'timestamp_ns': now_ns
+                    })
+                
+                if should_take_profit(position, current_price):
+                    append_alert({
+                        'type': 'take_profit',
+                        'symbol': symbol,
+                        'message': f"테이크프로핏 발생: {symbol} 현재가 {current_price:.6f}",
+                        'timestamp_ns': now_ns
+                    })
+                
+                if is_position_timeout(position, now_ns):
+                    append_alert({
+                        'type': 'timeout',
+                        'symbol': symbol,
+                        'message': f"포지션 타임아웃: {symbol} 보유시간 초과",
+                        'timestamp_ns': now_ns
+                    })
+            except Exception as e:
+                logger.error(f"포지션 리스크 업데이트 실패: {symbol} - {e}")
+    
+    def update_prices_bulk(self, prices):
+        """전체 포지션 가격 일괄 업데이트 (tick_update 래퍼)
+        
+        시세가 없는 항목(0, 음수, NaN)은 건너뛴다.
+        
+        Args:
+            prices: {심볼: 현재가} 또는 SoA 배열 행 순서에 맞춘 현재가 배열
+        """
         try:
-            side = position['side']
-            stop_loss_price = position.get('stop_loss_price', 0)
-            
-            if stop_loss_price == 0:
-                return False
-            
-            if side == 'buy':
-                return current_price <= stop_loss_price
-            else:  # sell
-                return current_price >= stop_loss_price
+            if not isinstance(prices, dict):
+                prices = np.asarray(prices, dtype=np.float64)
+                prices = {symbol: prices[row] for symbol, row in self._sym_idx.items() if row < prices.shape[0]}
+            self.tick_update(prices)
         except Exception as e:
-            logger.error(f"스탑로스 확인 실패: {e}")
-            return False
+            logger.error(f"포지션 가격 일괄 업데이트 실패: {e}")
     
-    def _should_take_profit(self, position: Dict[str, Any], current_price: float) -> bool:
-        """테이크프로핏 여부 확인"""
+    @log_execution_time
+    def tick_update(self, price_dict: Dict[str, float]):
+        """틱 단위 통합 업데이트
+        
+        가격 반영, 미실현 손익 계산, 스탑로스/테이크프로핏/타임아웃 확인을
+        보유 포지션 배열에 대해 한 번의 벡터 연산으로 처리한다.
+        
+        Args:
+            price_dict: {심볼: 현재가}
+        """
         try:
-            side = position['side']
-            take_profit_price = position.get('take_profit_price', 0)
-            
-            if take_profit_price == 0:
-                return False
+            sym_idx = self._sym_idx
+            pairs = [(sym_idx[symbol], price) for symbol, price in price_dict.items() if symbol in sym_idx]
+            if not pairs:
+                return
             
-            if side == 'buy':
-                return current_price >= take_profit_price
-            else:  # sell
-                return current_price <= take_profit_price
+            count = len(pairs)
+            rows = np.fromiter((row for row, _ in pairs), dtype=np.intp, count=count)
+            prices = np.fromiter((price for _, price in pairs), dtype=np.float64, count=count)
+            
+            # 시세 없는 항목(0/음수/NaN)은 잘못된 스탑로스/테이크프로핏을 일으키므로 제외
+            priced = np.isfinite(prices) & (prices > 0.0)
+            if not priced.all():
+                rows = rows[priced]
+                prices = prices[priced]
+                count = rows.shape[0]
+                if count == 0:
+                    return
+            
+            # 가격 및 미실현 손익 반영
+            is_short = self._is_short[rows]
+            upnl = self._sizes[rows] * (prices - self._entry_prices[rows]) * np.where(is_short, -1.0, 1.0)
+            self._prices[rows] = prices
+            self._upnl[rows] = upnl
+            
+            # 스탑로스/테이크프로핏/타임아웃 마스크
+            sl = self._sl[rows]
+            tp = self._tp[rows]
+            sl_hit = np.where(is_short, prices >= sl, prices <= sl) & (sl != 0)
+            tp_hit = np.where(is_short, prices <= tp, prices >= tp) & (tp != 0)
+            now_ns = time.monotonic_ns()
+            timeout_hit = (now_ns - self._entry_ns[rows]) > self._timeout_ns
+            
+            # 포지션 객체 동기화
+            positions = self.positions
+            row_symbols = self._row_symbols
+            for i in range(count):
+                position = positions[row_symbols[rows[i]]]
+                position.current_price = float(prices[i])
+                position.unrealized_pnl = float(upnl[i])
+                position.last_update_ns = now_ns
+            
+            append_alert = self.risk_alerts.append
+            for i in np.nonzero(sl_hit | tp_hit | timeout_hit)[0]:
+                symbol = row_symbols[rows[i]]
+                if sl_hit[i]:
+                    append_alert({
+                        'type': 'stop_loss',
+                        'symbol': symbol,
+                        'message': f"스탑로스 발생: {symbol} 현재가 {prices[i]:.6f}",
+                        'timestamp_ns': now_ns
+                    })
+                if tp_hit[i]:
+                    append_alert({
+                        'type': 'take_profit',
+                        'symbol': symbol,
+                        'message': f"테이크프로핏 발생: {symbol} 현재가 {prices[i]:.6f}",
+                        'timestamp_ns': now_ns
+                    })
+                if timeout_hit[i]:
+                    append_alert({
+                        'type': 'timeout',
+                        'symbol': symbol,
+                        'message': f"포지션 타임아웃: {symbol} 보유시간 초과",
+                        'timestamp_ns': now_ns
+                    })
         except Exception as e:
-            logger.error(f"테이크프로핏 확인 실패: {e}")
+            logger.error(f"틱 업데이트 실패: {e}")
+    
+    def _should_stop_loss(self, position: Position, current_price: float) -> bool:
+        """스탑로스 여부 확인"""
+        stop_loss_price = position.stop_loss_price
+        if not stop_loss_price:
             return False
+        if position.is_short:
+            return current_price >= stop_loss_price
+        return current_price <= stop_loss_price
     
-    def _is_position_timeout(self, position: Dict[str, Any]) -> bool:
-        """포지션 타임아웃 확인"""
-        try:
-            entry_time = position.get('entry_time', datetime.now())
-            timeout_threshold = timedelta(hours=self.position_timeout_hours)
-            return datetime.now() - entry_time > timeout_threshold
-        except Exception as e:
-            logger.error(f"포지션 타임아웃 확인 실패: {e}")
+    def _should_take_profit(self, position: Position, current_price: float) -> bool:
+        """테이크프로핏 여부 확인"""
+        take_profit_price = position.take_profit_price
+        if not take_profit_price:
             return False
+        if position.is_short:
+            return current_price <= take_profit_price
+        return current_price >= take_profit_price
+    
+    def _is_position_timeout(self, position: Position, now_ns: Optional[int] = None) -> bool:
+        """포지션 타임아웃 확인 (monotonic 나노초 정수 비교)"""
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns - position.entry_ns > self._timeout_ns
     
     def update_daily_pnl(self, realized_pnl: float):
         """일일 손익 업데이트"""
-        try:
-            self.daily_pnl += realized_pnl
-            logger.debug(f"일일 손익 업데이트: {self.daily_pnl:.2f}")
-        except Exception as e:
-            logger.error(f"일일 손익 업데이트 실패: {e}")
+        self.daily_pnl += realized_pnl
+        logger.debug("일일 손익 업데이트: %.2f", self.daily_pnl)
     
     def update_drawdown(self, current_balance: float):
         """드로우다운 업데이트"""
-        try:
-            if current_balance > self.peak_balance:
-                self.peak_balance = current_balance
-                self.current_drawdown = 0.0
-            else:
-                self.current_drawdown = (self.peak_balance - current_balance) / self.peak_balance
-            
-            logger.debug(f"드로우다운 업데이트: {self.current_drawdown:.2%}")
-        except Exception as e:
-            logger.error(f"드로우다운 업데이트 실패: {e}")
+        if current_balance > self.peak_balance:
+            self.peak_balance = current_balance
+            self.current_drawdown = 0.0
+        elif self.peak_balance > 0:
+            self.current_drawdown = (self.peak_balance - current_balance) / self.peak_balance
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("드로우다운 업데이트: %.2f%%", self.current_drawdown * 100)
     
     def add_position(self, symbol: str, side: str, size: float, price: float, 
                     exchange_type: str = 'spot', stop_loss_price: float = 0, 
                     take_profit_price: float = 0):
         """포지션 추가"""
         try:
-            self.positions[symbol] = {
-                'symbol': symbol,
-                'side': side,
-                'size': size,
-                'price': price,
-                'exchange_type': exchange_type,
-                'stop_loss_price': stop_loss_price,
-                'take_profit_price': take_profit_price,
-                'entry_time': datetime.now(),
-                'unrealized_pnl': 0.0,
-                'current_price': price
-            }
-            logger.info(f"포지션 추가: {symbol} {side} {size} @ {price}")
+            if symbol in self.positions:
+                self._release_row(symbol)
+            
+            row = self._allocate_row(symbol)
+            position = Position(symbol, side, size, price, exchange_type,
+                                stop_loss_price, take_profit_price, row)
+            self.positions[symbol] = position
+            
+            self._sizes[row] = size
+            self._prices[row] = price
+            self._entry_prices[row] = price
+            self._entry_ns[row] = position.entry_ns
+            self._upnl[row] = 0.0
+            self._short_mask[row] = position.is_futures_short
+            self._is_short[row] = position.is_short
+            self._sl[row] = stop_loss_price
+            self._tp[row] = take_profit_price
+            if position.is_futures_short:
+                self._short_notional_value += position.entry_notional
+            logger.info("포지션 추가: %s %s %s @ %s", symbol, side, size, price)
         except Exception as e:
             logger.error(f"포지션 추가 실패: {e}")
     
@@ -401,16 +665,55 @@ class RiskManager:
         """포지션 제거"""
         try:
             if symbol in self.positions:
+                self._release_row(symbol)
                 del self.positions[symbol]
-                logger.info(f"포지션 제거: {symbol}")
+                logger.info("포지션 제거: %s", symbol)
         except Exception as e:
             logger.error(f"포지션 제거 실패: {e}")
     
+    def _allocate_row(self, symbol: str) -> int:
+        """SoA 배열 행 할당 (빈 행이 없으면 용량 2배 확장)"""
+        if not self._free_rows:
+            capacity = len(self._sizes)
+            self._free_rows.extend(range(capacity, capacity * 2))
+            for field in self._SOA_FIELDS:
+                array = getattr(self, field)
+                setattr(self, field, np.concatenate((array, np.zeros_like(array))))
+            self._row_symbols.extend([None] * capacity)
+        
+        row = self._free_rows.popleft()
+        self._sym_idx[symbol] = row
+        self._row_symbols[row] = symbol
+        return row
+    
+    def _release_row(self, symbol: str):
+        """SoA 배열 행 반환 및 집계값 차감"""
+        position = self.positions[symbol]
+        if position.is_futures_short:
+            self._short_notional_value -= position.entry_notional
+        
+        row = self._sym_idx.pop(symbol)
+        for field in self._SOA_FIELDS:
+            getattr(self, field)[row] = 0
+        self._row_symbols[row] = None
+        self._free_rows.append(row)
+        
+        if not self._sym_idx:
+            self._short_notional_value = 0.0  # 부동소수점 누적 오차 제거
+    
     def get_risk_alerts(self) -> List[Dict[str, Any]]:
         """리스크 알림 조회"""
         try:
-            alerts = self.risk_alerts.copy()
+            alerts = list(self.risk_alerts)
             self.risk_alerts.clear()  # 조회 후 클리어
+            
+            # monotonic 시각을 조회 시점에만 datetime으로 변환
+            if alerts:
+                wall_now = datetime.now()
+                now_ns = time.monotonic_ns()
+                for alert in alerts:
+                    if 'timestamp' not in alert:
+                        alert['timestamp'] = wall_now - timedelta(microseconds=(now_ns - alert['timestamp_ns']) // 1000)
             return alerts
         except Exception as e:
             logger.error(f"리스크 알림 조회 실패: {e}")
@@ -419,27 +722,16 @@ class RiskManager:
     def get_risk_summary(self) -> Dict[str, Any]:
         """리스크 요약 정보"""
         try:
-            total_position_value = sum(
-                pos['size'] * pos['current_price'] for pos in self.positions.values()
-            )
-            
-            total_unrealized_pnl = sum(
-                pos['unrealized_pnl'] for pos in self.positions.values()
-            )
-            
-            short_position_value = sum(
-                pos['size'] * pos['current_price'] for pos in self.positions.values()
-                if pos['side'] == 'sell' and pos['exchange_type'] == 'futures'
-            )
+            position_values = self._sizes * self._prices
             
             return {
                 'daily_pnl': self.daily_pnl,
                 'current_drawdown': self.current_drawdown,
                 'peak_balance': self.peak_balance,
                 'total_positions': len(self.positions),
-                'total_position_value': total_position_value,
-                'total_unrealized_pnl': total_unrealized_pnl,
-                'short_position_value': short_position_value,
+                'total_position_value': float(position_values.sum()),
+                'total_unrealized_pnl': float(self._upnl.sum()),
+                'short_position_value': float(position_values[self._short_mask].sum()),
                 'risk_alerts_count': len(self.risk_alerts)
             }
         except Exception as e:
@@ -461,7 +753,7 @@ class RiskManager:
                 'type': 'emergency_stop',
                 'symbol': 'ALL',
                 'message': f"비상 정지: {reason}",
-                'timestamp': datetime.now()
+                'timestamp_ns': time.monotonic_ns()
             })
             logger.critical(f"비상 정지 발생: {reason}")
         except Exception as e:
@@ -1,19 +1,79 @@
 """
 거래 전략 엔진 모듈
 """
+import asyncio
+import time
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from utils.logger import logger
 from utils.decorators import log_execution_time, cache_result
 from .technical_analysis import TechnicalAnalyzer
 from .exchange_interface import ExchangeInterface
+from ._strategy_kernels import (
+    specialize_decision_kernel, decision_batch, hybrid_select, hybrid_select_batch, ACTIONS, ACTION_CODES, ACTION_BUY, ACTION_SELL,
+    STRATEGY_ARBITRAGE, STRATEGY_TREND, STRATEGY_HEDGE, STRATEGY_SPOT_ONLY
+)
+
+
+# 보류(hold) 결정 템플릿 (호출자가 수정/직렬화할 수 있도록 항상 복사본을 반환)
+_HOLD = {'strategy': 'hold', 'decision': {'action': 'hold', 'size': 0}}
+
+
+class Position:
+    """전략 포지션 (__slots__ 기반 고정 속성)
+    
+    기존 딕셔너리 형식 접근(position.get('size', 0))도 지원한다.
+    """
+    
+    __slots__ = ('size', 'unrealized_pnl', 'realized_pnl', 'side', 'leverage')
+    
+    def __init__(self, size: float = 0, unrealized_pnl: float = 0, realized_pnl: float = 0,
+                 side: Optional[str] = None, leverage: int = 1):
+        self.size = size
+        self.unrealized_pnl = unrealized_pnl
+        self.realized_pnl = realized_pnl
+        self.side = side
+        self.leverage = leverage
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Position':
+        """딕셔너리에서 생성 (정의되지 않은 키는 무시)"""
+        return cls(**{key: data[key] for key in cls.__slots__ if key in data})
+    
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        setattr(self, key, value)
+    
+    def get(self, key: str, default=None):
+        """딕셔너리 호환 조회"""
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        return {key: getattr(self, key) for key in self.__slots__}
 
 
 class StrategyEngine:
     """거래 전략 엔진 클래스"""
     
+    __slots__ = ('config', 'exchange', 'technical_analyzer', 'spot_allocation', 'futures_allocation',
+                 'hedge_ratio', 'rebalance_threshold', 'max_leverage', 'risk_per_trade',
+                 '_max_exposure', 'max_concurrent_analysis', '_spot_params', '_futures_params', '_spot_decide',
+                 '_futures_decide', '_arbitrage_threshold',
+                 'positions', '_pos_rows', '_pos_symbols', '_pos_size', '_pos_unrealized', '_pos_realized',
+                 '_pos_group_id', '_group_ids', '_group_names',
+                 'last_signals', '_last_rebalance_ts', '_indicator_cache')
+    
+    # 시간 기준 리밸런싱 주기 (6시간, 초 단위)
+    _REBALANCE_INTERVAL = 6 * 3600.0
+    
+    # 포지션 SoA(Structure of Arrays) 배열 필드
+    _POS_FIELDS = ('_pos_size', '_pos_unrealized', '_pos_realized', '_pos_group_id')
+    
     def __init__(self, config: Dict[str, Any], exchange: ExchangeInterface):
         self.config = config
         self.exchange = exchange
@@ -26,67 +86,231 @@ class StrategyEngine:
         self.rebalance_threshold = config.get('rebalance_threshold', 0.05)
         self.max_leverage = config.get('max_leverage', 5)
         self.risk_per_trade = config.get('risk_per_trade', 0.02)
+        self._max_exposure = self.risk_per_trade * 3  # 심볼당 최대 누적 포지션 크기
+        self.max_concurrent_analysis = config.get('max_concurrent_analysis', 5)
+        
+        # 결정 커널 인자 사전 구성
+        # (배분 비율, 최대 레버리지, 신호 임계값, 프리미엄 임계값, 신뢰도 조정 배수, 조정 대상 행동)
+        # 현물: 2% 이상 프리미엄이면 매수, 2% 이상 디스카운트면 매도 신호 약화
+        # 선물: 3% 이상 프리미엄이면 매도, 3% 이상 디스카운트면 매수 신호 강화
+        self._spot_params = (float(self.spot_allocation), int(self.max_leverage), 0.5, 0.02, 0.8, ACTION_BUY)
+        self._futures_params = (float(self.futures_allocation), int(self.max_leverage), 0.5, 0.03, 1.2, ACTION_SELL)
+        self._arbitrage_threshold = 0.05  # 5% 이상 가격차이
+        
+        # 설정 상수를 고정한 특수화 결정 커널
+        self._spot_decide = specialize_decision_kernel(*self._spot_params)
+        self._futures_decide = specialize_decision_kernel(*self._futures_params)
         
         # 거래 상태
         self.positions = {}
+        
+        # 포지션 SoA 배열 (성과 집계 벡터화용, 심볼별 행 인덱스)
+        capacity = config.get('position_capacity', 64)
+        self._pos_rows = {}
+        self._pos_symbols = []
+        self._pos_size = np.zeros(capacity)
+        self._pos_unrealized = np.zeros(capacity)
+        self._pos_realized = np.zeros(capacity)
+        
+        # 심볼 그룹(기초 자산, 예: BTC/USDT, BTC/USDT:USDT -> BTC) 인덱스
+        self._pos_group_id = np.zeros(capacity, dtype=np.int32)
+        self._group_ids = {}
+        self._group_names = []
         self.last_signals = {}
-        self.last_rebalance = None
+        self._last_rebalance_ts = None  # time.monotonic() 기준
+        
+        # 지표 계산 캐시: (symbol, market) -> (마지막 캔들 시각, 마지막 종가, 신호, 시장 강도)
+        self._indicator_cache = {}
+        
+        # 결정 커널 사전 컴파일 (첫 거래 결정에서 JIT 지연 방지)
+        self._spot_decide(0.0, 0.0)
+        self._futures_decide(0.0, 0.0)
+        hybrid_select(0.0, 0, 0.0, 0, 0.0, self._arbitrage_threshold)
         
         logger.info("전략 엔진 초기화 완료")
     
-    @log_execution_time
     def analyze_market(self, symbol: str) -> Dict[str, Any]:
         """시장 분석"""
         try:
-            # 캔들 데이터 수집
-            spot_df = self.exchange.get_ohlcv(symbol, '1h', 100, 'spot')
-            futures_df = self.exchange.get_ohlcv(symbol, '1h', 100, 'future')
+            # 캔들 데이터 수집 (컬럼별 NumPy 배열)
+            spot = self.exchange.get_ohlcv_arrays(symbol, '1h', 100, 'spot')
+            futures = self.exchange.get_ohlcv_arrays(symbol, '1h', 100, 'future')
             
-            if spot_df.empty or futures_df.empty:
+            if not spot or not futures:
                 logger.warning(f"데이터 부족: {symbol}")
                 return {}
             
-            # 기술적 분석
-            spot_indicators = self.technical_analyzer.get_all_indicators(spot_df)
-            futures_indicators = self.technical_analyzer.get_all_indicators(futures_df)
+            # 프리미엄 분석
+            spot_price = float(spot['close'][-1])
+            futures_price = float(futures['close'][-1])
+            premium = (futures_price - spot_price) / spot_price
             
-            # 거래 신호 생성
-            spot_signals = self.technical_analyzer.generate_signals(spot_indicators)
-            futures_signals = self.technical_analyzer.generate_signals(futures_indicators)
+            return self._build_market_analysis(symbol, spot, futures, spot_price,
+                                               futures_price, premium, time.time_ns())
+        except Exception as e:
+            logger.error(f"시장 분석 실패 ({symbol}): {e}")
+            return {}
+    
+    @log_execution_time
+    def analyze_markets(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """여러 심볼 시장 일괄 분석
+        
+        캔들 조회와 지표/신호 계산은 스레드 풀에서 심볼별로 병렬 실행하고,
+        가격/프리미엄은 심볼 축 배열로 한 번에 계산한다.
+        """
+        if not symbols:
+            return []
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(symbols), self.max_concurrent_analysis)) as executor:
+                return self._analyze_markets_with(executor, symbols)
+        except Exception as e:
+            logger.error(f"시장 일괄 분석 실패: {e}")
+            return []
+    
+    def _analyze_markets_with(self, executor: ThreadPoolExecutor, symbols: List[str]) -> List[Dict[str, Any]]:
+        """스레드 풀을 사용한 여러 심볼 시장 분석"""
+        frames = []
+        for symbol, (spot, futures) in zip(symbols, executor.map(self._fetch_ohlcv_pair, symbols)):
+            if not spot or not futures:
+                logger.warning(f"데이터 부족: {symbol}")
+                continue
+            frames.append((symbol, spot, futures))
+        
+        if not frames:
+            return []
+            
+        # 프리미엄 분석 (심볼 축 벡터 연산)
+        count = len(frames)
+        spot_prices = np.fromiter((frame[1]['close'][-1] for frame in frames),
+                                  dtype=np.float64, count=count)
+        futures_prices = np.fromiter((frame[2]['close'][-1] for frame in frames),
+                                     dtype=np.float64, count=count)
+        premiums = (futures_prices - spot_prices) / spot_prices
+        
+        timestamp_ns = time.time_ns()
+        
+        def analyze(i: int) -> Dict[str, Any]:
+            symbol, spot, futures = frames[i]
+            try:
+                return self._build_market_analysis(
+                    symbol, spot, futures, float(spot_prices[i]),
+                    float(futures_prices[i]), float(premiums[i]), timestamp_ns
+                )
+            except Exception as e:
+                logger.error(f"시장 분석 실패 ({symbol}): {e}")
+                return {}
+        
+        return [result for result in executor.map(analyze, range(count)) if result]
+    
+    def _fetch_ohlcv_pair(self, symbol: str) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """현물/선물 캔들 배열 조회"""
+        spot = self.exchange.get_ohlcv_arrays(symbol, '1h', 100, 'spot')
+        futures = self.exchange.get_ohlcv_arrays(symbol, '1h', 100, 'future')
+        return spot, futures
+    
+    async def analyze_market_async(self, symbol: str) -> Dict[str, Any]:
+        """시장 분석 (현물/선물 캔들 동시 조회)"""
+        try:
+            spot, futures = await asyncio.gather(
+                self.exchange.get_ohlcv_arrays_async(symbol, '1h', 100, 'spot'),
+                self.exchange.get_ohlcv_arrays_async(symbol, '1h', 100, 'future')
+            )
             
-            # 시장 강도 분석
-            spot_strength = self.technical_analyzer.get_market_strength(spot_indicators)
-            futures_strength = self.technical_analyzer.get_market_strength(futures_indicators)
+            if not spot or not futures:
+                logger.warning(f"데이터 부족: {symbol}")
+                return {}
             
             # 프리미엄 분석
-            spot_price = spot_df['close'].iloc[-1]
-            futures_price = futures_df['close'].iloc[-1]
+            spot_price = float(spot['close'][-1])
+            futures_price = float(futures['close'][-1])
             premium = (futures_price - spot_price) / spot_price
             
-            return {
-                'symbol': symbol,
-                'spot_price': spot_price,
-                'futures_price': futures_price,
-                'premium': premium,
-                'spot_signals': spot_signals,
-                'futures_signals': futures_signals,
-                'spot_strength': spot_strength,
-                'futures_strength': futures_strength,
-                'timestamp': datetime.now()
-            }
+            # 지표 계산은 스레드 풀에서 실행
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._build_market_analysis, symbol, spot, futures,
+                spot_price, futures_price, premium, time.time_ns()
+            )
         except Exception as e:
             logger.error(f"시장 분석 실패 ({symbol}): {e}")
             return {}
     
-    @log_execution_time
-    def generate_trade_decision(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
-        """거래 결정 생성"""
+    async def analyze_markets_async(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """여러 심볼 시장 동시 분석 (거래소 요청 제한을 위해 동시 실행 수 제한)"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_analysis)
+        
+        async def analyze(symbol: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_market_async(symbol)
+        
+        results = await asyncio.gather(*(analyze(symbol) for symbol in symbols))
+        return [result for result in results if result]
+    
+    def _build_market_analysis(self, symbol: str, spot: Dict[str, np.ndarray], futures: Dict[str, np.ndarray],
+                               spot_price: float, futures_price: float, premium: float,
+                               timestamp_ns: int) -> Dict[str, Any]:
+        """지표/신호/시장 강도 계산 후 분석 결과 구성"""
+        spot_signals, spot_strength = self._get_signals(symbol, 'spot', spot)
+        futures_signals, futures_strength = self._get_signals(symbol, 'futures', futures)
+        
+        return {
+            'symbol': symbol,
+            'spot_price': spot_price,
+            'futures_price': futures_price,
+            'premium': premium,
+            'spot_signals': spot_signals,
+            'futures_signals': futures_signals,
+            'spot_strength': spot_strength,
+            'futures_strength': futures_strength,
+            'timestamp_ns': timestamp_ns
+        }
+    
+    def _get_signals(self, symbol: str, market: str,
+                     ohlcv: Dict[str, np.ndarray]) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """거래 신호/시장 강도 계산 (마지막 캔들이 같으면 캐시 결과 재사용)
+        
+        이전 캔들은 변하지 않으므로 마지막 캔들 시각과 종가가 같으면 지표 결과도 같다.
+        DataFrame은 지표를 다시 계산할 때만 생성한다.
+        """
+        close = ohlcv['close']
+        bar_time = int(ohlcv['timestamp'][-1])
+        last_close = float(close[-1])
+        cache_key = (symbol, market)
+        
+        cached = self._indicator_cache.get(cache_key)
+        if cached is not None and cached[0] == bar_time and cached[1] == last_close:
+            return cached[2], cached[3]
+        
+        # 기술적 분석 (지표 계산은 컬럼 접근만 사용하므로 시각 인덱스 변환 없이 배열을 감싼다)
+        frame = pd.DataFrame({'open': ohlcv['open'], 'high': ohlcv['high'], 'low': ohlcv['low'],
+                              'close': close, 'volume': ohlcv['volume']})
+        indicators = self.technical_analyzer.get_all_indicators(frame)
+        
+        # 거래 신호 생성 및 시장 강도 분석
+        signals = self.technical_analyzer.generate_signals(indicators)
+        strength = self.technical_analyzer.get_market_strength(indicators)
+        
+        self._indicator_cache[cache_key] = (bar_time, last_close, signals, strength)
+        return signals, strength
+    
+    def generate_trade_decision(self, market_data: Dict[str, Any], debug: bool = False) -> Dict[str, Any]:
+        """거래 결정 생성
+        
+        debug=True일 때만 현물/선물/하이브리드 중간 결정을 함께 반환한다.
+        """
         try:
             symbol = market_data['symbol']
             spot_signals = market_data.get('spot_signals', {})
             futures_signals = market_data.get('futures_signals', {})
             premium = market_data.get('premium', 0)
             
+            if not debug:
+                return {
+                    'symbol': symbol,
+                    'final_decision': self._compute_final(spot_signals, futures_signals, premium, symbol),
+                    'timestamp_ns': time.time_ns()
+                }
+            
             # 기본 거래 결정
             spot_decision = self._get_spot_decision(spot_signals, premium)
             futures_decision = self._get_futures_decision(futures_signals, premium)
@@ -103,236 +327,276 @@ class StrategyEngine:
                 'futures_decision': futures_decision,
                 'hybrid_decision': hybrid_decision,
                 'final_decision': final_decision,
-                'timestamp': datetime.now()
+                'timestamp_ns': time.time_ns()
             }
         except Exception as e:
             logger.error(f"거래 결정 생성 실패: {e}")
             return {}
     
-    def _get_spot_decision(self, signals: Dict[str, float], premium: float) -> Dict[str, Any]:
-        """현물 거래 결정"""
+    def _compute_final(self, spot_signals: Dict[str, float], futures_signals: Dict[str, float],
+                       premium: float, symbol: str) -> Dict[str, Any]:
+        """현물/선물 결정, 하이브리드 전략 선택, 리스크 조정을 한 번에 수행하여 최종 결정만 반환"""
+        premium = float(premium)
+        spot_action, spot_confidence, spot_size, _ = self._spot_decide(
+            float(spot_signals.get('combined_signal', 0)), premium
+        )
+        futures_action, futures_confidence, futures_size, futures_leverage = self._futures_decide(
+            float(futures_signals.get('combined_signal', 0)), premium
+        )
+        strategy = hybrid_select(premium, spot_action, spot_confidence, futures_action,
+                                 futures_confidence, self._arbitrage_threshold)
+        
+        spot_decision = {'action': ACTIONS[spot_action], 'confidence': spot_confidence,
+                         'size': spot_size, 'signals': spot_signals}
+        futures_decision = {'action': ACTIONS[futures_action], 'confidence': futures_confidence,
+                            'size': futures_size, 'leverage': futures_leverage, 'signals': futures_signals}
+        
+        hybrid_decision = self._dispatch_hybrid_strategy(strategy, spot_decision, futures_decision, premium)
+        return self._apply_risk_management(hybrid_decision, symbol)
+    
+    @log_execution_time
+    def generate_trade_decisions(self, market_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 심볼 거래 결정 일괄 생성
+        
+        현물/선물 결정과 프리미엄 조정을 심볼 축 배열 연산으로 계산하고,
+        하이브리드 전략 선택을 한 번의 커널 호출로 처리한다.
+        """
         try:
-            combined_signal = signals.get('combined_signal', 0)
-            
-            # 신호 강도에 따른 거래 결정
-            if combined_signal > 0.5:
-                action = 'buy'
-                confidence = min(combined_signal, 1.0)
-            elif combined_signal < -0.5:
-                action = 'sell'
-                confidence = min(abs(combined_signal), 1.0)
-            else:
-                action = 'hold'
-                confidence = 0
-            
-            # 프리미엄 고려
-            if premium > 0.02:  # 2% 이상 프리미엄
-                if action == 'buy':
-                    confidence *= 0.8  # 매수 신호 약화
-            elif premium < -0.02:  # 2% 이상 디스카운트
-                if action == 'sell':
-                    confidence *= 0.8  # 매도 신호 약화
-            
-            return {
-                'action': action,
-                'confidence': confidence,
-                'size': confidence * self.spot_allocation,
-                'signals': signals
-            }
+            market_data_list = [market_data for market_data in market_data_list if market_data]
+            if not market_data_list:
+                return []
+            
+            count = len(market_data_list)
+            premiums = np.fromiter((market_data.get('premium', 0) for market_data in market_data_list),
+                                   dtype=np.float64, count=count)
+            spot_signals = np.fromiter(
+                (market_data.get('spot_signals', {}).get('combined_signal', 0) for market_data in market_data_list),
+                dtype=np.float64, count=count
+            )
+            futures_signals = np.fromiter(
+                (market_data.get('futures_signals', {}).get('combined_signal', 0) for market_data in market_data_list),
+                dtype=np.float64, count=count
+            )
+            
+            # 현물/선물 거래 결정 일괄 계산
+            spot_actions, spot_confidences, spot_sizes, _ = decision_batch(
+                spot_signals, premiums, *self._spot_params
+            )
+            futures_actions, futures_confidences, futures_sizes, futures_leverages = decision_batch(
+                futures_signals, premiums, *self._futures_params
+            )
+            
+            spot_decisions = []
+            futures_decisions = []
+            for i, market_data in enumerate(market_data_list):
+                spot_decisions.append({
+                    'action': ACTIONS[spot_actions[i]],
+                    'confidence': float(spot_confidences[i]),
+                    'size': float(spot_sizes[i]),
+                    'signals': market_data.get('spot_signals', {})
+                })
+                futures_decisions.append({
+                    'action': ACTIONS[futures_actions[i]],
+                    'confidence': float(futures_confidences[i]),
+                    'size': float(futures_sizes[i]),
+                    'leverage': int(futures_leverages[i]),
+                    'signals': market_data.get('futures_signals', {})
+                })
+            
+            # 하이브리드 전략 일괄 선택
+            strategies = hybrid_select_batch(premiums, spot_actions, spot_confidences,
+                                             futures_actions, futures_confidences,
+                                             self._arbitrage_threshold)
+            
+            decisions = []
+            timestamp_ns = time.time_ns()
+            for i, market_data in enumerate(market_data_list):
+                symbol = market_data['symbol']
+                hybrid_decision = self._dispatch_hybrid_strategy(
+                    strategies[i], spot_decisions[i], futures_decisions[i], float(premiums[i])
+                )
+                decisions.append({
+                    'symbol': symbol,
+                    'spot_decision': spot_decisions[i],
+                    'futures_decision': futures_decisions[i],
+                    'hybrid_decision': hybrid_decision,
+                    'final_decision': self._apply_risk_management(hybrid_decision, symbol),
+                    'timestamp_ns': timestamp_ns
+                })
+            
+            return decisions
         except Exception as e:
-            logger.error(f"현물 거래 결정 실패: {e}")
-            return {'action': 'hold', 'confidence': 0, 'size': 0}
+            logger.error(f"거래 결정 일괄 생성 실패: {e}")
+            return []
+    
+    def _get_spot_decision(self, signals: Dict[str, float], premium: float) -> Dict[str, Any]:
+        """현물 거래 결정"""
+        # 신호 강도 및 프리미엄에 따른 거래 결정
+        action, confidence, size, _ = self._spot_decide(float(signals.get('combined_signal', 0)), float(premium))
+        
+        return {
+            'action': ACTIONS[action],
+            'confidence': confidence,
+            'size': size,
+            'signals': signals
+        }
     
     def _get_futures_decision(self, signals: Dict[str, float], premium: float) -> Dict[str, Any]:
         """선물 거래 결정"""
-        try:
-            combined_signal = signals.get('combined_signal', 0)
-            
-            # 신호 강도에 따른 거래 결정
-            if combined_signal > 0.5:
-                action = 'buy'
-                confidence = min(combined_signal, 1.0)
-            elif combined_signal < -0.5:
-                action = 'sell'
-                confidence = min(abs(combined_signal), 1.0)
-            else:
-                action = 'hold'
-                confidence = 0
-            
-            # 프리미엄 기회 활용
-            if premium > 0.03:  # 3% 이상 프리미엄
-                if action == 'sell':
-                    confidence *= 1.2  # 매도 신호 강화
-            elif premium < -0.03:  # 3% 이상 디스카운트
-                if action == 'buy':
-                    confidence *= 1.2  # 매수 신호 강화
-            
-            return {
-                'action': action,
-                'confidence': min(confidence, 1.0),
-                'size': min(confidence, 1.0) * self.futures_allocation,
-                'leverage': min(int(confidence * self.max_leverage), self.max_leverage),
-                'signals': signals
-            }
-        except Exception as e:
-            logger.error(f"선물 거래 결정 실패: {e}")
-            return {'action': 'hold', 'confidence': 0, 'size': 0, 'leverage': 1}
+        # 신호 강도 및 프리미엄 기회에 따른 거래 결정
+        action, confidence, size, leverage = self._futures_decide(
+            float(signals.get('combined_signal', 0)), float(premium)
+        )
+        
+        return {
+            'action': ACTIONS[action],
+            'confidence': confidence,
+            'size': size,
+            'leverage': leverage,
+            'signals': signals
+        }
     
     def _apply_hybrid_strategy(self, spot_decision: Dict[str, Any], 
                               futures_decision: Dict[str, Any], premium: float) -> Dict[str, Any]:
         """하이브리드 전략 적용"""
-        try:
-            # 아비트라지 기회 탐지
-            arbitrage_opportunity = self._detect_arbitrage_opportunity(premium)
-            
-            if arbitrage_opportunity:
-                return self._execute_arbitrage_strategy(spot_decision, futures_decision, premium)
-            
-            # 트렌드 following 전략
-            if spot_decision['action'] == futures_decision['action']:
-                return self._execute_trend_following(spot_decision, futures_decision)
-            
-            # 헤지 전략
-            if spot_decision['action'] != 'hold' and futures_decision['action'] != 'hold':
-                return self._execute_hedge_strategy(spot_decision, futures_decision)
-            
-            # 단일 시장 전략
-            if spot_decision['confidence'] > futures_decision['confidence']:
-                return {'strategy': 'spot_only', 'decision': spot_decision}
-            else:
-                return {'strategy': 'futures_only', 'decision': futures_decision}
-        
-        except Exception as e:
-            logger.error(f"하이브리드 전략 적용 실패: {e}")
-            return {'strategy': 'hold', 'decision': {'action': 'hold', 'size': 0}}
+        # 아비트라지 > 트렌드 following > 헤지 > 단일 시장 순으로 전략 선택
+        strategy = hybrid_select(
+            float(premium), ACTION_CODES[spot_decision['action']], float(spot_decision['confidence']),
+            ACTION_CODES[futures_decision['action']], float(futures_decision['confidence']),
+            self._arbitrage_threshold
+        )
+        return self._dispatch_hybrid_strategy(strategy, spot_decision, futures_decision, premium)
+    
+    def _dispatch_hybrid_strategy(self, strategy: int, spot_decision: Dict[str, Any],
+                                  futures_decision: Dict[str, Any], premium: float) -> Dict[str, Any]:
+        """선택된 전략 코드에 따른 하이브리드 결정 생성"""
+        if strategy == STRATEGY_ARBITRAGE:
+            return self._execute_arbitrage_strategy(spot_decision, futures_decision, premium)
+        if strategy == STRATEGY_TREND:
+            return self._execute_trend_following(spot_decision, futures_decision)
+        if strategy == STRATEGY_HEDGE:
+            return self._execute_hedge_strategy(spot_decision, futures_decision)
+        if strategy == STRATEGY_SPOT_ONLY:
+            return {'strategy': 'spot_only', 'decision': spot_decision}
+        return {'strategy': 'futures_only', 'decision': futures_decision}
     
     def _detect_arbitrage_opportunity(self, premium: float) -> bool:
         """아비트라지 기회 탐지"""
-        return abs(premium) > 0.05  # 5% 이상 가격차이
+        return abs(premium) > self._arbitrage_threshold
     
     def _execute_arbitrage_strategy(self, spot_decision: Dict[str, Any], 
                                   futures_decision: Dict[str, Any], premium: float) -> Dict[str, Any]:
         """아비트라지 전략 실행"""
-        try:
-            if premium > 0.05:  # 선물 가격이 높음
-                return {
-                    'strategy': 'arbitrage',
-                    'spot_action': 'buy',
-                    'futures_action': 'sell',
-                    'size': min(spot_decision['size'], futures_decision['size']),
-                    'expected_profit': premium
-                }
-            elif premium < -0.05:  # 현물 가격이 높음
-                return {
-                    'strategy': 'arbitrage',
-                    'spot_action': 'sell',
-                    'futures_action': 'buy',
-                    'size': min(spot_decision['size'], futures_decision['size']),
-                    'expected_profit': abs(premium)
-                }
-            else:
-                return {'strategy': 'hold', 'decision': {'action': 'hold', 'size': 0}}
-        except Exception as e:
-            logger.error(f"아비트라지 전략 실행 실패: {e}")
-            return {'strategy': 'hold', 'decision': {'action': 'hold', 'size': 0}}
+        if premium > self._arbitrage_threshold:  # 선물 가격이 높음
+            return {
+                'strategy': 'arbitrage',
+                'spot_action': 'buy',
+                'futures_action': 'sell',
+                'size': min(spot_decision['size'], futures_decision['size']),
+                'expected_profit': premium
+            }
+        elif premium < -self._arbitrage_threshold:  # 현물 가격이 높음
+            return {
+                'strategy': 'arbitrage',
+                'spot_action': 'sell',
+                'futures_action': 'buy',
+                'size': min(spot_decision['size'], futures_decision['size']),
+                'expected_profit': abs(premium)
+            }
+        else:
+            return {'strategy': _HOLD['strategy'], 'decision': dict(_HOLD['decision'])}
     
     def _execute_trend_following(self, spot_decision: Dict[str, Any], 
                                futures_decision: Dict[str, Any]) -> Dict[str, Any]:
         """트렌드 추종 전략"""
-        try:
-            combined_confidence = (spot_decision['confidence'] + futures_decision['confidence']) / 2
-            
-            return {
-                'strategy': 'trend_following',
-                'spot_action': spot_decision['action'],
-                'futures_action': futures_decision['action'],
-                'spot_size': spot_decision['size'],
-                'futures_size': futures_decision['size'],
-                'combined_confidence': combined_confidence
-            }
-        except Exception as e:
-            logger.error(f"트렌드 추종 전략 실행 실패: {e}")
-            return {'strategy': 'hold', 'decision': {'action': 'hold', 'size': 0}}
+        combined_confidence = (spot_decision['confidence'] + futures_decision['confidence']) / 2
+        
+        return {
+            'strategy': 'trend_following',
+            'spot_action': spot_decision['action'],
+            'futures_action': futures_decision['action'],
+            'spot_size': spot_decision['size'],
+            'futures_size': futures_decision['size'],
+            'combined_confidence': combined_confidence
+        }
     
     def _execute_hedge_strategy(self, spot_decision: Dict[str, Any], 
                               futures_decision: Dict[str, Any]) -> Dict[str, Any]:
         """헤지 전략"""
-        try:
-            # 주요 포지션 결정
-            if spot_decision['confidence'] > futures_decision['confidence']:
-                main_decision = spot_decision
-                hedge_decision = futures_decision
-                main_market = 'spot'
-            else:
-                main_decision = futures_decision
-                hedge_decision = spot_decision
-                main_market = 'futures'
-            
-            # 헤지 비율 적용
-            hedge_size = main_decision['size'] * self.hedge_ratio
-            
-            return {
-                'strategy': 'hedge',
-                'main_market': main_market,
-                'main_action': main_decision['action'],
-                'main_size': main_decision['size'],
-                'hedge_action': 'sell' if main_decision['action'] == 'buy' else 'buy',
-                'hedge_size': hedge_size,
-                'hedge_ratio': self.hedge_ratio
-            }
-        except Exception as e:
-            logger.error(f"헤지 전략 실행 실패: {e}")
-            return {'strategy': 'hold', 'decision': {'action': 'hold', 'size': 0}}
+        # 주요 포지션 결정
+        if spot_decision['confidence'] > futures_decision['confidence']:
+            main_decision = spot_decision
+            hedge_decision = futures_decision
+            main_market = 'spot'
+        else:
+            main_decision = futures_decision
+            hedge_decision = spot_decision
+            main_market = 'futures'
+        
+        # 헤지 비율 적용
+        hedge_size = main_decision['size'] * self.hedge_ratio
+        
+        return {
+            'strategy': 'hedge',
+            'main_market': main_market,
+            'main_action': main_decision['action'],
+            'main_size': main_decision['size'],
+            'hedge_action': 'sell' if main_decision['action'] == 'buy' else 'buy',
+            'hedge_size': hedge_size,
+            'hedge_ratio': self.hedge_ratio
+        }
     
     def _apply_risk_management(self, decision: Dict[str, Any], symbol: str) -> Dict[str, Any]:
         """리스크 관리 적용"""
-        try:
-            # 포지션 크기 조정
-            if 'size' in decision:
-                decision['size'] = min(decision['size'], self.risk_per_trade)
-            
-            # 최대 레버리지 제한
-            if 'leverage' in decision:
-                decision['leverage'] = min(decision['leverage'], self.max_leverage)
-            
-            # 기존 포지션 고려
-            if symbol in self.positions:
-                current_position = self.positions[symbol]
-                decision = self._adjust_for_existing_position(decision, current_position)
-            
-            return decision
-        except Exception as e:
-            logger.error(f"리스크 관리 적용 실패: {e}")
-            return decision
+        # 포지션 크기 조정
+        if 'size' in decision:
+            decision['size'] = min(decision['size'], self.risk_per_trade)
+        
+        # 최대 레버리지 제한
+        if 'leverage' in decision:
+            decision['leverage'] = min(decision['leverage'], self.max_leverage)
+        
+        # 기존 포지션 고려
+        if symbol in self.positions:
+            current_position = self.positions[symbol]
+            decision = self._adjust_for_existing_position(decision, current_position)
+        
+        return decision
     
     def _adjust_for_existing_position(self, decision: Dict[str, Any], 
-                                    current_position: Dict[str, Any]) -> Dict[str, Any]:
+                                    current_position: Position) -> Dict[str, Any]:
         """기존 포지션에 따른 조정"""
-        try:
-            # 포지션 크기 제한
-            total_exposure = current_position.get('size', 0) + decision.get('size', 0)
-            if total_exposure > self.risk_per_trade * 3:  # 최대 3배까지
-                decision['size'] = max(0, self.risk_per_trade * 3 - current_position.get('size', 0))
-            
-            return decision
-        except Exception as e:
-            logger.error(f"기존 포지션 조정 실패: {e}")
-            return decision
+        # 포지션 크기 제한 (최대 risk_per_trade의 3배까지)
+        current_size = current_position.size
+        max_exposure = self._max_exposure
+        if current_size + decision.get('size', 0) > max_exposure:
+            decision['size'] = max(0, max_exposure - current_size)
+        
+        return decision
     
-    @log_execution_time
     def should_rebalance(self) -> bool:
-        """리밸런싱 필요 여부 확인"""
+        """리밸런싱 필요 여부 확인 (필요하면 리밸런싱 시각을 기록해 다음 주기를 시작)"""
+        if self._needs_rebalance():
+            self.mark_rebalanced()
+            return True
+        return False
+    
+    def _needs_rebalance(self) -> bool:
+        """시간/비율 기준 리밸런싱 조건 확인"""
         try:
-            if not self.last_rebalance:
+            if self._last_rebalance_ts is None:
                 return True
             
             # 시간 기준 리밸런싱 (6시간마다)
-            if datetime.now() - self.last_rebalance > timedelta(hours=6):
+            if time.monotonic() - self._last_rebalance_ts > self._REBALANCE_INTERVAL:
                 return True
             
-            # 포트폴리오 비율 변화 확인
-            spot_balance = self.exchange.get_spot_balance()
-            futures_balance = self.exchange.get_futures_balance()
+            # 포트폴리오 비율 변화 확인 (현물/선물 잔고 동시 조회)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                spot_future = executor.submit(self.exchange.get_spot_balance)
+                futures_future = executor.submit(self.exchange.get_futures_balance)
+                spot_balance = spot_future.result()
+                futures_balance = futures_future.result()
             
             total_balance = spot_balance.get('total', {}).get('USDT', 0) + \
                            futures_balance.get('total', {}).get('USDT', 0)
@@ -349,29 +613,54 @@ class StrategyEngine:
             logger.error(f"리밸런싱 확인 실패: {e}")
             return False
     
+    def mark_rebalanced(self):
+        """리밸런싱 완료 시각 기록"""
+        self._last_rebalance_ts = time.monotonic()
+    
     def update_position(self, symbol: str, position_data: Dict[str, Any]):
         """포지션 업데이트"""
         try:
-            self.positions[symbol] = position_data
+            position = Position.from_dict(position_data)
+            self.positions[symbol] = position
+            
+            row = self._pos_rows.get(symbol)
+            if row is None:
+                row = self._allocate_position_row(symbol)
+            self._pos_size[row] = position.size
+            self._pos_unrealized[row] = position.unrealized_pnl
+            self._pos_realized[row] = position.realized_pnl
             logger.info(f"포지션 업데이트: {symbol} - {position_data}")
         except Exception as e:
             logger.error(f"포지션 업데이트 실패: {e}")
     
+    def _allocate_position_row(self, symbol: str) -> int:
+        """포지션 SoA 배열 행 할당 (용량 초과 시 2배 확장)"""
+        row = len(self._pos_symbols)
+        if row == len(self._pos_size):
+            for field in self._POS_FIELDS:
+                array = getattr(self, field)
+                setattr(self, field, np.concatenate((array, np.zeros_like(array))))
+        
+        group = symbol.split('/')[0]
+        group_id = self._group_ids.get(group)
+        if group_id is None:
+            group_id = len(self._group_names)
+            self._group_ids[group] = group_id
+            self._group_names.append(group)
+        
+        self._pos_rows[symbol] = row
+        self._pos_symbols.append(symbol)
+        self._pos_group_id[row] = group_id
+        return row
+    
     def get_strategy_performance(self) -> Dict[str, Any]:
         """전략 성과 조회"""
         try:
-            total_pnl = 0
-            winning_trades = 0
-            losing_trades = 0
-            
-            for symbol, position in self.positions.items():
-                pnl = position.get('unrealized_pnl', 0) + position.get('realized_pnl', 0)
-                total_pnl += pnl
-                
-                if pnl > 0:
-                    winning_trades += 1
-                elif pnl < 0:
-                    losing_trades += 1
+            count = len(self._pos_symbols)
+            pnl = self._pos_unrealized[:count] + self._pos_realized[:count]
+            total_pnl = float(pnl.sum())
+            winning_trades = int((pnl > 0).sum())
+            losing_trades = int((pnl < 0).sum())
             
             total_trades = winning_trades + losing_trades
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
@@ -382,18 +671,40 @@ class StrategyEngine:
                 'winning_trades': winning_trades,
                 'losing_trades': losing_trades,
                 'win_rate': win_rate,
-                'active_positions': len(self.positions)
+                'active_positions': len(self.positions),
+                'group_pnl': self._aggregate_group_pnl(pnl, self._pos_group_id[:count])
             }
         except Exception as e:
             logger.error(f"전략 성과 조회 실패: {e}")
             return {}
     
+    def _aggregate_group_pnl(self, pnl: np.ndarray, group_ids: np.ndarray) -> Dict[str, float]:
+        """심볼 그룹별 손익 합계 (그룹 정렬 후 np.add.reduceat 단일 집계)"""
+        if pnl.size == 0:
+            return {}
+        
+        order = np.argsort(group_ids, kind='stable')
+        sorted_groups = group_ids[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_groups)) + 1))
+        group_totals = np.add.reduceat(pnl[order], starts)
+        
+        group_names = self._group_names
+        return {group_names[group_id]: float(total)
+                for group_id, total in zip(sorted_groups[starts], group_totals)}
+    
     def reset_strategy(self):
         """전략 상태 초기화"""
         try:
             self.positions.clear()
+            self._pos_rows.clear()
+            self._pos_symbols.clear()
+            self._group_ids.clear()
+            self._group_names.clear()
+            for field in self._POS_FIELDS:
+                getattr(self, field).fill(0.0)
             self.last_signals.clear()
-            self.last_rebalance = None
+            self._last_rebalance_ts = None
+            self._indicator_cache.clear()
             logger.info("전략 상태 초기화 완료")
         except Exception as e:
             logger.error(f"전략 상태 초기화 실패: {e}")
\ No newline at end of file
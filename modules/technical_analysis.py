@@ -1,17 +1,69 @@
 """
 기술적 분석 모듈
 """
+import os
+import threading
 import pandas as pd
 import numpy as np
 import talib
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from utils.logger import logger
-from utils.decorators import cache_result, log_execution_time
+from utils.decorators import log_execution_time
+from utils._njit import NUMBA_AVAILABLE
+from ._ta_kernels import (
+    _all_indicators, _all_indicators_batch, _rsi_wilder, _obv_vwap, _smas_emas, MA_PERIODS,
+    RSI, MACD, MACD_SIGNAL, MACD_HIST, BB_UPPER, BB_MIDDLE, BB_LOWER, ATR, SLOWK, SLOWD, WILLR,
+    VWAP, SMA_BASE, EMA_BASE
+)
+from ._talib_ctypes import (
+    TALIB_CTYPES_AVAILABLE, all_indicators_ctypes, all_indicators_batch_ctypes, rsi_wilder_ctypes
+)
+from .incremental_indicators import IncrementalEMA, IncrementalRSI, IncrementalMACD, IncrementalBB
+
+# numba 미설치 시 순수 파이썬 커널 대신 TA-Lib C 함수 직접 호출 (TALIB_CTYPES_DISABLED=1이면 사용 안 함)
+if not NUMBA_AVAILABLE and TALIB_CTYPES_AVAILABLE and os.getenv('TALIB_CTYPES_DISABLED') != '1':
+    _all_indicators = all_indicators_ctypes
+    _all_indicators_batch = all_indicators_batch_ctypes
+    _rsi_wilder = rsi_wilder_ctypes
+
+
+# 지표 입력 타입 (get_all_indicators는 변환된 ndarray를 직접 전달)
+ArrayLike = Union[pd.Series, np.ndarray]
+
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """Series/ndarray를 연속 float64 배열로 변환 (이미 float64면 복사 없음)"""
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype=np.float64, copy=False)
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _index_of(values: ArrayLike) -> Optional[pd.Index]:
+    """결과 Series 인덱스 (ndarray 입력이면 기본 인덱스)"""
+    return values.index if isinstance(values, pd.Series) else None
+
+
+def _constant_series(length: int, value: float) -> pd.Series:
+    """상수 float64 Series 생성 (데이터 부족/오류 시 기본값)"""
+    return pd.Series(np.full(length, value, dtype=np.float64))
+
+
+def _last_value(values: ArrayLike, default: float) -> float:
+    """마지막 값 위치 기반 조회 (Series는 라벨 조회 없이 iat 사용)"""
+    if len(values) == 0:
+        return default
+    return float(values.iat[-1] if isinstance(values, pd.Series) else values[-1])
 
 
 class TechnicalAnalyzer:
     """기술적 분석 클래스"""
     
+    _SIGNAL_KEYS = ('rsi_signal', 'macd_signal', 'bb_signal', 'stoch_signal', 'combined_signal')
+    
+    # 임계값 비교 레인 (RSI, 볼린저 밴드, 스토캐스틱)과 신호 배열 내 위치
+    _LANE_SLOTS = np.array([0, 2, 3])
+    _INCLUSIVE_LANES = np.array([False, True, False])
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.rsi_period = config.get('rsi_period', 14)
@@ -22,43 +74,54 @@ class TechnicalAnalyzer:
         self.macd_signal = config.get('macd_signal', 9)
         self.bb_period = config.get('bb_period', 20)
         self.bb_stddev = config.get('bb_stddev', 2)
+        self._param_tuple = (self.rsi_period, self.macd_fast, self.macd_slow,
+                             self.macd_signal, self.bb_period, self.bb_stddev)
+        
+        # 지표별 최소 데이터 길이 (미만이면 기본값 반환)
+        self._rsi_min_len = self.rsi_period + 10
+        self._macd_min_len = max(self.macd_slow, self.macd_signal) + 20
+        
+        # 지표 커널 파라미터 (rsi, macd 3개, bb 2개, atr, 스토캐스틱 2개)
+        self._kernel_params = (self.rsi_period, self.macd_fast, self.macd_slow, self.macd_signal,
+                               self.bb_period, float(self.bb_stddev), 14, 14, 3)
+        
+        # 지표 캐시 (마지막 캔들 지문 -> 지표 결과)
+        self.indicator_cache_size = config.get('indicator_cache_size', 128)
+        self._indicator_cache = {}
+        self._cache_lock = threading.Lock()
+        
+        # 심볼별 상태형 지표 (심볼 -> (마지막 확정 캔들 시각, 지표 상태))
+        self._incremental = {}
     
-    @log_execution_time
-    def calculate_rsi(self, prices: pd.Series) -> pd.Series:
+    def calculate_rsi(self, prices: ArrayLike) -> pd.Series:
         """RSI 계산"""
         try:
-            if len(prices) < self.rsi_period + 10:
-                logger.warning(f"RSI 계산용 데이터 부족: {len(prices)} < {self.rsi_period + 10}")
-                return pd.Series([50] * len(prices))
-            
-            # 데이터 타입 확인 및 변환
-            price_values = prices.values.astype(float)
-            rsi_values = talib.RSI(price_values, timeperiod=self.rsi_period)
+            if len(prices) < self._rsi_min_len:
+                logger.warning(f"RSI 계산용 데이터 부족: {len(prices)} < {self._rsi_min_len}")
+                return _constant_series(len(prices), 50.0)
             
-            # NaN 값 처리
-            rsi_series = pd.Series(rsi_values)
-            rsi_series = rsi_series.fillna(50)
+            # 복사 없이 연속 float64 배열로 변환 (워밍업 구간은 커널이 50으로 채움)
+            price_values = _as_float_array(prices)
+            rsi_values = _rsi_wilder(price_values, self.rsi_period, np.empty_like(price_values))
             
-            return rsi_series
+            return pd.Series(rsi_values, index=_index_of(prices))
         except Exception as e:
             logger.error(f"RSI 계산 오류: {e}")
-            return pd.Series([50] * len(prices))
+            return _constant_series(len(prices), 50.0)
     
-    @log_execution_time 
-    def calculate_macd(self, prices: pd.Series) -> Dict[str, pd.Series]:
+    def calculate_macd(self, prices: ArrayLike) -> Dict[str, pd.Series]:
         """MACD 계산"""
         try:
-            min_length = max(self.macd_slow, self.macd_signal) + 20
-            if len(prices) < min_length:
-                logger.warning(f"MACD 계산용 데이터 부족: {len(prices)} < {min_length}")
+            if len(prices) < self._macd_min_len:
+                logger.warning(f"MACD 계산용 데이터 부족: {len(prices)} < {self._macd_min_len}")
                 return {
-                    'macd': pd.Series([0] * len(prices)),
-                    'signal': pd.Series([0] * len(prices)),
-                    'histogram': pd.Series([0] * len(prices))
+                    'macd': _constant_series(len(prices), 0.0),
+                    'signal': _constant_series(len(prices), 0.0),
+                    'histogram': _constant_series(len(prices), 0.0)
                 }
             
             # 데이터 타입 확인 및 변환
-            price_values = prices.values.astype(float)
+            price_values = _as_float_array(prices)
             macd_line, macd_signal, macd_histogram = talib.MACD(
                 price_values, 
                 fastperiod=self.macd_fast,
@@ -66,35 +129,38 @@ class TechnicalAnalyzer:
                 signalperiod=self.macd_signal
             )
             
-            # NaN 값 처리
+            # NaN 값 처리 (제자리 변환, Series는 복사 없이 래핑만)
             return {
-                'macd': pd.Series(macd_line).fillna(0),
-                'signal': pd.Series(macd_signal).fillna(0),
-                'histogram': pd.Series(macd_histogram).fillna(0)
+                'macd': pd.Series(np.nan_to_num(macd_line, copy=False, nan=0.0), index=_index_of(prices)),
+                'signal': pd.Series(np.nan_to_num(macd_signal, copy=False, nan=0.0), index=_index_of(prices)),
+                'histogram': pd.Series(np.nan_to_num(macd_histogram, copy=False, nan=0.0), index=_index_of(prices))
             }
         except Exception as e:
             logger.error(f"MACD 계산 오류: {e}")
             return {
-                'macd': pd.Series([0] * len(prices)),
-                'signal': pd.Series([0] * len(prices)),
-                'histogram': pd.Series([0] * len(prices))
+                'macd': _constant_series(len(prices), 0.0),
+                'signal': _constant_series(len(prices), 0.0),
+                'histogram': _constant_series(len(prices), 0.0)
             }
     
-    @log_execution_time
-    def calculate_bollinger_bands(self, prices: pd.Series) -> Dict[str, pd.Series]:
+    def calculate_bollinger_bands(self, prices: ArrayLike) -> Dict[str, pd.Series]:
         """볼린저 밴드 계산"""
         try:
+            price_values = _as_float_array(prices)
             upper, middle, lower = talib.BBANDS(
-                prices.values,
+                price_values,
                 timeperiod=self.bb_period,
                 nbdevup=self.bb_stddev,
                 nbdevdn=self.bb_stddev,
                 matype=0
             )
+            
+            # 워밍업 구간은 해당 시점 가격으로 채움 (오류 시 기본값과 동일)
+            warmup = np.isnan(upper)
             return {
-                'upper': pd.Series(upper),
-                'middle': pd.Series(middle),
-                'lower': pd.Series(lower)
+                'upper': pd.Series(np.where(warmup, price_values, upper), index=_index_of(prices)),
+                'middle': pd.Series(np.where(warmup, price_values, middle), index=_index_of(prices)),
+                'lower': pd.Series(np.where(warmup, price_values, lower), index=_index_of(prices))
             }
         except Exception as e:
             logger.error(f"볼린저 밴드 계산 오류: {e}")
@@ -104,221 +170,382 @@ class TechnicalAnalyzer:
                 'lower': pd.Series(prices)
             }
     
-    @log_execution_time
-    def calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_atr(self, high: ArrayLike, low: ArrayLike, close: ArrayLike, period: int = 14) -> np.ndarray:
         """ATR (Average True Range) 계산"""
         try:
-            return talib.ATR(high.values, low.values, close.values, timeperiod=period)
+            return talib.ATR(_as_float_array(high), _as_float_array(low), _as_float_array(close), timeperiod=period)
         except Exception as e:
             logger.error(f"ATR 계산 오류: {e}")
-            return pd.Series([0.01] * len(close))
+            return _constant_series(len(close), 0.01)
     
-    @log_execution_time
-    def calculate_stochastic(self, high: pd.Series, low: pd.Series, close: pd.Series) -> Dict[str, pd.Series]:
+    def calculate_stochastic(self, high: ArrayLike, low: ArrayLike, close: ArrayLike) -> Dict[str, pd.Series]:
         """스토캐스틱 계산"""
         try:
             slowk, slowd = talib.STOCH(
-                high.values, low.values, close.values,
+                _as_float_array(high), _as_float_array(low), _as_float_array(close),
                 fastk_period=14, slowk_period=3, slowk_matype=0,
                 slowd_period=3, slowd_matype=0
             )
             return {
-                'slowk': pd.Series(slowk),
-                'slowd': pd.Series(slowd)
+                'slowk': pd.Series(slowk, index=_index_of(close)),
+                'slowd': pd.Series(slowd, index=_index_of(close))
             }
         except Exception as e:
             logger.error(f"스토캐스틱 계산 오류: {e}")
             return {
-                'slowk': pd.Series([50] * len(close)),
-                'slowd': pd.Series([50] * len(close))
+                'slowk': _constant_series(len(close), 50.0),
+                'slowd': _constant_series(len(close), 50.0)
             }
     
-    @log_execution_time
-    def calculate_williams_r(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_williams_r(self, high: ArrayLike, low: ArrayLike, close: ArrayLike, period: int = 14) -> np.ndarray:
         """Williams %R 계산"""
         try:
-            return talib.WILLR(high.values, low.values, close.values, timeperiod=period)
+            return talib.WILLR(_as_float_array(high), _as_float_array(low), _as_float_array(close), timeperiod=period)
         except Exception as e:
             logger.error(f"Williams %R 계산 오류: {e}")
-            return pd.Series([-50] * len(close))
+            return _constant_series(len(close), -50.0)
     
-    @log_execution_time
-    def calculate_volume_indicators(self, prices: pd.Series, volume: pd.Series) -> Dict[str, pd.Series]:
+    def calculate_volume_indicators(self, prices: ArrayLike, volume: ArrayLike) -> Dict[str, pd.Series]:
         """거래량 지표 계산"""
         try:
-            # OBV (On-Balance Volume)
-            obv = talib.OBV(prices.values, volume.values)
-            
-            # VWAP (Volume Weighted Average Price)
-            vwap = (prices * volume).cumsum() / volume.cumsum()
+            # OBV (On-Balance Volume) / VWAP (Volume Weighted Average Price) 단일 패스
+            price_values = _as_float_array(prices)
+            volume_values = _as_float_array(volume)
+            obv = np.empty_like(price_values)
+            vwap = np.empty_like(price_values)
+            _obv_vwap(price_values, volume_values, obv, vwap)
             
             return {
-                'obv': pd.Series(obv),
-                'vwap': pd.Series(vwap)
+                'obv': pd.Series(obv, index=_index_of(prices)),
+                'vwap': pd.Series(vwap, index=_index_of(prices))
             }
         except Exception as e:
             logger.error(f"거래량 지표 계산 오류: {e}")
             return {
-                'obv': pd.Series([0] * len(prices)),
+                'obv': _constant_series(len(prices), 0.0),
                 'vwap': pd.Series(prices)
             }
     
-    @log_execution_time
-    def calculate_moving_averages(self, prices: pd.Series) -> Dict[str, pd.Series]:
-        """이동평균 계산"""
+    def calculate_moving_averages(self, prices: ArrayLike) -> Dict[str, pd.Series]:
+        """이동평균 계산 (SMA/EMA 8개를 하나의 (8, n) 배열에 한 번에 계산)"""
         try:
-            return {
-                'sma_5': talib.SMA(prices.values, timeperiod=5),
-                'sma_10': talib.SMA(prices.values, timeperiod=10),
-                'sma_20': talib.SMA(prices.values, timeperiod=20),
-                'sma_50': talib.SMA(prices.values, timeperiod=50),
-                'ema_5': talib.EMA(prices.values, timeperiod=5),
-                'ema_10': talib.EMA(prices.values, timeperiod=10),
-                'ema_20': talib.EMA(prices.values, timeperiod=20),
-                'ema_50': talib.EMA(prices.values, timeperiod=50)
-            }
+            price_values = _as_float_array(prices)
+            out = _smas_emas(price_values, np.empty((2 * len(MA_PERIODS), len(price_values))))
+            
+            # 행 뷰만 반환 (복사 없음)
+            ma = {}
+            for j, period in enumerate(MA_PERIODS):
+                ma[f'sma_{period}'] = out[j]
+            for j, period in enumerate(MA_PERIODS):
+                ma[f'ema_{period}'] = out[len(MA_PERIODS) + j]
+            return ma
         except Exception as e:
             logger.error(f"이동평균 계산 오류: {e}")
             return {}
     
-    @cache_result(cache_time=300)
-    def get_all_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """모든 지표 계산"""
+    def _create_incremental_states(self) -> Dict[str, Any]:
+        """상태형 지표 세트 생성"""
+        states = {
+            'rsi': IncrementalRSI(self.rsi_period),
+            'macd': IncrementalMACD(self.macd_fast, self.macd_slow, self.macd_signal),
+            'bb': IncrementalBB(self.bb_period, self.bb_stddev)
+        }
+        for period in MA_PERIODS:
+            states[f'ema_{period}'] = IncrementalEMA(period)
+        return states
+    
+    def update_incremental(self, symbol: str, timestamps: np.ndarray, close: np.ndarray) -> Dict[str, Any]:
+        """심볼별 상태형 지표 갱신 (사이클당 지표별 O(1))
+        
+        처음 호출 시 확정 캔들 전체로 워밍업하고, 이후에는 마지막 확정 캔들 이후의 새 캔들만
+        반영한다. 진행 중인 마지막 캔들은 상태를 바꾸지 않고 현재 종가로 값을 계산한다.
+        마지막 반영 시점보다 오래된(짧은) 이력이 들어오면 상태와 반영 시점을 그대로 둔다.
+        
+        IncrementalMACD는 get_all_indicators의 MACD와 초기값 방식이 달라 값이 다를 수 있으므로
+        아직 신호 생성 경로(StrategyEngine)에서는 사용하지 않는다.
+        """
         try:
-            indicators = {}
-            
-            # 기본 지표
-            indicators['rsi'] = self.calculate_rsi(df['close'])
-            indicators['macd'] = self.calculate_macd(df['close'])
-            indicators['bb'] = self.calculate_bollinger_bands(df['close'])
-            indicators['atr'] = self.calculate_atr(df['high'], df['low'], df['close'])
-            indicators['stoch'] = self.calculate_stochastic(df['high'], df['low'], df['close'])
-            indicators['williams_r'] = self.calculate_williams_r(df['high'], df['low'], df['close'])
+            if len(close) == 0:
+                return {}
+            close = np.ascontiguousarray(close, dtype=np.float64)
             
-            # 거래량 지표
-            if 'volume' in df.columns:
-                indicators['volume'] = self.calculate_volume_indicators(df['close'], df['volume'])
+            entry = self._incremental.get(symbol)
+            start = 0
+            if entry is not None:
+                start = int(np.searchsorted(timestamps, entry[0], side='right'))
+            rebuilt = entry is None or start == 0
+            if rebuilt:
+                # 첫 호출이거나 이력이 이어지지 않으면 처음부터 워밍업
+                states = self._create_incremental_states()
+                start = 0
+            else:
+                states = entry[1]
             
-            # 이동평균
-            indicators['ma'] = self.calculate_moving_averages(df['close'])
+            closed = close[start:-1]
+            if len(closed) > 0:
+                for state in states.values():
+                    state.warmup(closed)
+            # 반영 시점은 앞으로만 이동 (오래된 이력으로 되돌리면 다음 호출에서 캔들이 중복 반영됨)
+            if len(close) > 1 and (rebuilt or timestamps[-2] > entry[0]):
+                self._incremental[symbol] = (timestamps[-2], states)
             
-            return indicators
+            price = close[-1]
+            macd, signal, histogram = states['macd'].peek(price)
+            upper, middle, lower = states['bb'].peek(price)
+            result = {
+                'rsi': states['rsi'].peek(price),
+                'macd': {'macd': macd, 'signal': signal, 'histogram': histogram},
+                'bb': {'upper': upper, 'middle': middle, 'lower': lower}
+            }
+            for period in MA_PERIODS:
+                result[f'ema_{period}'] = states[f'ema_{period}'].peek(price)
+            return result
+        except Exception as e:
+            logger.error(f"상태형 지표 갱신 오류 ({symbol}): {e}")
+            return {}
+    
+    def reset_incremental(self, symbol: Optional[str] = None):
+        """상태형 지표 초기화 (symbol이 없으면 전체)"""
+        if symbol is None:
+            self._incremental.clear()
+        else:
+            self._incremental.pop(symbol, None)
+    
+    def _frame_key(self, df: pd.DataFrame) -> Optional[tuple]:
+        """캐시 키 생성 (마지막 캔들 지문 + 지표 파라미터, O(1))"""
+        if len(df) == 0 or 'close' not in df.columns:
+            return None
+        close = df['close']
+        last_volume = df['volume'].iat[-1] if 'volume' in df.columns else None
+        return (df.index[-1], len(df), close.iat[0], close.iat[-1],
+                df['high'].iat[-1], df['low'].iat[-1], last_volume, self._param_tuple)
+    
+    @log_execution_time
+    def get_all_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """모든 지표 계산 (같은 캔들이면 캐시 결과 반환)
+        
+        DataFrame 전체를 해싱하지 않고 길이, 마지막 인덱스, 첫/마지막 가격으로
+        지문을 만든다. 폴링 주기가 캔들보다 짧을 때 같은 캔들의 재계산을 피한다.
+        """
+        key = self._safe_frame_key(df)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        indicators = self._compute_all_indicators(df)
+        self._cache_put(key, indicators)
+        return indicators
+    
+    @log_execution_time
+    def get_all_indicators_batch(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """여러 심볼 지표 일괄 계산 (심볼 -> 지표 딕셔너리)
+        
+        캐시에 없는 심볼을 캔들 수별로 묶어 2차원 배열로 쌓고, 묶음마다 병렬 커널을
+        한 번 호출한다. 결과는 심볼별 get_all_indicators와 같으며 캐시도 공유한다.
+        """
+        results = {}
+        groups = {}  # 캔들 수 -> [(심볼, 캐시 키, DataFrame)]
+        for symbol, df in frames.items():
+            key = self._safe_frame_key(df)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                groups.setdefault(len(df), []).append((symbol, key, df))
+        
+        for group in groups.values():
+            try:
+                inputs = [self._kernel_inputs(df) for _, _, df in group]
+                stacked = [np.stack([row[i] for row in inputs]) for i in range(4)]
+                out, obv = _all_indicators_batch(*stacked, *self._kernel_params)
+                for s, (symbol, key, df) in enumerate(group):
+                    close, _, _, _, has_volume = inputs[s]
+                    results[symbol] = self._build_indicators(out[s], obv[s], close, df.index, has_volume)
+                    self._cache_put(key, results[symbol])
+            except Exception as e:
+                logger.error(f"지표 일괄 계산 오류: {e}")
+                for symbol, key, df in group:
+                    results[symbol] = self._compute_all_indicators(df)
+                    self._cache_put(key, results[symbol])
+        return results
+    
+    def _safe_frame_key(self, df: pd.DataFrame) -> Optional[tuple]:
+        """캐시 키 생성 (실패 시 None, 캐시 미사용)"""
+        try:
+            return self._frame_key(df)
+        except Exception as e:
+            logger.error(f"지표 캐시 키 생성 오류: {e}")
+            return None
+    
+    def _cache_get(self, key: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        """지표 캐시 조회"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            return self._indicator_cache.get(key)
+    
+    def _cache_put(self, key: Optional[tuple], indicators: Dict[str, Any]):
+        """지표 캐시 저장 (빈 결과는 저장하지 않음)"""
+        if key is None or not indicators:
+            return
+        with self._cache_lock:
+            if len(self._indicator_cache) >= self.indicator_cache_size:
+                # 가장 오래된 항목 제거 (삽입 순서 유지)
+                self._indicator_cache.pop(next(iter(self._indicator_cache)))
+            self._indicator_cache[key] = indicators
+    
+    @staticmethod
+    def _kernel_inputs(df: pd.DataFrame) -> tuple:
+        """커널 입력 배열 (close, high, low, volume, 거래량 컬럼 유무)"""
+        close = _as_float_array(df['close'])
+        high = _as_float_array(df['high'])
+        low = _as_float_array(df['low'])
+        has_volume = 'volume' in df.columns
+        if has_volume:
+            volume = _as_float_array(df['volume'])
+        else:
+            volume = np.zeros_like(close)
+        return close, high, low, volume, has_volume
+    
+    def _compute_all_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """모든 지표 계산 (단일 패스 커널)"""
+        try:
+            close, high, low, volume, has_volume = self._kernel_inputs(df)
+            out, obv = _all_indicators(close, high, low, volume, *self._kernel_params)
+            return self._build_indicators(out, obv, close, df.index, has_volume)
         except Exception as e:
             logger.error(f"지표 계산 오류: {e}")
             return {}
     
+    def _build_indicators(self, out: np.ndarray, obv: np.ndarray, close: np.ndarray, index: pd.Index,
+                          has_volume: bool) -> Dict[str, Any]:
+        """커널 출력 배열을 지표 딕셔너리로 구성 (지표 값은 단일 float32 버퍼의 행 뷰)"""
+        n = len(close)
+        
+        # 기본 지표 (개별 calculate_* 메서드와 동일한 워밍업 처리)
+        rsi = out[RSI]
+        if n < self._rsi_min_len:
+            rsi[:] = 50.0
+        else:
+            np.nan_to_num(rsi, copy=False, nan=50.0)
+        
+        macd = out[MACD:MACD_HIST + 1]
+        if n < self._macd_min_len:
+            macd[:] = 0.0
+        else:
+            np.nan_to_num(macd, copy=False, nan=0.0)
+        
+        indicators = {
+            'rsi': pd.Series(rsi),
+            'macd': {
+                'macd': pd.Series(out[MACD]),
+                'signal': pd.Series(out[MACD_SIGNAL]),
+                'histogram': pd.Series(out[MACD_HIST])
+            },
+            'bb': {
+                'upper': pd.Series(out[BB_UPPER]),
+                'middle': pd.Series(out[BB_MIDDLE]),
+                'lower': pd.Series(out[BB_LOWER])
+            },
+            'atr': out[ATR],
+            'stoch': {
+                'slowk': pd.Series(out[SLOWK]),
+                'slowd': pd.Series(out[SLOWD])
+            },
+            'williams_r': out[WILLR]
+        }
+        
+        # 거래량 지표
+        if has_volume:
+            indicators['volume'] = {
+                'obv': pd.Series(obv),
+                'vwap': pd.Series(out[VWAP], index=index)
+            }
+        
+        # 이동평균
+        ma = {}
+        for j, period in enumerate(MA_PERIODS):
+            ma[f'sma_{period}'] = out[SMA_BASE + j]
+            ma[f'ema_{period}'] = out[EMA_BASE + j]
+        indicators['ma'] = ma
+        
+        # 신호 생성용 마지막 값 (generate_signals가 Series 인덱싱 없이 사용)
+        if n:
+            indicators['_last'] = {
+                'rsi': float(rsi[-1]),
+                'macd_hist': out[MACD_HIST, -2:],
+                'bb': (float(close[-1]), float(out[BB_UPPER, -1]), float(out[BB_LOWER, -1])),
+                'slowk': float(out[SLOWK, -1])
+            }
+        
+        return indicators
+    
+    @staticmethod
+    def _last_values(indicators: Dict[str, Any]) -> Dict[str, Any]:
+        """지표별 마지막 값 추출 ('_last'가 없는 지표 딕셔너리용)
+        
+        종가 정보가 없으므로 볼린저 밴드 가격은 중간 밴드 값을 사용한다.
+        """
+        last = {}
+        if 'rsi' in indicators and len(indicators['rsi']) > 0:
+            last['rsi'] = float(np.asarray(indicators['rsi'])[-1])
+        
+        macd_data = indicators.get('macd', {})
+        if 'histogram' in macd_data and len(macd_data['histogram']) >= 2:
+            last['macd_hist'] = np.asarray(macd_data['histogram'], dtype=np.float64)[-2:]
+        
+        bb_data = indicators.get('bb', {})
+        if all(len(bb_data.get(key, [])) > 0 for key in ('middle', 'upper', 'lower')):
+            last['bb'] = (float(np.asarray(bb_data['middle'])[-1]),
+                          float(np.asarray(bb_data['upper'])[-1]),
+                          float(np.asarray(bb_data['lower'])[-1]))
+        
+        stoch_data = indicators.get('stoch', {})
+        if 'slowk' in stoch_data and len(stoch_data['slowk']) > 0:
+            last['slowk'] = float(np.asarray(stoch_data['slowk'])[-1])
+        return last
+    
     def generate_signals(self, indicators: Dict[str, Any]) -> Dict[str, float]:
-        """거래 신호 생성"""
+        """거래 신호 생성
+        
+        NaN과의 비교는 항상 False이므로 무효한 값은 자연히 중립(0) 신호가 된다.
+        """
         try:
-            signals = {}
+            last = indicators.get('_last')
+            if last is None:
+                last = self._last_values(indicators)
             
-            # RSI 신호
-            if 'rsi' in indicators and len(indicators['rsi']) > 0:
-                rsi_current = indicators['rsi'].iloc[-1] if hasattr(indicators['rsi'], 'iloc') else indicators['rsi'][-1]
-                
-                # NaN 또는 무효한 값 처리
-                if pd.isna(rsi_current) or not isinstance(rsi_current, (int, float)):
-                    rsi_current = 50
-                
-                if rsi_current < self.rsi_oversold:
-                    signals['rsi_signal'] = 1.0  # 매수
-                elif rsi_current > self.rsi_overbought:
-                    signals['rsi_signal'] = -1.0  # 매도
-                else:
-                    signals['rsi_signal'] = 0.0  # 중립
-            else:
-                signals['rsi_signal'] = 0.0
+            # RSI/볼린저 밴드/스토캐스틱을 하나의 배열로 묶어 임계값과 한 번에 비교
+            current_price, upper_band, lower_band = last.get('bb', (np.nan, np.nan, np.nan))
+            lane_values = np.array([last.get('rsi', 50.0), current_price, last.get('slowk', 50.0)])
+            buy_levels = np.array([self.rsi_oversold, lower_band, 20.0])
+            sell_levels = np.array([self.rsi_overbought, upper_band, 80.0])
             
-            # MACD 신호
-            if 'macd' in indicators and 'histogram' in indicators['macd']:
-                macd_hist = indicators['macd']['histogram']
-                if len(macd_hist) >= 2:
-                    hist_current = macd_hist.iloc[-1] if hasattr(macd_hist, 'iloc') else macd_hist[-1]
-                    hist_prev = macd_hist.iloc[-2] if hasattr(macd_hist, 'iloc') else macd_hist[-2]
-                    
-                    # NaN 또는 무효한 값 처리
-                    if pd.isna(hist_current) or pd.isna(hist_prev):
-                        signals['macd_signal'] = 0.0
-                    elif hist_current > 0 and hist_prev <= 0:
-                        signals['macd_signal'] = 1.0  # 매수
-                    elif hist_current < 0 and hist_prev >= 0:
-                        signals['macd_signal'] = -1.0  # 매도
-                    else:
-                        signals['macd_signal'] = 0.0  # 중립
-                else:
-                    signals['macd_signal'] = 0.0
-            else:
-                signals['macd_signal'] = 0.0
+            # 볼린저 밴드만 경계값 포함 비교
+            buy = np.where(self._INCLUSIVE_LANES, lane_values <= buy_levels, lane_values < buy_levels)
+            sell = np.where(self._INCLUSIVE_LANES, lane_values >= sell_levels, lane_values > sell_levels)
             
-            # 볼린저 밴드 신호
-            if 'bb' in indicators:
-                bb_data = indicators['bb']
-                if (len(bb_data.get('lower', [])) > 0 and 
-                    len(bb_data.get('upper', [])) > 0 and 
-                    len(bb_data.get('middle', [])) > 0):
-                    
-                    current_price = bb_data['middle'].iloc[-1] if hasattr(bb_data['middle'], 'iloc') else bb_data['middle'][-1]
-                    upper_band = bb_data['upper'].iloc[-1] if hasattr(bb_data['upper'], 'iloc') else bb_data['upper'][-1]
-                    lower_band = bb_data['lower'].iloc[-1] if hasattr(bb_data['lower'], 'iloc') else bb_data['lower'][-1]
-                    
-                    # NaN 또는 무효한 값 처리
-                    if pd.isna(current_price) or pd.isna(upper_band) or pd.isna(lower_band):
-                        signals['bb_signal'] = 0.0
-                    elif current_price <= lower_band:
-                        signals['bb_signal'] = 1.0  # 매수
-                    elif current_price >= upper_band:
-                        signals['bb_signal'] = -1.0  # 매도
-                    else:
-                        signals['bb_signal'] = 0.0  # 중립
-                else:
-                    signals['bb_signal'] = 0.0
-            else:
-                signals['bb_signal'] = 0.0
+            # rsi, macd, bb, stoch, combined 순서
+            values = np.zeros(5)
+            values[self._LANE_SLOTS] = np.where(buy, 1.0, np.where(sell, -1.0, 0.0))
             
-            # 스토캐스틱 신호
-            if 'stoch' in indicators and 'slowk' in indicators['stoch']:
-                stoch_data = indicators['stoch']
-                if len(stoch_data['slowk']) > 0:
-                    slowk = stoch_data['slowk'].iloc[-1] if hasattr(stoch_data['slowk'], 'iloc') else stoch_data['slowk'][-1]
-                    
-                    # NaN 또는 무효한 값 처리
-                    if pd.isna(slowk) or not isinstance(slowk, (int, float)):
-                        signals['stoch_signal'] = 0.0
-                    elif slowk < 20:
-                        signals['stoch_signal'] = 1.0  # 매수
-                    elif slowk > 80:
-                        signals['stoch_signal'] = -1.0  # 매도
-                    else:
-                        signals['stoch_signal'] = 0.0  # 중립
-                else:
-                    signals['stoch_signal'] = 0.0
-            else:
-                signals['stoch_signal'] = 0.0
+            # MACD 히스토그램 0선 교차 (상향 1, 하향 -1)
+            macd_hist = last.get('macd_hist')
+            if macd_hist is not None and len(macd_hist) >= 2:
+                hist_prev = macd_hist[-2]
+                hist_current = macd_hist[-1]
+                values[1] = float((hist_current > 0) & (hist_prev <= 0)) - float((hist_current < 0) & (hist_prev >= 0))
             
             # 종합 신호 계산 - 모든 신호 포함하여 평균 계산
-            valid_signals = [v for k, v in signals.items() if k.endswith('_signal') and isinstance(v, (int, float)) and not pd.isna(v)]
-            
-            if valid_signals:
-                signals['combined_signal'] = sum(valid_signals) / len(valid_signals)
-            else:
-                signals['combined_signal'] = 0.0
+            values[4] = values[:4].mean()
             
             # 안전 검증: 모든 신호가 유효한 숫자인지 확인
-            for key, value in signals.items():
-                if pd.isna(value) or not isinstance(value, (int, float)):
-                    signals[key] = 0.0
-            
-            return signals
+            np.nan_to_num(values, copy=False, nan=0.0)
+            return dict(zip(self._SIGNAL_KEYS, values.tolist()))
         except Exception as e:
             logger.error(f"신호 생성 오류: {e}")
             # 완전히 안전한 기본 신호 반환
-            return {
-                'rsi_signal': 0.0,
-                'macd_signal': 0.0,
-                'bb_signal': 0.0,
-                'stoch_signal': 0.0,
-                'combined_signal': 0.0
-            }
+            return dict.fromkeys(self._SIGNAL_KEYS, 0.0)
     
     def get_market_strength(self, indicators: Dict[str, Any]) -> Dict[str, float]:
         """시장 강도 분석"""
@@ -329,22 +556,17 @@ class TechnicalAnalyzer:
             if 'ma' in indicators:
                 ma_data = indicators['ma']
                 if 'sma_20' in ma_data and 'sma_50' in ma_data:
-                    sma_20 = ma_data['sma_20'][-1] if len(ma_data['sma_20']) > 0 else 0
-                    sma_50 = ma_data['sma_50'][-1] if len(ma_data['sma_50']) > 0 else 0
-                    
-                    if sma_20 > sma_50:
-                        strength['trend_strength'] = (sma_20 - sma_50) / sma_50
-                    else:
-                        strength['trend_strength'] = (sma_20 - sma_50) / sma_50
+                    sma_20 = _last_value(ma_data['sma_20'], 0.0)
+                    sma_50 = _last_value(ma_data['sma_50'], 0.0)
+                    strength['trend_strength'] = (sma_20 - sma_50) / sma_50 if sma_50 != 0 else 0.0
             
             # 변동성 강도
             if 'atr' in indicators:
-                atr_current = indicators['atr'][-1] if len(indicators['atr']) > 0 else 0
-                strength['volatility_strength'] = atr_current
+                strength['volatility_strength'] = _last_value(indicators['atr'], 0.0)
             
             # 모멘텀 강도
             if 'rsi' in indicators:
-                rsi_current = indicators['rsi'][-1] if len(indicators['rsi']) > 0 else 50
+                rsi_current = _last_value(indicators['rsi'], 50.0)
                 strength['momentum_strength'] = abs(rsi_current - 50) / 50
             
             return strength
@@ -3,27 +3,258 @@
 텔레그램 알림 모듈
 """
 
+import asyncio
+import importlib.util
 import os
+import hashlib
+import heapq
+import itertools
+import queue
+import random
+import threading
+import time
 import requests
+from collections import ChainMap, OrderedDict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
 from utils import logger
 
+try:
+    import httpx
+except ImportError:  # httpx 미설치 환경에서는 스레드 풀에서 동기 세션으로 전송
+    httpx = None
+
+# 대기열 메시지 묶음 전송 설정 (텔레그램 메시지 최대 길이 4096자)
+_BATCH_WINDOW = 0.8
+_BATCH_MAX_CHARS = 4000
+_BATCH_SEPARATOR = '\n\n━━━━━━━━\n\n'
+
+# 종료 시 대기열 전송을 기다리는 최대 초 (초과분은 버리고 종료 알림 전송)
+_SHUTDOWN_FLUSH_TIMEOUT = 5.0
+
+# 묶음 대기 없이 즉시 전송하는 심각도
+_URGENT_SEVERITIES = frozenset(('high', 'critical'))
+
+# 심각도 필드로 긴급 여부를 정하는 알림 종류
+_SEVERITY_KINDS = frozenset(('risk', 'error'))
+
+# 전송 대기열 설정 (최대 길이, 우선순위: 작을수록 먼저 전송되고 가득 찼을 때 보존)
+_QUEUE_MAXSIZE = 1024
+_PRIORITY_URGENT = 0
+_PRIORITY_NORMAL = 2
+
+# 중복 알림 억제 설정 (억제 구간 초, 기록 보관 초, 최대 기록 수)
+_DEDUP_WINDOW = 30.0
+_DEDUP_TTL = 60.0
+_DEDUP_MAX_ENTRIES = 512
+
+# HTTP 연결 풀 설정 (호스트별 풀 수, 풀당 유지 연결 수, 연결 실패 재시도 횟수)
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 32
+_HTTP_RETRIES = 3
+
+# 비동기 전송 연결 설정 (h2 설치 시 HTTP/2 사용)
+_ASYNC_MAX_CONNECTIONS = 32
+_ASYNC_MAX_KEEPALIVE = 16
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# 전송 스레드 재시도 설정 (최대 시도 횟수, 지수 백오프 상한 초, Retry-After 여유 초)
+_SEND_ATTEMPTS = 5
+_BACKOFF_MAX = 30.0
+_RETRY_AFTER_MARGIN = 0.2
+
+# 메시지 시각 표기 형식
+_FMT_DATETIME = '%Y-%m-%d %H:%M:%S'
+_FMT_MINUTE = '%Y-%m-%d %H:%M'
+_FMT_TIME = '%H:%M:%S'
+
+# 알림 유형별 이모지 (기본값은 조회 시 dict.get 인자로 지정)
+_RISK_EMOJI = {
+    'stop_loss': '🛑',
+    'take_profit': '🎯',
+    'timeout': '⏰',
+    'emergency_stop': '🚨',
+    'daily_loss': '📉',
+    'max_drawdown': '📊'
+}
+_SEVERITY_EMOJI = {
+    'low': '🟡',
+    'medium': '🟠',
+    'high': '🔴',
+    'critical': '🚨'
+}
+_STATUS_EMOJI = {'running': '🟢', 'error': '🔴'}
+_STRATEGY_EMOJI = {
+    'arbitrage': '🔀',
+    'trend_following': '📈',
+    'hedging': '🛡️',
+    'momentum': '⚡'
+}
+_CONDITION_EMOJI = {
+    'bullish': '🐂',
+    'bearish': '🐻',
+    'neutral': '📊',
+    'volatile': '⚡'
+}
+
+# 메시지 템플릿 (호출마다 f-string을 다시 만들지 않도록 모듈 로드 시 1회 정의)
+_STARTUP_TMPL = (
+    "🚀 <b>트레이딩 봇 시작</b>\n\n"
+    "📅 시작 시간: {time}\n"
+    "💰 초기 상태: 시스템 점검 중\n"
+    "🔄 모드: 실시간 거래\n\n"
+    "<i>봇이 정상적으로 시작되었습니다.</i>"
+)
+_TRADE_TMPL = (
+    "{side_emoji} <b>거래 실행</b>\n\n"
+    "🏷️ 심볼: {symbol}\n"
+    "📊 방향: {side}\n"
+    "🔢 수량: {size}\n"
+    "💵 가격: ${price:,.2f}\n"
+    "💰 총액: ${total:,.2f}\n"
+    "📍 거래소: {exchange_type}\n\n"
+    "<i>거래가 성공적으로 실행되었습니다.</i>"
+)
+_PORTFOLIO_TMPL = (
+    "💼 <b>포트폴리오 업데이트</b>\n\n"
+    "💰 현재 잔고: ${current_balance:,.2f}\n"
+    "{pnl_emoji} 총 손익: ${total_pnl:+,.2f} ({total_pnl_pct:+.2f}%)\n"
+    "📊 활성 포지션: {positions_count}개\n"
+    "📈 총 거래: {total_trades}회\n\n"
+    "<i>포트폴리오 상태가 업데이트되었습니다.</i>"
+)
+_RISK_TMPL = (
+    "{alert_emoji} <b>리스크 알림</b> {severity_emoji}\n\n"
+    "🏷️ 유형: {alert_title}\n"
+    "📍 심볼: {symbol}\n"
+    "⚠️ 경고도: {severity_label}\n"
+    "📝 메시지: {message}\n\n"
+    "<i>즉시 확인이 필요합니다.</i>"
+)
+_SYSTEM_STATUS_TMPL = (
+    "🖥️ <b>시스템 상태</b> {status_emoji}\n\n"
+    "📊 상태: {status_label}\n"
+    "💾 메모리: {memory_percent:.1f}%\n"
+    "⚡ CPU: {cpu_percent:.1f}%\n"
+    "🌐 네트워크: {network_label}\n"
+    "⏱️ 업타임: {uptime_hours:.1f}시간\n\n"
+    "<i>시스템 상태 점검 완료</i>"
+)
+_DAILY_SUMMARY_TMPL = (
+    "📊 <b>일일 거래 요약</b>\n\n"
+    "📅 날짜: {date}\n"
+    "💰 일일 손익: ${daily_pnl:+,.2f}\n"
+    "📈 거래 횟수: {trades_count}회\n"
+    "🎯 승률: {win_rate:.1f}%\n"
+    "📊 최고 수익: ${max_profit:,.2f}\n"
+    "📉 최대 손실: ${max_loss:,.2f}\n\n"
+    "<i>오늘의 거래 결과입니다.</i>"
+)
+_CYCLE_TMPL = (
+    "🔄 <b>거래 사이클 #{cycle_number}</b>\n\n"
+    "⏱️ 실행 시간: {duration:.1f}초\n"
+    "📊 거래 기회:\n"
+    "{opp_text}\n\n"
+    "{trade_emoji} 실행된 거래: {trades_executed}개\n"
+    "📅 시간: {time}\n\n"
+    "<i>사이클 완료</i>"
+)
+_MARKET_ANALYSIS_TMPL = (
+    "📈 <b>시장 분석 리포트</b>\n\n"
+    "📊 분석 심볼: {symbols_analyzed}개\n"
+    "{condition_emoji} 시장 상황: {condition_title}\n\n"
+    "🎯 주요 신호:\n"
+    "{signals}\n"
+    "📅 {time}"
+)
+_SIGNAL_LINE_TMPL = "• {symbol}: {strategy} ({confidence:.0f}%)\n"
+_PERFORMANCE_TMPL = (
+    "💎 <b>시간별 성과 리포트</b>\n\n"
+    "💰 현재 잔고: ${current_balance:,.2f}\n"
+    "{pnl_emoji} 시간 손익: ${hourly_pnl:+,.2f} ({hourly_pnl_pct:+.2f}%)\n"
+    "📊 총 거래: {total_trades}회\n"
+    "🎯 승률: {win_rate:.1f}%\n\n"
+    "📅 {time}\n\n"
+    "<i>성과 추적 중...</i>"
+)
+_OPPORTUNITY_TMPL = (
+    "🚨 <b>거래 기회 발견!</b>\n\n"
+    "{strategy_emoji} 전략: {strategy_title}\n"
+    "💎 심볼: {symbol}\n"
+    "🎯 신뢰도: {confidence:.0f}%\n"
+    "💰 예상 수익: {expected_return:.2f}%\n\n"
+    "⏰ 발견 시간: {time}\n\n"
+    "<i>거래 검토 중...</i>"
+)
+_ERROR_TMPL = (
+    "{severity_emoji} <b>시스템 오류</b>\n\n"
+    "⚠️ 유형: {error_title}\n"
+    "📝 메시지: {message}\n"
+    "🔧 심각도: {severity_label}\n\n"
+    "📅 발생 시간: {time}\n\n"
+    "<i>오류 처리 중...</i>"
+)
+_SHUTDOWN_TMPL = (
+    "🔴 <b>트레이딩 봇 종료</b>\n\n"
+    "📅 종료 시간: {time}\n"
+    "💡 상태: 정상 종료\n\n"
+    "<i>봇이 안전하게 종료되었습니다.</i>"
+)
+
+# 템플릿 필드 기본값 (입력 dict에 없는 필드, 숫자 형식 지정 필드는 0)
+_PORTFOLIO_DEFAULTS = {'current_balance': 0, 'total_pnl': 0, 'total_pnl_pct': 0, 'positions_count': 0, 'total_trades': 0}
+_RISK_DEFAULTS = {'symbol': 'N/A', 'message': '상세 정보 없음'}
+_SYSTEM_STATUS_DEFAULTS = {'memory_percent': 0, 'cpu_percent': 0, 'uptime_hours': 0}
+_DAILY_SUMMARY_DEFAULTS = {'date': '오늘', 'daily_pnl': 0, 'trades_count': 0, 'win_rate': 0, 'max_profit': 0, 'max_loss': 0}
+_CYCLE_DEFAULTS = {'cycle_number': 0, 'duration': 0, 'opportunities': {}, 'trades_executed': 0}
+_MARKET_ANALYSIS_DEFAULTS = {'symbols_analyzed': 0, 'top_signals': [], 'market_condition': 'neutral'}
+_SIGNAL_DEFAULTS = {'symbol': 'N/A', 'strategy': 'N/A'}
+_PERFORMANCE_DEFAULTS = {'current_balance': 0, 'hourly_pnl': 0, 'hourly_pnl_pct': 0, 'total_trades': 0, 'win_rate': 0}
+_OPPORTUNITY_DEFAULTS = {'symbol': 'N/A'}
+_ERROR_DEFAULTS = {'message': 'No details'}
+
+
+@lru_cache(maxsize=None)
+def _shared_session() -> requests.Session:
+    """모든 알림이 함께 쓰는 keep-alive 세션 (프로세스당 1개)
+    
+    응답을 받은 뒤의 재전송은 중복 메시지가 될 수 있으므로 읽기 오류는 재시도하지 않는다.
+    429/5xx 응답은 전송 스레드가 Retry-After와 백오프를 적용해 재시도한다.
+    """
+    retry = Retry(
+        total=_HTTP_RETRIES,
+        read=0,
+        backoff_factor=0.5,
+        allowed_methods=frozenset(('POST',)),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retry
+    ))
+    return session
+
 
 class TelegramBot:
     """텔레그램 봇 클래스"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.enabled = bool(self.bot_token and self.chat_id)
         
         if not self.enabled:
             logger.warning("텔레그램 봇 토큰 또는 채팅 ID가 설정되지 않았습니다")
+        
+        # keep-alive 세션 (메시지마다 TCP/TLS 핸드셰이크 반복 방지)
+        self.session = session if session is not None else _shared_session()
     
-    def send_message(self, message: str) -> bool:
-        """텔레그램 메시지 전송"""
+    def post_message(self, message: str) -> Optional[requests.Response]:
+        """sendMessage 요청 후 응답 반환 (비활성 또는 네트워크 오류 시 None)"""
         if not self.enabled:
-            return False
+            return None
         
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
@@ -33,406 +264,609 @@ class TelegramBot:
                 'parse_mode': 'HTML'
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            return self.session.post(url, data=data, timeout=10)
             
-            if response.status_code == 200:
-                return True
-            else:
-                logger.error(f"텔레그램 메시지 전송 실패: {response.status_code}")
-                return False
-                
         except Exception as e:
             logger.error(f"텔레그램 메시지 전송 오류: {e}")
+            return None
+    
+    async def post_message_async(self, client, message: str):
+        """httpx.AsyncClient로 sendMessage 요청 후 응답 반환 (비활성 또는 네트워크 오류 시 None)"""
+        if not self.enabled:
+            return None
+        
+        try:
+            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+            data = {
+                'chat_id': self.chat_id,
+                'text': message,
+                'parse_mode': 'HTML'
+            }
+            
+            return await client.post(url, data=data, timeout=10)
+            
+        except Exception as e:
+            logger.error(f"텔레그램 비동기 메시지 전송 오류: {e}")
+            return None
+    
+    def send_message(self, message: str) -> bool:
+        """텔레그램 메시지 전송"""
+        response = self.post_message(message)
+        if response is None:
+            return False
+        if response.status_code != 200:
+            logger.error(f"텔레그램 메시지 전송 실패: {response.status_code}")
             return False
+        return True
+
+
+def _retry_delay(response: Optional[requests.Response], attempt: int) -> Optional[float]:
+    """재시도 전 대기 초 (재시도하지 않을 응답이면 None)
+    
+    429는 응답의 retry_after(본문 parameters 또는 Retry-After 헤더)를 따르고,
+    네트워크 오류와 5xx는 지터를 더한 지수 백오프를 적용한다.
+    """
+    if response is not None and response.status_code == 429:
+        try:
+            retry_after = response.json().get('parameters', {}).get('retry_after')
+        except ValueError:
+            retry_after = None
+        if retry_after is None:
+            retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after) + _RETRY_AFTER_MARGIN
+            except (TypeError, ValueError):
+                pass
+    elif response is not None and response.status_code < 500:
+        return None
+    return min(2 ** attempt + random.random(), _BACKOFF_MAX)
+
+
+@lru_cache(maxsize=64)
+def _ts(epoch_sec: int, fmt: str = _FMT_DATETIME) -> str:
+    """초 단위 시각 문자열 (같은 초에 만든 알림은 캐시된 문자열 공유)
+    
+    datetime 객체를 만들지 않고 C strftime을 바로 호출한다.
+    """
+    return time.strftime(fmt, time.localtime(epoch_sec))
+
+
+def _noop(*args, **kwargs):
+    """비활성 상태의 알림 메서드 대체용"""
+    return None
+
+
+def _dedup_key(*parts) -> bytes:
+    """중복 판별용 8바이트 해시"""
+    return hashlib.blake2b('\x1f'.join(map(str, parts)).encode(), digest_size=8).digest()
 
 
 class TelegramNotifications:
     """텔레그램 알림 관리 클래스"""
     
     def __init__(self):
-        self.telegram = TelegramBot()
+        self.telegram = TelegramBot(session=_shared_session())
         self.enabled = self.telegram.enabled
         
+        # 전송 대기열 (거래 루프는 메시지를 넣기만 하고 백그라운드 스레드가 전송)
+        # 항목: (우선순위, 순번, 메시지, 긴급 여부) - 같은 우선순위는 넣은 순서대로 전송
+        self._queue = queue.PriorityQueue(maxsize=_QUEUE_MAXSIZE)
+        self._seq = itertools.count()
+        self._evicted = 0
+        self._worker = None
+        
+        # 비동기 전송용 클라이언트 (post_messages_async 첫 호출 시 생성)
+        self._async_client = None
+        
+        # 최근 전송 알림 (해시 -> 전송 시각, 오래된 순)
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        
         if self.enabled:
+            self._worker = threading.Thread(target=self._process_queue, name='telegram-notifier', daemon=True)
+            self._worker.start()
             logger.info("텔레그램 알림 시스템 초기화 완료")
             self.send_startup_message()
         else:
+            # 비활성 상태에서는 모든 알림 메서드를 빈 함수로 대체 (호출마다 활성 여부 확인 생략)
+            for name in dir(self):
+                if name.startswith('send_'):
+                    setattr(self, name, _noop)
             logger.warning("텔레그램 알림이 비활성화되어 있습니다")
     
+    def _process_queue(self):
+        """대기열 메시지 전송 루프 (백그라운드 스레드)"""
+        while True:
+            messages = self._collect_batch()
+            try:
+                for text in self._join_messages(messages):
+                    self._send_with_retry(text)
+            except Exception as e:
+                logger.error(f"텔레그램 대기열 전송 실패: {e}")
+            finally:
+                for _ in messages:
+                    self._queue.task_done()
+    
+    def _wait_for_queue(self, timeout: float) -> bool:
+        """대기열의 모든 메시지 전송 완료를 최대 timeout초 대기 (시간 초과 시 False)"""
+        q = self._queue
+        deadline = time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+    
+    def _drain_queue(self) -> int:
+        """아직 꺼내지 않은 메시지를 모두 버리고 버린 개수 반환"""
+        dropped = 0
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return dropped
+            self._queue.task_done()
+            dropped += 1
+    
+    def _send_with_retry(self, text: str) -> bool:
+        """일시적 실패(429/5xx/네트워크 오류) 시 대기 후 재전송 (전송 스레드 전용)"""
+        for attempt in range(_SEND_ATTEMPTS):
+            response = self.telegram.post_message(text)
+            if response is not None and response.status_code == 200:
+                return True
+            
+            delay = _retry_delay(response, attempt)
+            if delay is None or attempt == _SEND_ATTEMPTS - 1:
+                break
+            logger.warning("텔레그램 전송 재시도 대기: %.1f초 (시도 %d/%d)", delay, attempt + 1, _SEND_ATTEMPTS)
+            time.sleep(delay)
+        
+        status = response.status_code if response is not None else 'network error'
+        logger.error(f"텔레그램 메시지 전송 실패: {status}")
+        return False
+    
+    async def _send_with_retry_async(self, text: str) -> bool:
+        """_send_with_retry의 비동기 버전 (대기 중 이벤트 루프를 막지 않음)"""
+        for attempt in range(_SEND_ATTEMPTS):
+            response = await self.telegram.post_message_async(self._async_client, text)
+            if response is not None and response.status_code == 200:
+                return True
+            
+            delay = _retry_delay(response, attempt)
+            if delay is None or attempt == _SEND_ATTEMPTS - 1:
+                break
+            logger.warning("텔레그램 전송 재시도 대기: %.1f초 (시도 %d/%d)", delay, attempt + 1, _SEND_ATTEMPTS)
+            await asyncio.sleep(delay)
+        
+        status = response.status_code if response is not None else 'network error'
+        logger.error(f"텔레그램 메시지 전송 실패: {status}")
+        return False
+    
+    async def post_messages_async(self, messages: list) -> list:
+        """서로 독립적인 메시지를 동시에 전송하고 메시지별 성공 여부 반환
+        
+        비동기 봇에서 대기열/묶음 전송을 거치지 않고 바로 보낼 때 사용한다.
+        httpx가 있으면 AsyncClient 하나로, 없으면 기본 스레드 풀에서 동기 세션으로 전송한다.
+        """
+        if not self.enabled or not messages:
+            return [False] * len(messages)
+        
+        if httpx is None:
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *[loop.run_in_executor(None, self._send_with_retry, message) for message in messages]
+            )
+            return list(results)
+        
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=10,
+                limits=httpx.Limits(
+                    max_connections=_ASYNC_MAX_CONNECTIONS, max_keepalive_connections=_ASYNC_MAX_KEEPALIVE
+                ),
+            )
+        results = await asyncio.gather(*[self._send_with_retry_async(message) for message in messages])
+        return list(results)
+    
+    async def aclose(self):
+        """비동기 클라이언트 연결 종료"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def _collect_batch(self) -> list:
+        """첫 메시지 이후 묶음 대기 시간 동안 도착한 메시지를 함께 꺼냄
+        
+        긴급 메시지가 꺼내지면 대기를 멈추고 지금까지 모은 메시지와 함께 바로 전송한다.
+        """
+        _, _, message, urgent = self._queue.get()
+        messages = [message]
+        deadline = time.monotonic() + _BATCH_WINDOW
+        while not urgent:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                _, _, message, urgent = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            messages.append(message)
+        
+        # 대기 시간 중 쌓인 나머지도 비차단으로 함께 전송
+        while True:
+            try:
+                messages.append(self._queue.get_nowait()[2])
+            except queue.Empty:
+                return messages
+    
+    @staticmethod
+    def _join_messages(messages: list) -> list:
+        """메시지를 최대 길이 이내의 묶음 텍스트로 연결"""
+        texts = []
+        current = ''
+        for message in messages:
+            if current and len(current) + len(_BATCH_SEPARATOR) + len(message) > _BATCH_MAX_CHARS:
+                texts.append(current)
+                current = ''
+            current = current + _BATCH_SEPARATOR + message if current else message
+        if current:
+            texts.append(current)
+        return texts
+    
+    def _is_duplicate(self, key: bytes) -> bool:
+        """억제 구간 내에 같은 알림을 보냈는지 확인 (보내지 않았으면 전송 시각 기록)"""
+        now = time.monotonic()
+        with self._recent_lock:
+            recent = self._recent
+            while recent and now - next(iter(recent.values())) > _DEDUP_TTL:
+                recent.popitem(last=False)
+            
+            sent_at = recent.get(key)
+            if sent_at is not None and now - sent_at < _DEDUP_WINDOW:
+                return True
+            
+            recent[key] = now
+            recent.move_to_end(key)
+            if len(recent) > _DEDUP_MAX_ENTRIES:
+                recent.popitem(last=False)
+            return False
+    
+    def _enqueue(self, message: str, urgent: bool = False):
+        """메시지를 전송 대기열에 추가 (전송 스레드가 없으면 무시)
+        
+        대기열이 가득 차면 가장 오래된 일반 메시지를 새 메시지로 교체한다.
+        대기 중인 긴급 메시지는 교체하지 않으며, 교체할 일반 메시지가 없으면 새 메시지를 버린다.
+        """
+        if self._worker is None:
+            return
+        item = (_PRIORITY_URGENT if urgent else _PRIORITY_NORMAL, next(self._seq), message, urgent)
+        try:
+            self._queue.put_nowait(item)
+            self._evicted = 0
+            return
+        except queue.Full:
+            pass
+        
+        q = self._queue
+        with q.mutex:
+            normal = [i for i, entry in enumerate(q.queue) if entry[0] == _PRIORITY_NORMAL]
+            if normal:
+                # 교체이므로 미완료 작업 수(unfinished_tasks)는 그대로
+                oldest = min(normal, key=lambda i: q.queue[i][1])
+                dropped = q.queue[oldest][2]
+                q.queue[oldest] = item
+                heapq.heapify(q.queue)
+                q.not_empty.notify()
+            else:
+                dropped = message
+        
+        # 연속된 초과 구간마다 경고는 한 번만 기록
+        self._evicted += 1
+        if self._evicted == 1:
+            logger.warning("텔레그램 대기열 가득 참, 메시지 버림: %s", dropped.split('\n', 1)[0])
+    
+    @staticmethod
+    def _format_trade(trade_info: dict) -> str:
+        """거래 알림 메시지"""
+        # 여러 번 쓰는 값은 한 번만 조회
+        side = trade_info.get('side')
+        size = trade_info.get('size', 0)
+        price = trade_info.get('price', 0)
+        
+        return _TRADE_TMPL.format(
+            side_emoji="📈" if side == 'buy' else "📉",
+            symbol=trade_info.get('symbol', 'N/A'),
+            side=(side or 'N/A').upper(),
+            size=size,
+            price=price,
+            total=size * price,
+            exchange_type=(trade_info.get('exchange_type') or 'spot').upper(),
+        )
+    
+    @staticmethod
+    def _format_portfolio(portfolio_info: dict) -> str:
+        """포트폴리오 업데이트 메시지"""
+        total_pnl = portfolio_info.get('total_pnl', 0)
+        return _PORTFOLIO_TMPL.format_map(ChainMap({
+            'pnl_emoji': "💚" if total_pnl >= 0 else "❤️",
+            'total_pnl': total_pnl,
+        }, portfolio_info, _PORTFOLIO_DEFAULTS))
+    
+    @staticmethod
+    def _format_risk(alert_info: dict) -> str:
+        """리스크 알림 메시지"""
+        alert_type = alert_info.get('type', 'unknown')
+        severity = alert_info.get('severity', 'medium')
+        return _RISK_TMPL.format_map(ChainMap({
+            'alert_emoji': _RISK_EMOJI.get(alert_type, '⚠️'),
+            'severity_emoji': _SEVERITY_EMOJI.get(severity, '🟠'),
+            'alert_title': alert_type.replace('_', ' ').title(),
+            'severity_label': severity.upper(),
+        }, alert_info, _RISK_DEFAULTS))
+    
+    @staticmethod
+    def _format_system_status(status_info: dict) -> str:
+        """시스템 상태 메시지"""
+        status = status_info.get('status', 'unknown')
+        return _SYSTEM_STATUS_TMPL.format_map(ChainMap({
+            'status_emoji': _STATUS_EMOJI.get(status, '🟡'),
+            'status_label': status.upper(),
+            'network_label': status_info.get('network_status', 'unknown').upper(),
+        }, status_info, _SYSTEM_STATUS_DEFAULTS))
+    
+    @staticmethod
+    def _format_daily_summary(summary_info: dict) -> str:
+        """일일 요약 메시지"""
+        return _DAILY_SUMMARY_TMPL.format_map(ChainMap(summary_info, _DAILY_SUMMARY_DEFAULTS))
+    
+    @staticmethod
+    def _format_trading_cycle(cycle_info: dict) -> str:
+        """거래 사이클 로그 메시지"""
+        values = ChainMap(cycle_info, _CYCLE_DEFAULTS)
+        trades_executed = values['trades_executed']
+        
+        # 기회 발견 상황 요약
+        opp_summary = []
+        for strategy, count in values['opportunities'].items():
+            if count > 0:
+                opp_summary.append(f"{_STRATEGY_EMOJI.get(strategy, '📊')} {strategy}: {count}개")
+        
+        return _CYCLE_TMPL.format_map(values.new_child({
+            'opp_text': "\n".join(opp_summary) if opp_summary else "❌ 기회 없음",
+            'trade_emoji': "💰" if trades_executed > 0 else "⏳",
+            'trades_executed': trades_executed,
+            'time': _ts(int(time.time()), _FMT_TIME),
+        }))
+    
+    @staticmethod
+    def _format_market_analysis(analysis_info: dict) -> str:
+        """시장 분석 로그 메시지"""
+        values = ChainMap(analysis_info, _MARKET_ANALYSIS_DEFAULTS)
+        market_condition = values['market_condition']
+        
+        top_signals = values['top_signals'][:3]  # 상위 3개만
+        if top_signals:
+            signals = ''.join(
+                _SIGNAL_LINE_TMPL.format_map(ChainMap(
+                    {'confidence': signal.get('confidence', 0) * 100}, signal, _SIGNAL_DEFAULTS
+                ))
+                for signal in top_signals
+            )
+        else:
+            signals = "• 현재 유효한 신호 없음\n"
+        
+        return _MARKET_ANALYSIS_TMPL.format_map(values.new_child({
+            'condition_emoji': _CONDITION_EMOJI.get(market_condition, '📊'),
+            'condition_title': market_condition.title(),
+            'signals': signals,
+            'time': _ts(int(time.time()), _FMT_TIME),
+        }))
+    
+    @staticmethod
+    def _format_performance(performance_info: dict) -> str:
+        """시간별 성과 로그 메시지"""
+        hourly_pnl = performance_info.get('hourly_pnl', 0)
+        return _PERFORMANCE_TMPL.format_map(ChainMap({
+            'pnl_emoji': "💚" if hourly_pnl >= 0 else "❤️",
+            'hourly_pnl': hourly_pnl,
+            'time': _ts(int(time.time()), _FMT_MINUTE),
+        }, performance_info, _PERFORMANCE_DEFAULTS))
+    
+    @staticmethod
+    def _format_opportunity(opportunity_info: dict) -> str:
+        """거래 기회 알림 메시지"""
+        strategy = opportunity_info.get('strategy', 'unknown')
+        return _OPPORTUNITY_TMPL.format_map(ChainMap({
+            'strategy_emoji': _STRATEGY_EMOJI.get(strategy, '📊'),
+            'strategy_title': strategy.replace('_', ' ').title(),
+            'confidence': opportunity_info.get('confidence', 0) * 100,
+            'expected_return': opportunity_info.get('expected_return', 0) * 100,
+            'time': _ts(int(time.time()), _FMT_TIME),
+        }, opportunity_info, _OPPORTUNITY_DEFAULTS))
+    
+    @staticmethod
+    def _format_error(error_info: dict) -> str:
+        """시스템 오류 로그 메시지"""
+        error_type = error_info.get('type', 'unknown')
+        severity = error_info.get('severity', 'medium')
+        return _ERROR_TMPL.format_map(ChainMap({
+            'severity_emoji': _SEVERITY_EMOJI.get(severity, '🟠'),
+            'error_title': error_type.replace('_', ' ').title(),
+            'severity_label': severity.upper(),
+            'time': _ts(int(time.time()), _FMT_TIME),
+        }, error_info, _ERROR_DEFAULTS))
+    
+    # 알림 종류(send_batch 이벤트의 'kind') -> 메시지 포맷 함수
+    _FORMATTERS = {
+        'trade': _format_trade,
+        'portfolio': _format_portfolio,
+        'risk': _format_risk,
+        'system_status': _format_system_status,
+        'daily_summary': _format_daily_summary,
+        'trading_cycle': _format_trading_cycle,
+        'market_analysis': _format_market_analysis,
+        'performance': _format_performance,
+        'opportunity': _format_opportunity,
+        'error': _format_error,
+    }
+    
+    def _prepare_event(self, kind: str, info: dict) -> Optional[tuple]:
+        """알림 이벤트를 (메시지, 긴급 여부)로 변환 (억제 구간 내 중복 알림이면 None)
+        
+        리스크 알림은 (유형, 심볼, 심각도)로 메시지를 만들기 전에, 거래 알림은 메시지 본문으로 중복을 판별한다.
+        """
+        severity = info.get('severity', 'medium')
+        if kind == 'risk' and self._is_duplicate(_dedup_key(info.get('type', 'unknown'), info.get('symbol'), severity)):
+            logger.debug("중복 알림 생략: %s %s", kind, info.get('symbol'))
+            return None
+        
+        message = self._FORMATTERS[kind](info)
+        if kind == 'trade' and self._is_duplicate(_dedup_key(message)):
+            logger.debug("중복 알림 생략: %s %s", kind, info.get('symbol'))
+            return None
+        
+        return message, kind in _SEVERITY_KINDS and severity in _URGENT_SEVERITIES
+    
+    def _send_event(self, kind: str, info: dict) -> bool:
+        """단일 알림 이벤트를 대기열에 추가 (중복으로 생략했으면 False)"""
+        prepared = self._prepare_event(kind, info)
+        if prepared is None:
+            return False
+        self._enqueue(*prepared)
+        return True
+    
+    def send_batch(self, events: list):
+        """여러 알림 이벤트를 하나의 메시지로 묶어 대기열에 추가
+        
+        각 이벤트는 'kind'(trade, portfolio, risk 등 _FORMATTERS의 키)와 해당 알림 필드를 담은 dict이다.
+        묶은 텍스트가 최대 길이를 넘으면 메시지 경계에서 나누어 추가한다.
+        """
+        try:
+            messages = []
+            urgent = False
+            for event in events:
+                kind = event.get('kind')
+                if kind not in self._FORMATTERS:
+                    logger.warning("알 수 없는 알림 종류 생략: %s", kind)
+                    continue
+                prepared = self._prepare_event(kind, event)
+                if prepared is not None:
+                    messages.append(prepared[0])
+                    urgent = urgent or prepared[1]
+            
+            for text in self._join_messages(messages):
+                self._enqueue(text, urgent)
+            logger.info("묶음 알림 전송: %d건", len(messages))
+        except Exception as e:
+            logger.error(f"묶음 알림 전송 실패: {e}")
+    
+    def send_text(self, message: str, urgent: bool = False):
+        """미리 만든 메시지를 전송 대기열에 추가 (호출 스레드에서 HTTP 요청을 하지 않음)"""
+        try:
+            self._enqueue(message, urgent)
+        except Exception as e:
+            logger.error(f"텔레그램 메시지 대기열 추가 실패: {e}")
+    
     def send_startup_message(self):
         """봇 시작 알림"""
         try:
-            message = """
-🚀 <b>트레이딩 봇 시작</b>
-
-📅 시작 시간: {}
-💰 초기 상태: 시스템 점검 중
-🔄 모드: 실시간 거래
-
-<i>봇이 정상적으로 시작되었습니다.</i>
-            """.format(
-                __import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ).strip()
+            message = _STARTUP_TMPL.format(time=_ts(int(time.time())))
             
-            self.telegram.send_message(message)
+            self._enqueue(message)
             logger.info("봇 시작 알림 전송 완료")
         except Exception as e:
             logger.error(f"시작 알림 전송 실패: {e}")
     
     def send_trade_notification(self, trade_info: dict):
         """거래 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            side_emoji = "📈" if trade_info.get('side') == 'buy' else "📉"
-            
-            message = f"""
-{side_emoji} <b>거래 실행</b>
-
-🏷️ 심볼: {trade_info.get('symbol', 'N/A')}
-📊 방향: {trade_info.get('side', 'N/A').upper()}
-🔢 수량: {trade_info.get('size', 0)}
-💵 가격: ${trade_info.get('price', 0):,.2f}
-💰 총액: ${(trade_info.get('size', 0) * trade_info.get('price', 0)):,.2f}
-📍 거래소: {trade_info.get('exchange_type', 'spot').upper()}
-
-<i>거래가 성공적으로 실행되었습니다.</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
-            logger.info(f"거래 알림 전송: {trade_info.get('symbol')} {trade_info.get('side')}")
+            if self._send_event('trade', trade_info):
+                logger.info("거래 알림 전송: %s %s", trade_info.get('symbol'), trade_info.get('side'))
         except Exception as e:
             logger.error(f"거래 알림 전송 실패: {e}")
     
     def send_portfolio_update(self, portfolio_info: dict):
         """포트폴리오 업데이트 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            pnl_emoji = "💚" if portfolio_info.get('total_pnl', 0) >= 0 else "❤️"
-            
-            message = f"""
-💼 <b>포트폴리오 업데이트</b>
-
-💰 현재 잔고: ${portfolio_info.get('current_balance', 0):,.2f}
-{pnl_emoji} 총 손익: ${portfolio_info.get('total_pnl', 0):+,.2f} ({portfolio_info.get('total_pnl_pct', 0):+.2f}%)
-📊 활성 포지션: {portfolio_info.get('positions_count', 0)}개
-📈 총 거래: {portfolio_info.get('total_trades', 0)}회
-
-<i>포트폴리오 상태가 업데이트되었습니다.</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
+            self._send_event('portfolio', portfolio_info)
             logger.info("포트폴리오 업데이트 알림 전송 완료")
         except Exception as e:
             logger.error(f"포트폴리오 알림 전송 실패: {e}")
     
     def send_risk_alert(self, alert_info: dict):
         """리스크 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            alert_type = alert_info.get('type', 'unknown')
-            severity = alert_info.get('severity', 'medium')
-            
-            emoji_map = {
-                'stop_loss': '🛑',
-                'take_profit': '🎯',
-                'timeout': '⏰',
-                'emergency_stop': '🚨',
-                'daily_loss': '📉',
-                'max_drawdown': '📊'
-            }
-            
-            severity_map = {
-                'low': '🟡',
-                'medium': '🟠', 
-                'high': '🔴',
-                'critical': '🚨'
-            }
-            
-            alert_emoji = emoji_map.get(alert_type, '⚠️')
-            severity_emoji = severity_map.get(severity, '🟠')
-            
-            message = f"""
-{alert_emoji} <b>리스크 알림</b> {severity_emoji}
-
-🏷️ 유형: {alert_type.replace('_', ' ').title()}
-📍 심볼: {alert_info.get('symbol', 'N/A')}
-⚠️ 경고도: {severity.upper()}
-📝 메시지: {alert_info.get('message', '상세 정보 없음')}
-
-<i>즉시 확인이 필요합니다.</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
-            logger.warning(f"리스크 알림 전송: {alert_type} - {alert_info.get('symbol')}")
+            if self._send_event('risk', alert_info):
+                logger.warning("리스크 알림 전송: %s - %s", alert_info.get('type', 'unknown'), alert_info.get('symbol'))
         except Exception as e:
             logger.error(f"리스크 알림 전송 실패: {e}")
     
     def send_system_status(self, status_info: dict):
         """시스템 상태 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            status = status_info.get('status', 'unknown')
-            status_emoji = "🟢" if status == 'running' else "🔴" if status == 'error' else "🟡"
-            
-            message = f"""
-🖥️ <b>시스템 상태</b> {status_emoji}
-
-📊 상태: {status.upper()}
-💾 메모리: {status_info.get('memory_percent', 0):.1f}%
-⚡ CPU: {status_info.get('cpu_percent', 0):.1f}%
-🌐 네트워크: {status_info.get('network_status', 'unknown').upper()}
-⏱️ 업타임: {status_info.get('uptime_hours', 0):.1f}시간
-
-<i>시스템 상태 점검 완료</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
+            self._send_event('system_status', status_info)
             logger.info("시스템 상태 알림 전송 완료")
         except Exception as e:
             logger.error(f"시스템 상태 알림 전송 실패: {e}")
     
     def send_daily_summary(self, summary_info: dict):
         """일일 요약 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            message = f"""
-📊 <b>일일 거래 요약</b>
-
-📅 날짜: {summary_info.get('date', '오늘')}
-💰 일일 손익: ${summary_info.get('daily_pnl', 0):+,.2f}
-📈 거래 횟수: {summary_info.get('trades_count', 0)}회
-🎯 승률: {summary_info.get('win_rate', 0):.1f}%
-📊 최고 수익: ${summary_info.get('max_profit', 0):,.2f}
-📉 최대 손실: ${summary_info.get('max_loss', 0):,.2f}
-
-<i>오늘의 거래 결과입니다.</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
+            self._send_event('daily_summary', summary_info)
             logger.info("일일 요약 알림 전송 완료")
         except Exception as e:
             logger.error(f"일일 요약 알림 전송 실패: {e}")
     
     def send_trading_cycle_log(self, cycle_info: dict):
         """실시간 거래 사이클 로그 전송"""
-        if not self.enabled:
-            return
-        
         try:
-            cycle_num = cycle_info.get('cycle_number', 0)
-            duration = cycle_info.get('duration', 0)
-            opportunities = cycle_info.get('opportunities', {})
-            trades_executed = cycle_info.get('trades_executed', 0)
-            
-            # 기회 발견 상황 요약
-            opp_summary = []
-            for strategy, count in opportunities.items():
-                if count > 0:
-                    emoji_map = {
-                        'arbitrage': '🔀',
-                        'trend_following': '📈', 
-                        'hedging': '🛡️',
-                        'momentum': '⚡'
-                    }
-                    opp_summary.append(f"{emoji_map.get(strategy, '📊')} {strategy}: {count}개")
-            
-            if not opp_summary:
-                opp_text = "❌ 기회 없음"
-            else:
-                opp_text = "\n".join(opp_summary)
-            
-            # 거래 실행 상태
-            trade_emoji = "💰" if trades_executed > 0 else "⏳"
-            
-            message = f"""
-🔄 <b>거래 사이클 #{cycle_num}</b>
-
-⏱️ 실행 시간: {duration:.1f}초
-📊 거래 기회:
-{opp_text}
-
-{trade_emoji} 실행된 거래: {trades_executed}개
-📅 시간: {__import__('datetime').datetime.now().strftime('%H:%M:%S')}
-
-<i>사이클 완료</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
-            
+            self._send_event('trading_cycle', cycle_info)
         except Exception as e:
             logger.error(f"거래 사이클 로그 전송 실패: {e}")
     
     def send_market_analysis_log(self, analysis_info: dict):
         """시장 분석 로그 전송"""
-        if not self.enabled:
-            return
-        
         try:
-            symbols_count = analysis_info.get('symbols_analyzed', 0)
-            top_signals = analysis_info.get('top_signals', [])
-            market_condition = analysis_info.get('market_condition', 'neutral')
-            
-            condition_emoji = {
-                'bullish': '🐂',
-                'bearish': '🐻', 
-                'neutral': '📊',
-                'volatile': '⚡'
-            }.get(market_condition, '📊')
-            
-            message = f"""
-📈 <b>시장 분석 리포트</b>
-
-📊 분석 심볼: {symbols_count}개
-{condition_emoji} 시장 상황: {market_condition.title()}
-
-🎯 주요 신호:
-"""
-            
-            if top_signals:
-                for signal in top_signals[:3]:  # 상위 3개만
-                    symbol = signal.get('symbol', 'N/A')
-                    strategy = signal.get('strategy', 'N/A')
-                    confidence = signal.get('confidence', 0) * 100
-                    message += f"• {symbol}: {strategy} ({confidence:.0f}%)\n"
-            else:
-                message += "• 현재 유효한 신호 없음\n"
-            
-            message += f"\n📅 {__import__('datetime').datetime.now().strftime('%H:%M:%S')}"
-            
-            self.telegram.send_message(message)
-            
+            self._send_event('market_analysis', analysis_info)
         except Exception as e:
             logger.error(f"시장 분석 로그 전송 실패: {e}")
     
     def send_performance_log(self, performance_info: dict):
         """성과 로그 전송 (시간별)"""
-        if not self.enabled:
-            return
-        
         try:
-            current_balance = performance_info.get('current_balance', 0)
-            hourly_pnl = performance_info.get('hourly_pnl', 0)
-            hourly_pnl_pct = performance_info.get('hourly_pnl_pct', 0)
-            total_trades = performance_info.get('total_trades', 0)
-            win_rate = performance_info.get('win_rate', 0)
-            
-            pnl_emoji = "💚" if hourly_pnl >= 0 else "❤️"
-            
-            message = f"""
-💎 <b>시간별 성과 리포트</b>
-
-💰 현재 잔고: ${current_balance:,.2f}
-{pnl_emoji} 시간 손익: ${hourly_pnl:+,.2f} ({hourly_pnl_pct:+.2f}%)
-📊 총 거래: {total_trades}회
-🎯 승률: {win_rate:.1f}%
-
-📅 {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-<i>성과 추적 중...</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
-            
+            self._send_event('performance', performance_info)
         except Exception as e:
             logger.error(f"성과 로그 전송 실패: {e}")
     
     def send_opportunity_alert(self, opportunity_info: dict):
         """거래 기회 발견 즉시 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            strategy = opportunity_info.get('strategy', 'unknown')
-            symbol = opportunity_info.get('symbol', 'N/A')
-            confidence = opportunity_info.get('confidence', 0) * 100
-            expected_return = opportunity_info.get('expected_return', 0) * 100
-            
-            strategy_emoji = {
-                'arbitrage': '🔀',
-                'trend_following': '📈',
-                'hedging': '🛡️', 
-                'momentum': '⚡'
-            }.get(strategy, '📊')
-            
-            message = f"""
-🚨 <b>거래 기회 발견!</b>
-
-{strategy_emoji} 전략: {strategy.replace('_', ' ').title()}
-💎 심볼: {symbol}
-🎯 신뢰도: {confidence:.0f}%
-💰 예상 수익: {expected_return:.2f}%
-
-⏰ 발견 시간: {__import__('datetime').datetime.now().strftime('%H:%M:%S')}
-
-<i>거래 검토 중...</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
-            logger.info(f"거래 기회 알림 전송: {strategy} - {symbol}")
-            
+            self._send_event('opportunity', opportunity_info)
+            logger.info("거래 기회 알림 전송: %s - %s",
+                        opportunity_info.get('strategy', 'unknown'), opportunity_info.get('symbol', 'N/A'))
         except Exception as e:
             logger.error(f"거래 기회 알림 전송 실패: {e}")
     
     def send_error_log(self, error_info: dict):
         """오류 로그 전송"""
-        if not self.enabled:
-            return
-        
         try:
-            error_type = error_info.get('type', 'unknown')
-            error_message = error_info.get('message', 'No details')
-            severity = error_info.get('severity', 'medium')
-            
-            severity_emoji = {
-                'low': '🟡',
-                'medium': '🟠',
-                'high': '🔴', 
-                'critical': '🚨'
-            }.get(severity, '🟠')
-            
-            message = f"""
-{severity_emoji} <b>시스템 오류</b>
-
-⚠️ 유형: {error_type.replace('_', ' ').title()}
-📝 메시지: {error_message}
-🔧 심각도: {severity.upper()}
-
-📅 발생 시간: {__import__('datetime').datetime.now().strftime('%H:%M:%S')}
-
-<i>오류 처리 중...</i>
-            """.strip()
-            
-            self.telegram.send_message(message)
-            
+            self._send_event('error', error_info)
         except Exception as e:
             logger.error(f"오류 로그 전송 실패: {e}")
     
     def send_shutdown_message(self):
         """봇 종료 알림"""
-        if not self.enabled:
-            return
-        
         try:
-            message = f"""
-🔴 <b>트레이딩 봇 종료</b>
-
-📅 종료 시간: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-💡 상태: 정상 종료
-
-<i>봇이 안전하게 종료되었습니다.</i>
-            """.strip()
+            message = _SHUTDOWN_TMPL.format(time=_ts(int(time.time())))
             
+            # 대기 중인 메시지를 제한 시간까지 전송한 뒤 종료 알림은 직접 전송 (묶음 대기 없이 마지막으로 도착)
+            if self._worker is not None and not self._wait_for_queue(_SHUTDOWN_FLUSH_TIMEOUT):
+                logger.warning("텔레그램 대기열 전송 시간 초과, 남은 메시지 %d건 버림", self._drain_queue())
             self.telegram.send_message(message)
             logger.info("봇 종료 알림 전송 완료")
         except Exception as e:
-            logger.error(f"종료 알림 전송 실패: {e}")
\ No newline at end of file
+            logger.error(f"종료 알림 전송 실패: {e}")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+상태형 지표 모듈 단위 테스트
+"""
+
+import unittest
+import numpy as np
+import talib
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.incremental_indicators import IncrementalEMA, IncrementalRSI, IncrementalMACD, IncrementalBB
+from modules.technical_analysis import TechnicalAnalyzer
+
+
+class TestIncrementalIndicators(unittest.TestCase):
+    """상태형 지표 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        np.random.seed(3)
+        self.close = 50000 + np.cumsum(np.random.randn(400) * 100)
+
+    def test_warmup_matches_talib(self):
+        """워밍업 결과가 talib 마지막 값과 일치하는지 테스트"""
+        self.assertAlmostEqual(IncrementalEMA(20).warmup(self.close), talib.EMA(self.close, 20)[-1], places=6)
+        self.assertAlmostEqual(IncrementalRSI(14).warmup(self.close), talib.RSI(self.close, 14)[-1], places=8)
+
+        macd, signal, hist = IncrementalMACD(12, 26, 9).warmup(self.close)
+        expected = talib.MACD(self.close, 12, 26, 9)
+        self.assertAlmostEqual(macd, expected[0][-1], places=6)
+        self.assertAlmostEqual(signal, expected[1][-1], places=6)
+        self.assertAlmostEqual(hist, expected[2][-1], places=6)
+
+        upper, middle, lower = IncrementalBB(20, 2).warmup(self.close)
+        expected = talib.BBANDS(self.close, 20, 2, 2, 0)
+        self.assertAlmostEqual(upper, expected[0][-1], places=6)
+        self.assertAlmostEqual(middle, expected[1][-1], places=6)
+        self.assertAlmostEqual(lower, expected[2][-1], places=6)
+
+    def test_update_matches_warmup(self):
+        """한 번에 워밍업한 결과와 하나씩 갱신한 결과 일치 테스트"""
+        for make in (lambda: IncrementalEMA(10), lambda: IncrementalRSI(14),
+                     lambda: IncrementalMACD(12, 26, 9), lambda: IncrementalBB(20, 2)):
+            full = make()
+            stepped = make()
+            expected = full.warmup(self.close)
+            stepped.warmup(self.close[:100])
+            for price in self.close[100:-1]:
+                stepped.update(price)
+
+            # peek는 상태를 바꾸지 않음
+            np.testing.assert_allclose(stepped.peek(self.close[-1]), expected, rtol=1e-9)
+            np.testing.assert_allclose(stepped.peek(self.close[-1]), expected, rtol=1e-9)
+            np.testing.assert_allclose(stepped.update(self.close[-1]), expected, rtol=1e-9)
+
+    def test_short_history(self):
+        """데이터 부족 시 기본값 테스트"""
+        self.assertTrue(np.isnan(IncrementalEMA(20).warmup(self.close[:5])))
+        self.assertEqual(IncrementalRSI(14).warmup(self.close[:5]), 50.0)
+        self.assertTrue(np.isnan(IncrementalBB(20).warmup(self.close[:5])[1]))
+
+    def test_analyzer_update_incremental(self):
+        """분석기 심볼별 상태 갱신 테스트 (진행 중인 캔들은 상태에 반영하지 않음)"""
+        analyzer = TechnicalAnalyzer({})
+        timestamps = np.arange(len(self.close), dtype=np.int64) * 60000
+
+        analyzer.update_incremental('BTC/USDT', timestamps[:300], self.close[:300])
+        result = analyzer.update_incremental('BTC/USDT', timestamps, self.close)
+
+        self.assertAlmostEqual(result['rsi'], talib.RSI(self.close, 14)[-1], places=8)
+        self.assertAlmostEqual(result['ema_20'], talib.EMA(self.close, 20)[-1], places=6)
+        self.assertAlmostEqual(result['bb']['middle'], talib.SMA(self.close, 20)[-1], places=6)
+
+        # 같은 캔들의 종가만 바뀌어도 확정 상태는 그대로 유지
+        changed = self.close.copy()
+        changed[-1] += 500.0
+        result = analyzer.update_incremental('BTC/USDT', timestamps, changed)
+        self.assertAlmostEqual(result['rsi'], talib.RSI(changed, 14)[-1], places=8)
+
+        analyzer.reset_incremental('BTC/USDT')
+        self.assertNotIn('BTC/USDT', analyzer._incremental)
+
+    def test_analyzer_update_incremental_stale_history(self):
+        """오래된 이력이 들어와도 다음 갱신에서 캔들을 중복 반영하지 않는지 테스트"""
+        analyzer = TechnicalAnalyzer({})
+        timestamps = np.arange(len(self.close), dtype=np.int64) * 60000
+
+        analyzer.update_incremental('BTC/USDT', timestamps[:400], self.close[:400])
+        analyzer.update_incremental('BTC/USDT', timestamps[:300], self.close[:300])
+        self.assertEqual(analyzer._incremental['BTC/USDT'][0], timestamps[398])
+
+        result = analyzer.update_incremental('BTC/USDT', timestamps, self.close)
+        self.assertAlmostEqual(result['ema_20'], talib.EMA(self.close, 20)[-1], places=6)
+        self.assertAlmostEqual(result['rsi'], talib.RSI(self.close, 14)[-1], places=8)
+
+
+if __name__ == '__main__':
+    unittest.main()
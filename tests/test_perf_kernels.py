@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+성과 지표 커널 단위 테스트
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules._perf_kernels import perf_kernel, kelly_fraction, kelly_size_kernel, stop_loss_kernel, take_profit_kernel
+
+
+class TestPerfKernel(unittest.TestCase):
+    """성과 지표 커널 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        np.random.seed(42)
+        self.values = 1000 + np.cumsum(np.random.randn(500) * 5)
+
+    def test_matches_numpy_reference(self):
+        """NumPy 기준 계산과 일치하는지 테스트"""
+        max_dd, mean, std, sharpe = perf_kernel(self.values)
+
+        returns = np.diff(np.log(self.values))
+        running_peak = np.maximum.accumulate(self.values)
+        expected_dd = np.max((running_peak - self.values) / running_peak)
+
+        self.assertAlmostEqual(max_dd, expected_dd, places=10)
+        self.assertAlmostEqual(mean, returns.mean(), places=10)
+        self.assertAlmostEqual(std, returns.std(ddof=1), places=10)
+        self.assertAlmostEqual(sharpe, returns.mean() / returns.std(ddof=1) * np.sqrt(252), places=8)
+
+    def test_annualization_factor(self):
+        """연율화 기간 수 적용 테스트"""
+        _, _, _, daily_sharpe = perf_kernel(self.values, 1.0)
+        _, _, _, annual_sharpe = perf_kernel(self.values, 365.0)
+
+        self.assertAlmostEqual(annual_sharpe, daily_sharpe * np.sqrt(365), places=8)
+
+    def test_short_series(self):
+        """데이터 부족 시 0 반환 테스트"""
+        self.assertEqual(perf_kernel(np.array([1000.0])), (0.0, 0.0, 0.0, 0.0))
+
+    def test_single_return(self):
+        """수익률 1개일 때 변동성 0 테스트"""
+        max_dd, mean, std, sharpe = perf_kernel(np.array([1000.0, 1010.0]))
+
+        self.assertAlmostEqual(mean, np.log(1.01))
+        self.assertEqual(std, 0.0)
+        self.assertEqual(sharpe, 0.0)
+
+    def test_flat_series(self):
+        """변동 없는 시계열의 샤프 비율 테스트"""
+        max_dd, mean, std, sharpe = perf_kernel(np.full(10, 1000.0))
+
+        self.assertEqual(max_dd, 0.0)
+        self.assertEqual(std, 0.0)
+        self.assertEqual(sharpe, 0.0)
+
+    def test_non_positive_values(self):
+        """0 이하 값이 포함된 구간은 수익률 계산에서 제외하는지 테스트"""
+        values = np.array([1000.0, 1010.0, 0.0, 990.0, 1000.0])
+        max_dd, mean, std, sharpe = perf_kernel(values)
+
+        returns = np.log([1010.0 / 1000.0, 1000.0 / 990.0])
+        self.assertEqual(max_dd, 1.0)
+        self.assertAlmostEqual(mean, returns.mean(), places=12)
+        self.assertAlmostEqual(std, returns.std(ddof=1), places=12)
+        self.assertTrue(np.isfinite(sharpe))
+
+
+class TestRiskKernels(unittest.TestCase):
+    """리스크 계산 커널 테스트 클래스"""
+
+    def test_kelly_size(self):
+        """Kelly 포지션 크기 계산 테스트"""
+        kelly = kelly_fraction(0.55, 0.15, 0.08)
+        self.assertEqual(kelly, 0.25)
+        self.assertAlmostEqual(kelly_fraction(0.5, 0.10, 0.08), 0.1)
+        self.assertEqual(kelly_fraction(0.3, 0.05, 0.10), 0.0)
+
+        expected = 10000 * kelly * 0.05 / (1 + 0.02 * 10) / 50000
+        size = kelly_size_kernel(0.05, 10000.0, 50000.0, 0.02, 0.02, kelly)
+        self.assertAlmostEqual(size, expected, places=12)
+
+        # 최대 리스크 제한 적용
+        size = kelly_size_kernel(1.0, 10000.0, 50000.0, 0.0, 0.02, kelly)
+        self.assertAlmostEqual(size, 10000 * 0.02 / 50000, places=12)
+
+    def test_stop_loss_and_take_profit(self):
+        """스탑로스/테이크프로핏 가격 계산 테스트"""
+        self.assertAlmostEqual(stop_loss_kernel(True, 100.0, 0.02, 0.05), 95.0)
+        self.assertAlmostEqual(stop_loss_kernel(False, 100.0, 0.02, 0.05), 105.0)
+        self.assertAlmostEqual(stop_loss_kernel(True, 100.0, 0.1, 0.05), 80.0)
+        self.assertAlmostEqual(take_profit_kernel(True, 100.0, 0.5, 0.10, 0.10), 110.0)
+        self.assertAlmostEqual(take_profit_kernel(False, 100.0, 0.5, 0.10, 0.10), 90.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
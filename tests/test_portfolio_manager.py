@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+포트폴리오 관리 모듈 단위 테스트
+"""
+
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.portfolio_manager import PortfolioManager
+
+
+class TestPortfolioSummary(unittest.TestCase):
+    """포트폴리오 요약 조회 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.exchange = MagicMock()
+        self.exchange.get_spot_balance.return_value = {'total': {'USDT': 600.0}, 'free': {'USDT': 500.0}, 'used': {}}
+        self.exchange.get_futures_balance.return_value = {'total': {'USDT': 400.0}, 'free': {'USDT': 300.0}, 'used': {}}
+        self.exchange.get_tickers.return_value = {}
+        self.manager = PortfolioManager({'initial_balance': 1000}, self.exchange, MagicMock())
+
+    def test_summary_does_not_touch_history(self):
+        """요약 조회가 잔고 이력/성과 지표를 변경하지 않는지 테스트"""
+        summary = self.manager.get_portfolio_summary()
+
+        self.assertEqual(summary['spot_balance'], 600.0)
+        self.assertEqual(summary['futures_balance'], 400.0)
+        self.assertEqual(len(self.manager.balance_history), 0)
+        self.assertEqual(self.manager.performance_metrics, {})
+        self.exchange.get_positions.assert_not_called()
+
+        # TTL 내 재호출 시 잔고 재조회 없음
+        self.manager.get_portfolio_summary()
+        self.assertEqual(self.exchange.get_spot_balance.call_count, 1)
+
+    def test_summary_on_balance_failure(self):
+        """잔고 조회 실패 시 기본 요약 반환 테스트"""
+        self.exchange.get_spot_balance.return_value = {'total': {}, 'free': {}, 'used': {}}
+
+        summary = self.manager.get_portfolio_summary()
+
+        self.assertEqual(summary['total_balance'], 1000)
+        self.assertEqual(summary['spot_balance'], 1000 * self.manager.spot_allocation)
+        self.assertIsNone(self.manager._last_update)
+
+    def test_unchanged_value_skips_history_but_refreshes_metrics(self):
+        """가치가 같으면 잔고 기록은 추가하지 않고 거래/포지션 변화는 메트릭에 반영하는지 테스트"""
+        self.exchange.get_positions.return_value = []
+        self.manager.update_portfolio_state()
+        self.manager.update_portfolio_state()
+        self.assertEqual(len(self.manager.balance_history), 1)
+
+        self.exchange.get_spot_balance.return_value = {'total': {'USDT': 700.0}, 'free': {'USDT': 700.0}, 'used': {}}
+        self.manager.update_portfolio_state()
+        self.assertEqual(len(self.manager.balance_history), 2)
+        self.assertEqual(self.manager.performance_metrics['total_trades'], 0)
+
+        # 가치는 그대로지만 거래 수가 늘면 재계산 (trade_history 길이와 무관한 누적 카운터 기준)
+        self.manager._executed_trades += 1
+        self.manager.update_portfolio_state()
+        self.assertEqual(len(self.manager.balance_history), 2)
+        self.assertEqual(self.manager.performance_metrics['total_trades'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
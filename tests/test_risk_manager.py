@@ -6,6 +6,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
+import time
+import numpy as np
 import sys
 import os
 
@@ -183,6 +185,25 @@ class TestRiskManager(unittest.TestCase):
         # 매도 시 테이크프로핏은 진입가보다 낮아야 함
         self.assertLess(sell_take_profit, entry_price)
     
+    def test_batch_calculations_match_scalar(self):
+        """일괄 계산 결과가 단건 계산과 일치하는지 테스트"""
+        sides = ['buy', 'sell', 'buy']
+        prices = [50000.0, 3000.0, 1.5]
+        strengths = [0.2, 0.7, 1.0]
+        vols = [0.01, 0.03, 0.08]
+        
+        sizes = self.risk_manager.calculate_position_sizes_batch(strengths, [1000.0] * 3, prices, vols)
+        stops = self.risk_manager.calculate_stop_losses_batch(sides, prices, vols)
+        targets = self.risk_manager.calculate_take_profits_batch(sides, prices, strengths)
+        
+        for i in range(3):
+            self.assertAlmostEqual(sizes[i], self.risk_manager.calculate_position_size(
+                'X', strengths[i], 1000.0, prices[i], vols[i]))
+            self.assertAlmostEqual(stops[i], self.risk_manager.calculate_stop_loss(
+                'X', sides[i], prices[i], vols[i]))
+            self.assertAlmostEqual(targets[i], self.risk_manager.calculate_take_profit(
+                'X', sides[i], prices[i], strengths[i]))
+    
     def test_add_and_remove_position(self):
         """포지션 추가 및 제거 테스트"""
         symbol = 'BTC/USDT'
@@ -205,6 +226,9 @@ class TestRiskManager(unittest.TestCase):
         self.assertEqual(position['size'], 0.001)
         self.assertEqual(position['price'], 50000)
         
+        self.assertEqual(position.side, 'buy')
+        self.assertEqual(position.to_dict()['take_profit_price'], 55000)
+        
         # 포지션 제거
         self.risk_manager.remove_position(symbol)
         
@@ -292,6 +316,74 @@ class TestRiskManager(unittest.TestCase):
         take_profit_alerts = [alert for alert in alerts if alert['type'] == 'take_profit']
         self.assertGreater(len(take_profit_alerts), 0)
     
+    def test_update_prices_bulk(self):
+        """전체 포지션 가격 일괄 업데이트 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'buy', 0.001, 50000, 'spot', 47500, 55000)
+        self.risk_manager.add_position('ETH/USDT', 'sell', 0.1, 3000, 'futures', 3150, 2700)
+        self.risk_manager.add_position('XRP/USDT', 'buy', 10, 0.5)
+        
+        prices = np.zeros(len(self.risk_manager._sizes))
+        for symbol, price in {'BTC/USDT': 47000, 'ETH/USDT': 2600, 'XRP/USDT': 0.1}.items():
+            prices[self.risk_manager._sym_idx[symbol]] = price
+        self.risk_manager.update_prices_bulk(prices)
+        
+        self.assertEqual(self.risk_manager.positions['ETH/USDT']['current_price'], 2600)
+        alerts = self.risk_manager.get_risk_alerts()
+        self.assertEqual({(a['type'], a['symbol']) for a in alerts},
+                         {('stop_loss', 'BTC/USDT'), ('take_profit', 'ETH/USDT')})
+        self.assertAlmostEqual(self.risk_manager.positions['ETH/USDT']['unrealized_pnl'], 40.0)
+    
+    def test_update_prices_bulk_skips_unpriced(self):
+        """시세 없는 항목(0/NaN)은 가격 반영/알림에서 제외하는지 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'buy', 0.001, 50000, 'spot', 47500, 55000)
+        self.risk_manager.add_position('ETH/USDT', 'sell', 0.1, 3000, 'futures', 3150, 2700)
+        
+        self.risk_manager.update_prices_bulk({'BTC/USDT': 51000, 'ETH/USDT': 0.0})
+        self.risk_manager.update_prices_bulk({'ETH/USDT': float('nan')})
+        
+        self.assertEqual(self.risk_manager.positions['ETH/USDT']['current_price'], 3000)
+        self.assertAlmostEqual(self.risk_manager.positions['BTC/USDT']['unrealized_pnl'], 1.0)
+        self.assertEqual(self.risk_manager.get_risk_alerts(), [])
+    
+    def test_update_positions_risk_bulk(self):
+        """여러 포지션 리스크 일괄 업데이트 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'buy', 0.001, 50000, 'spot', 47500, 55000)
+        self.risk_manager.add_position('ETH/USDT', 'sell', 0.1, 3000, 'futures', 3150, 2700)
+        
+        self.risk_manager.update_positions_risk_bulk({
+            'BTC/USDT': (52000, 2.0),
+            'ETH/USDT': (3200, -20.0),
+            'XRP/USDT': (0.5, 0.0)  # 미보유 심볼은 무시
+        })
+        
+        self.assertEqual(self.risk_manager.positions['BTC/USDT']['current_price'], 52000)
+        self.assertAlmostEqual(self.risk_manager.get_risk_summary()['total_unrealized_pnl'], -18.0)
+        alerts = self.risk_manager.get_risk_alerts()
+        self.assertEqual([(a['type'], a['symbol']) for a in alerts], [('stop_loss', 'ETH/USDT')])
+    
+    def test_tick_update(self):
+        """틱 단위 통합 업데이트 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'buy', 0.01, 50000, 'spot', 47500, 55000)
+        self.risk_manager.add_position('ETH/USDT', 'sell', 0.1, 3000, 'futures', 3150, 2700)
+        self.risk_manager.add_position('XRP/USDT', 'buy', 10, 0.5)
+        self.risk_manager._entry_ns[self.risk_manager._sym_idx['XRP/USDT']] -= 25 * 3_600_000_000_000
+        
+        self.risk_manager.tick_update({'BTC/USDT': 52000, 'ETH/USDT': 2600, 'XRP/USDT': 0.6, 'SOL/USDT': 100})
+        
+        btc = self.risk_manager.positions['BTC/USDT']
+        eth = self.risk_manager.positions['ETH/USDT']
+        self.assertEqual(btc['current_price'], 52000)
+        self.assertAlmostEqual(btc['unrealized_pnl'], 20.0)
+        self.assertAlmostEqual(eth['unrealized_pnl'], 40.0)
+        
+        summary = self.risk_manager.get_risk_summary()
+        self.assertAlmostEqual(summary['total_unrealized_pnl'], 61.0)
+        self.assertAlmostEqual(summary['short_position_value'], 260.0)
+        
+        alerts = self.risk_manager.get_risk_alerts()
+        self.assertEqual({(a['type'], a['symbol']) for a in alerts},
+                         {('take_profit', 'ETH/USDT'), ('timeout', 'XRP/USDT')})
+    
     def test_position_timeout(self):
         """포지션 타임아웃 테스트"""
         symbol = 'BTC/USDT'
@@ -308,6 +400,7 @@ class TestRiskManager(unittest.TestCase):
         # 진입 시간을 과거로 설정
         position = self.risk_manager.positions[symbol]
         position['entry_time'] = datetime.now() - timedelta(hours=25)  # 25시간 전
+        position['entry_ns'] = time.monotonic_ns() - 25 * 3_600_000_000_000
         
         # 포지션 리스크 업데이트
         self.risk_manager.update_position_risk(
@@ -370,6 +463,19 @@ class TestRiskManager(unittest.TestCase):
         
         # 포지션 개수 확인
         self.assertEqual(summary['total_positions'], 2)
+        self.assertAlmostEqual(summary['total_position_value'], 350.0)
+        self.assertAlmostEqual(summary['short_position_value'], 300.0)
+    
+    def test_position_capacity_growth(self):
+        """포지션 배열 용량 확장 테스트"""
+        risk_manager = RiskManager({**self.config, 'position_capacity': 2})
+        for i in range(5):
+            risk_manager.add_position(f'COIN{i}/USDT', 'buy', 1.0, 10.0 * (i + 1))
+        risk_manager.remove_position('COIN0/USDT')
+        
+        summary = risk_manager.get_risk_summary()
+        self.assertEqual(summary['total_positions'], 4)
+        self.assertAlmostEqual(summary['total_position_value'], 140.0)
     
     def test_emergency_stop(self):
         """비상 정지 테스트"""
@@ -382,6 +488,18 @@ class TestRiskManager(unittest.TestCase):
         emergency_alerts = [alert for alert in alerts if alert['type'] == 'emergency_stop']
         self.assertGreater(len(emergency_alerts), 0)
         self.assertEqual(emergency_alerts[0]['message'], f"비상 정지: {reason}")
+        self.assertIsInstance(emergency_alerts[0]['timestamp'], datetime)
+    
+    def test_risk_alert_buffer_bounded(self):
+        """리스크 알림 버퍼 한도 테스트"""
+        risk_manager = RiskManager({**self.config, 'max_alert_buffer': 3})
+        for i in range(5):
+            risk_manager.emergency_stop(f"reason {i}")
+        
+        alerts = risk_manager.get_risk_alerts()
+        self.assertIsInstance(alerts, list)
+        self.assertEqual([a['message'] for a in alerts], [f"비상 정지: reason {i}" for i in range(2, 5)])
+        self.assertEqual(risk_manager.get_risk_alerts(), [])
     
     def test_reset_daily_metrics(self):
         """일일 메트릭 초기화 테스트"""
@@ -429,7 +547,50 @@ class TestRiskManagerShortSelling(unittest.TestCase):
         self.assertFalse(result['is_valid'])
         error_messages = [error for error in result['errors'] if '공매도 포지션 한도' in error]
         self.assertGreater(len(error_messages), 0)
-
+    
+    def test_short_aggregate_tracking(self):
+        """공매도 집계값 증분 갱신 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'sell', 0.002, 50000, 'futures')
+        self.risk_manager.add_position('ETH/USDT', 'buy', 0.1, 3000, 'spot')
+        self.assertAlmostEqual(self.risk_manager._short_notional_value, 100.0)
+        
+        # 가격 변동은 현재 가치에만 반영
+        self.risk_manager.update_position_risk('BTC/USDT', 51000)
+        summary = self.risk_manager.get_risk_summary()
+        self.assertAlmostEqual(summary['short_position_value'], 102.0)
+        self.assertAlmostEqual(summary['total_position_value'], 402.0)
+        self.assertAlmostEqual(self.risk_manager._short_notional_value, 100.0)
+        
+        # 제거 시 차감
+        self.risk_manager.remove_position('BTC/USDT')
+        summary = self.risk_manager.get_risk_summary()
+        self.assertAlmostEqual(summary['short_position_value'], 0.0)
+        self.assertAlmostEqual(self.risk_manager._short_notional_value, 0.0)
+    
+    
+    def test_validate_trades_batch_accumulates_short_limit(self):
+        """일괄 검증 시 공매도 한도 누적 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'sell', 0.002, 50000, 'futures')  # 100
+        orders = [
+            {'symbol': 'ETH/USDT', 'side': 'sell', 'size': 0.05, 'price': 3000, 'exchange_type': 'futures'},  # 150
+            {'symbol': 'ADA/USDT', 'side': 'sell', 'size': 60, 'price': 1, 'exchange_type': 'futures'},  # 60
+            {'symbol': 'XRP/USDT', 'side': 'sell', 'size': 40, 'price': 1, 'exchange_type': 'futures'},  # 40
+            {'symbol': 'SOL/USDT', 'side': 'buy', 'size': 0.1, 'price': 100, 'exchange_type': 'spot'}
+        ]
+        
+        results = self.risk_manager.validate_trades_batch(orders, current_balance=1000)
+        
+        # 한도 300: 100 + 150 통과, +60 거부, +40 통과
+        self.assertEqual([r['is_valid'] for r in results], [True, False, True, True])
+        
+        # 단건 검증 결과와 동일한 형식
+        single = self.risk_manager.validate_trade('SOL/USDT', 'buy', 0.1, 100, 1000, 'spot')
+        self.assertEqual(results[3], single)
+    
+    def test_recent_price_change_zero_entry_price(self):
+        """진입가 0 포지션의 가격 변화 계산 테스트"""
+        self.risk_manager.add_position('BTC/USDT', 'sell', 0.002, 0, 'futures')
+        self.assertEqual(self.risk_manager._calculate_recent_price_change('BTC/USDT'), 0.0)
 
 if __name__ == '__main__':
     # 테스트 스위트 생성
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+전략 엔진 모듈 단위 테스트
+"""
+
+import json
+import unittest
+import asyncio
+from unittest.mock import MagicMock
+import numpy as np
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.strategy_engine import StrategyEngine
+
+
+class TestStrategyEngine(unittest.TestCase):
+    """전략 엔진 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.config = {
+            'spot_allocation': 0.6,
+            'futures_allocation': 0.4,
+            'max_leverage': 5,
+            'risk_per_trade': 0.02
+        }
+        self.strategy_engine = StrategyEngine(self.config, MagicMock())
+    
+    def _make_ohlcv(self, limit=100, scale=1.0):
+        """테스트용 컬럼별 캔들 배열 생성"""
+        close = np.linspace(100, 110, limit) * scale
+        return {
+            'timestamp': 1704067200000 + np.arange(limit, dtype=np.int64) * 3_600_000,
+            'open': close.copy(),
+            'high': close * 1.01,
+            'low': close * 0.99,
+            'close': close,
+            'volume': np.full(limit, 1000.0)
+        }
+    
+    def test_spot_decision(self):
+        """현물 거래 결정 테스트"""
+        decision = self.strategy_engine._get_spot_decision({'combined_signal': 0.7}, 0.0)
+        self.assertEqual(decision['action'], 'buy')
+        self.assertAlmostEqual(decision['confidence'], 0.7)
+        self.assertAlmostEqual(decision['size'], 0.7 * 0.6)
+        
+        # 프리미엄 구간에서 매수 신호 약화
+        decision = self.strategy_engine._get_spot_decision({'combined_signal': 0.7}, 0.025)
+        self.assertAlmostEqual(decision['confidence'], 0.7 * 0.8)
+        
+        # 디스카운트 구간에서 매도 신호 약화
+        decision = self.strategy_engine._get_spot_decision({'combined_signal': -1.5}, -0.025)
+        self.assertEqual(decision['action'], 'sell')
+        self.assertAlmostEqual(decision['confidence'], 0.8)
+        
+        decision = self.strategy_engine._get_spot_decision({'combined_signal': 0.3}, 0.025)
+        self.assertEqual(decision['action'], 'hold')
+        self.assertEqual(decision['size'], 0)
+    
+    def test_futures_decision(self):
+        """선물 거래 결정 테스트"""
+        decision = self.strategy_engine._get_futures_decision({'combined_signal': -0.6}, 0.04)
+        self.assertEqual(decision['action'], 'sell')
+        self.assertAlmostEqual(decision['confidence'], 0.72)
+        self.assertAlmostEqual(decision['size'], 0.72 * 0.4)
+        self.assertEqual(decision['leverage'], 3)
+        
+        # 강화된 신뢰도는 1로 제한
+        decision = self.strategy_engine._get_futures_decision({'combined_signal': 0.9}, -0.04)
+        self.assertEqual(decision['action'], 'buy')
+        self.assertEqual(decision['confidence'], 1.0)
+        self.assertEqual(decision['leverage'], 5)
+        
+        decision = self.strategy_engine._get_futures_decision({}, 0.0)
+        self.assertEqual(decision['action'], 'hold')
+        self.assertEqual(decision['leverage'], 0)
+    
+    
+    def test_specialized_decision_kernel(self):
+        """설정값별 특수화 결정 커널 테스트"""
+        engine = StrategyEngine(dict(self.config, spot_allocation=0.5), MagicMock())
+        self.assertIs(StrategyEngine(self.config, MagicMock())._spot_decide, self.strategy_engine._spot_decide)
+        self.assertIsNot(engine._spot_decide, self.strategy_engine._spot_decide)
+        
+        decision = engine._get_spot_decision({'combined_signal': 0.7}, 0.0)
+        self.assertAlmostEqual(decision['size'], 0.7 * 0.5)
+    
+    def test_hybrid_strategy_selection(self):
+        """하이브리드 전략 선택 테스트"""
+        engine = self.strategy_engine
+        buy = {'action': 'buy', 'confidence': 0.8, 'size': 0.48}
+        sell = {'action': 'sell', 'confidence': 0.6, 'size': 0.24}
+        hold = {'action': 'hold', 'confidence': 0, 'size': 0}
+        
+        self.assertEqual(engine._apply_hybrid_strategy(buy, sell, 0.06)['strategy'], 'arbitrage')
+        self.assertEqual(engine._apply_hybrid_strategy(buy, buy, 0.0)['strategy'], 'trend_following')
+        self.assertEqual(engine._apply_hybrid_strategy(hold, hold, 0.0)['strategy'], 'trend_following')
+        hedge = engine._apply_hybrid_strategy(buy, sell, 0.0)
+        self.assertEqual(hedge['strategy'], 'hedge')
+        self.assertEqual(hedge['main_market'], 'spot')
+        self.assertEqual(engine._apply_hybrid_strategy(buy, hold, 0.0)['strategy'], 'spot_only')
+        self.assertEqual(engine._apply_hybrid_strategy(hold, sell, 0.0)['strategy'], 'futures_only')
+    
+    def test_generate_trade_decisions_matches_single(self):
+        """일괄 거래 결정과 단일 거래 결정 일치 테스트"""
+        market_data_list = [
+            {'symbol': 'BTC/USDT', 'premium': 0.0,
+             'spot_signals': {'combined_signal': 0.8}, 'futures_signals': {'combined_signal': 0.7}},
+            {'symbol': 'ETH/USDT', 'premium': 0.06,
+             'spot_signals': {'combined_signal': 0.6}, 'futures_signals': {'combined_signal': -0.9}},
+            {'symbol': 'XRP/USDT', 'premium': -0.01,
+             'spot_signals': {'combined_signal': -0.9}, 'futures_signals': {'combined_signal': 0.2}},
+            {'symbol': 'SOL/USDT', 'premium': 0.04,
+             'spot_signals': {'combined_signal': 0.7}, 'futures_signals': {'combined_signal': -0.6}},
+            {'symbol': 'ADA/USDT', 'premium': -0.035,
+             'spot_signals': {'combined_signal': -0.9}, 'futures_signals': {'combined_signal': 0.6}},
+            {},
+        ]
+        
+        decisions = self.strategy_engine.generate_trade_decisions(market_data_list)
+        self.assertEqual(len(decisions), 5)
+        
+        for market_data, decision in zip(market_data_list, decisions):
+            expected = self.strategy_engine.generate_trade_decision(market_data, debug=True)
+            fused = self.strategy_engine.generate_trade_decision(market_data)
+            self.assertEqual(fused['final_decision'], expected['final_decision'])
+            self.assertNotIn('hybrid_decision', fused)
+            self.assertEqual(decision['symbol'], expected['symbol'])
+            self.assertEqual(decision['spot_decision'], expected['spot_decision'])
+            self.assertEqual(decision['futures_decision'], expected['futures_decision'])
+            self.assertEqual(decision['hybrid_decision'], expected['hybrid_decision'])
+            self.assertEqual(decision['final_decision'], expected['final_decision'])
+    
+    
+    def test_analyze_markets(self):
+        """스레드 풀 시장 일괄 분석 테스트"""
+        def get_ohlcv_arrays(symbol, timeframe, limit, exchange_type):
+            if symbol == 'MISSING/USDT':
+                return {}
+            return self._make_ohlcv(limit, 1.02 if exchange_type == 'future' else 1.0)
+        
+        self.strategy_engine.exchange.get_ohlcv_arrays.side_effect = get_ohlcv_arrays
+        symbols = ['BTC/USDT', 'MISSING/USDT', 'ETH/USDT', 'XRP/USDT']
+        results = self.strategy_engine.analyze_markets(symbols)
+        
+        self.assertEqual([result['symbol'] for result in results], ['BTC/USDT', 'ETH/USDT', 'XRP/USDT'])
+        for result in results:
+            self.assertAlmostEqual(result['premium'], 0.02)
+            self.assertEqual(result, dict(self.strategy_engine.analyze_market(result['symbol']),
+                                          timestamp_ns=result['timestamp_ns']))
+        self.assertEqual(self.strategy_engine.analyze_markets([]), [])
+    
+    def test_analyze_markets_async(self):
+        """비동기 시장 일괄 분석 테스트"""
+        async def get_ohlcv_arrays_async(symbol, timeframe, limit, exchange_type):
+            if symbol == 'MISSING/USDT':
+                return {}
+            return self._make_ohlcv(limit, 1.01 if exchange_type == 'future' else 1.0)
+        
+        self.strategy_engine.exchange.get_ohlcv_arrays_async = get_ohlcv_arrays_async
+        results = asyncio.run(self.strategy_engine.analyze_markets_async(['BTC/USDT', 'MISSING/USDT', 'ETH/USDT']))
+        
+        self.assertEqual([result['symbol'] for result in results], ['BTC/USDT', 'ETH/USDT'])
+        self.assertAlmostEqual(results[0]['premium'], 0.01)
+        self.assertIn('spot_signals', results[0])
+        self.assertIsInstance(results[0]['timestamp_ns'], int)
+    
+    
+    def test_indicator_cache_by_last_candle(self):
+        """마지막 캔들 기준 지표 캐시 테스트"""
+        ohlcv = self._make_ohlcv()
+        analyzer = MagicMock(wraps=self.strategy_engine.technical_analyzer)
+        self.strategy_engine.technical_analyzer = analyzer
+        
+        first = self.strategy_engine._get_signals('BTC/USDT', 'spot', ohlcv)
+        second = self.strategy_engine._get_signals('BTC/USDT', 'spot', self._make_ohlcv())
+        self.assertEqual(first, second)
+        self.assertEqual(analyzer.get_all_indicators.call_count, 1)
+        
+        # 진행 중인 캔들의 종가가 바뀌면 다시 계산
+        updated = self._make_ohlcv()
+        updated['close'][-1] = 111.0
+        self.strategy_engine._get_signals('BTC/USDT', 'spot', updated)
+        self.assertEqual(analyzer.get_all_indicators.call_count, 2)
+    
+    
+    def test_strategy_performance(self):
+        """전략 성과 집계 테스트"""
+        engine = StrategyEngine(dict(self.config, position_capacity=2), MagicMock())
+        engine.update_position('BTC/USDT', {'size': 0.01, 'unrealized_pnl': 50.0, 'realized_pnl': 10.0})
+        engine.update_position('ETH/USDT', {'size': 0.1, 'unrealized_pnl': -30.0})
+        engine.update_position('XRP/USDT', {'size': 100})
+        engine.update_position('BTC/USDT', {'size': 0.01, 'unrealized_pnl': 20.0, 'realized_pnl': 10.0})
+        
+        position = engine.positions['BTC/USDT']
+        self.assertEqual(position.unrealized_pnl, 20.0)
+        self.assertEqual(position.get('size', 0), 0.01)
+        self.assertEqual(engine.positions['XRP/USDT']['realized_pnl'], 0)
+        
+        performance = engine.get_strategy_performance()
+        self.assertAlmostEqual(performance['total_pnl'], 0.0)
+        self.assertEqual(performance['winning_trades'], 1)
+        self.assertEqual(performance['losing_trades'], 1)
+        self.assertEqual(performance['total_trades'], 2)
+        self.assertEqual(performance['win_rate'], 50.0)
+        self.assertEqual(performance['active_positions'], 3)
+        self.assertEqual(performance['group_pnl'], {'BTC': 30.0, 'ETH': -30.0, 'XRP': 0.0})
+        
+        engine.update_position('BTC/USDT:USDT', {'size': 0.02, 'unrealized_pnl': -5.0})
+        self.assertEqual(engine.get_strategy_performance()['group_pnl']['BTC'], 25.0)
+        
+        engine.reset_strategy()
+        self.assertEqual(engine.get_strategy_performance()['total_trades'], 0)
+    
+    
+    def test_should_rebalance(self):
+        """리밸런싱 필요 여부 테스트"""
+        engine = self.strategy_engine
+        engine.exchange.get_spot_balance.return_value = {'total': {'USDT': 6000}}
+        engine.exchange.get_futures_balance.return_value = {'total': {'USDT': 4000}}
+        
+        # 최초 실행 시 리밸런싱 (시각이 기록되어 다음 호출부터는 주기 적용)
+        self.assertTrue(engine.should_rebalance())
+        self.assertIsNotNone(engine._last_rebalance_ts)
+        self.assertFalse(engine.should_rebalance())
+        
+        # 비율 변화가 임계값 초과
+        engine.exchange.get_spot_balance.return_value = {'total': {'USDT': 8000}}
+        self.assertTrue(engine.should_rebalance())
+        
+        # 6시간 경과
+        engine.exchange.get_spot_balance.return_value = {'total': {'USDT': 6000}}
+        engine._last_rebalance_ts -= 6 * 3600 + 1
+        self.assertTrue(engine.should_rebalance())
+    
+    
+    def test_existing_position_limits_size(self):
+        """기존 포지션 고려 크기 제한 테스트"""
+        self.strategy_engine.update_position('BTC/USDT', {'size': 0.05})
+        decision = self.strategy_engine._apply_risk_management({'size': 0.5, 'leverage': 10}, 'BTC/USDT')
+        
+        self.assertAlmostEqual(decision['size'], 0.01)
+        self.assertEqual(decision['leverage'], 5)
+    
+    def test_hold_decision_is_plain_copy(self):
+        """보류 결정이 수정/직렬화 가능한 복사본인지 테스트"""
+        engine = self.strategy_engine
+        hold = {'action': 'hold', 'confidence': 0, 'size': 0}
+        first = engine._execute_arbitrage_strategy(hold, hold, 0.0)
+        second = engine._execute_arbitrage_strategy(hold, hold, 0.0)
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(json.loads(json.dumps(first))['decision']['action'], 'hold')
+        
+        # 반환값을 수정해도 템플릿은 변경되지 않음
+        engine.update_position('BTC/USDT', {'size': 0.1})
+        adjusted = engine._apply_risk_management(first, 'BTC/USDT')
+        self.assertEqual(adjusted['size'], 0)
+        first['decision']['size'] = 5
+        self.assertEqual(engine._execute_arbitrage_strategy(hold, hold, 0.0), second)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+기술적 지표 커널 단위 테스트
+"""
+
+import unittest
+import numpy as np
+import talib
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import _ta_kernels as kernels
+
+
+class TestAllIndicatorsKernel(unittest.TestCase):
+    """단일 패스 지표 커널 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        np.random.seed(7)
+        n = 300
+        self.close = 50000 + np.cumsum(np.random.randn(n) * 100)
+        self.high = self.close * (1 + np.abs(np.random.randn(n)) * 0.002)
+        self.low = self.close * (1 - np.abs(np.random.randn(n)) * 0.002)
+        self.volume = np.random.randint(100, 1000, n).astype(np.float64)
+        self.out, self.obv = kernels._all_indicators(
+            self.close, self.high, self.low, self.volume,
+            14, 12, 26, 9, 20, 2.0, 14, 14, 3
+        )
+
+    def assertSeriesEqual(self, row, expected):
+        """NaN 위치와 값이 talib 결과와 일치하는지 확인 (float32 반올림 오차 허용)"""
+        actual = self.out[row]
+        self.assertEqual(actual.dtype, kernels.OUTPUT_DTYPE)
+        np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+        np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-9, equal_nan=True)
+
+    def test_matches_talib_oscillators(self):
+        """RSI/MACD/스토캐스틱/Williams %R talib 일치 테스트"""
+        self.assertSeriesEqual(kernels.RSI, talib.RSI(self.close, timeperiod=14))
+
+        macd, signal, hist = talib.MACD(self.close, fastperiod=12, slowperiod=26, signalperiod=9)
+        self.assertSeriesEqual(kernels.MACD, macd)
+        self.assertSeriesEqual(kernels.MACD_SIGNAL, signal)
+        self.assertSeriesEqual(kernels.MACD_HIST, hist)
+
+        slowk, slowd = talib.STOCH(self.high, self.low, self.close, fastk_period=14,
+                                   slowk_period=3, slowk_matype=0, slowd_period=3, slowd_matype=0)
+        self.assertSeriesEqual(kernels.SLOWK, slowk)
+        self.assertSeriesEqual(kernels.SLOWD, slowd)
+        self.assertSeriesEqual(kernels.WILLR, talib.WILLR(self.high, self.low, self.close, timeperiod=14))
+
+    def test_matches_talib_bands_and_averages(self):
+        """볼린저 밴드/ATR/이동평균/거래량 지표 일치 테스트"""
+        upper, middle, lower = talib.BBANDS(self.close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0)
+        self.assertSeriesEqual(kernels.BB_UPPER, upper)
+        self.assertSeriesEqual(kernels.BB_MIDDLE, middle)
+        self.assertSeriesEqual(kernels.BB_LOWER, lower)
+        self.assertSeriesEqual(kernels.ATR, talib.ATR(self.high, self.low, self.close, timeperiod=14))
+        self.assertEqual(self.obv.dtype, np.float64)
+        np.testing.assert_array_equal(self.obv, talib.OBV(self.close, self.volume))
+        self.assertSeriesEqual(kernels.VWAP, np.cumsum(self.close * self.volume) / np.cumsum(self.volume))
+
+        for j, period in enumerate(kernels.MA_PERIODS):
+            self.assertSeriesEqual(kernels.SMA_BASE + j, talib.SMA(self.close, timeperiod=period))
+            self.assertSeriesEqual(kernels.EMA_BASE + j, talib.EMA(self.close, timeperiod=period))
+
+    def test_rsi_wilder(self):
+        """RSI 커널 talib 일치 및 워밍업 구간 테스트"""
+        rsi = kernels._rsi_wilder(self.close, 14, np.empty_like(self.close))
+        expected = talib.RSI(self.close, timeperiod=14)
+
+        np.testing.assert_array_equal(rsi[:14], 50.0)
+        np.testing.assert_allclose(rsi[14:], expected[14:], rtol=1e-9)
+
+    def test_obv_vwap(self):
+        """OBV/VWAP 커널 및 거래량 0 구간 처리 테스트"""
+        obv = np.empty_like(self.close)
+        vwap = np.empty_like(self.close)
+        kernels._obv_vwap(self.close, self.volume, obv, vwap)
+
+        np.testing.assert_allclose(obv, talib.OBV(self.close, self.volume))
+        np.testing.assert_allclose(vwap, self.out[kernels.VWAP], rtol=1e-6)
+
+        volume = self.volume.copy()
+        volume[:3] = 0.0
+        kernels._obv_vwap(self.close, volume, obv, vwap)
+        np.testing.assert_array_equal(vwap[:3], self.close[:3])
+        self.assertTrue(np.isfinite(vwap).all())
+
+    def test_smas_emas(self):
+        """이동평균 SoA 커널 talib 일치 테스트"""
+        n_ma = len(kernels.MA_PERIODS)
+        out = kernels._smas_emas(self.close, np.empty((2 * n_ma, len(self.close))))
+
+        for j, period in enumerate(kernels.MA_PERIODS):
+            np.testing.assert_allclose(out[j], talib.SMA(self.close, timeperiod=period), rtol=1e-9, equal_nan=True)
+            np.testing.assert_allclose(out[n_ma + j], talib.EMA(self.close, timeperiod=period), rtol=1e-9, equal_nan=True)
+
+    def test_batch_matches_single(self):
+        """심볼 일괄 커널이 심볼별 결과와 일치하는지 테스트"""
+        stacked = [np.stack([a, a[::-1].copy()]) for a in (self.close, self.high, self.low, self.volume)]
+        out, obv = kernels._all_indicators_batch(*stacked, 14, 12, 26, 9, 20, 2.0, 14, 14, 3)
+
+        self.assertEqual(out.shape, (2, kernels.N_OUTPUTS, len(self.close)))
+        np.testing.assert_array_equal(out[0], self.out)
+        np.testing.assert_array_equal(obv[0], self.obv)
+        expected, expected_obv = kernels._all_indicators(*[row[1] for row in stacked], 14, 12, 26, 9, 20, 2.0, 14, 14, 3)
+        np.testing.assert_array_equal(out[1], expected)
+        np.testing.assert_array_equal(obv[1], expected_obv)
+
+    def test_empty_input(self):
+        """빈 입력 처리 테스트"""
+        empty = np.empty(0)
+        out, obv = kernels._all_indicators(empty, empty, empty, empty, 14, 12, 26, 9, 20, 2.0, 14, 14, 3)
+        self.assertEqual(out.shape, (kernels.N_OUTPUTS, 0))
+        self.assertEqual(obv.shape, (0,))
+
+
+if __name__ == '__main__':
+    unittest.main()
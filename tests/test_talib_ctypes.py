@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+TA-Lib ctypes 바인딩 단위 테스트
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import _ta_kernels as kernels
+from modules._talib_ctypes import TALIB_CTYPES_AVAILABLE, all_indicators_ctypes, rsi_wilder_ctypes
+
+
+@unittest.skipUnless(TALIB_CTYPES_AVAILABLE, "TA-Lib 공유 라이브러리 없음")
+class TestTalibCtypes(unittest.TestCase):
+    """ctypes 경로 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        np.random.seed(11)
+        n = 300
+        self.close = 50000 + np.cumsum(np.random.randn(n) * 100)
+        self.high = self.close * (1 + np.abs(np.random.randn(n)) * 0.002)
+        self.low = self.close * (1 - np.abs(np.random.randn(n)) * 0.002)
+        self.volume = np.random.randint(100, 1000, n).astype(np.float64)
+        self.volume[:2] = 0.0
+
+    def test_matches_kernel(self):
+        """커널과 같은 행 배치/NaN 위치/값 테스트"""
+        args = (self.close, self.high, self.low, self.volume, 14, 12, 26, 9, 20, 2.0, 14, 14, 3)
+        actual, actual_obv = all_indicators_ctypes(*args)
+        expected, expected_obv = kernels._all_indicators(*args)
+
+        self.assertEqual(actual.shape, expected.shape)
+        self.assertEqual(actual.dtype, expected.dtype)
+        np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+        np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(actual_obv, expected_obv)
+
+    def test_rsi_wilder(self):
+        """RSI 워밍업 구간 중립값 테스트"""
+        actual = rsi_wilder_ctypes(self.close, 14, np.empty_like(self.close))
+        expected = kernels._rsi_wilder(self.close, 14, np.empty_like(self.close))
+
+        np.testing.assert_array_equal(actual[:14], 50.0)
+        np.testing.assert_allclose(actual, expected, rtol=1e-9)
+
+    def test_short_and_empty_input(self):
+        """데이터 부족/빈 입력 테스트"""
+        short, _ = all_indicators_ctypes(self.close[:5], self.high[:5], self.low[:5], self.volume[:5],
+                                         14, 12, 26, 9, 20, 2.0, 14, 14, 3)
+        self.assertTrue(np.isnan(short[kernels.RSI]).all())
+
+        empty = np.empty(0)
+        out, _ = all_indicators_ctypes(empty, empty, empty, empty, 14, 12, 26, 9, 20, 2.0, 14, 14, 3)
+        self.assertEqual(out.shape, (kernels.N_OUTPUTS, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
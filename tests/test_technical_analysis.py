@@ -13,7 +13,7 @@ import os
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules.technical_analysis import TechnicalAnalyzer
+from modules.technical_analysis import TechnicalAnalyzer, _as_float_array
 
 
 class TestTechnicalAnalyzer(unittest.TestCase):
@@ -66,6 +66,34 @@ class TestTechnicalAnalyzer(unittest.TestCase):
         
         # 기본값 50으로 채워져야 함
         self.assertTrue(all(x == 50 for x in rsi))
+        self.assertEqual(rsi.dtype, np.float64)
+        self.assertEqual(self.analyzer.calculate_macd(short_data)['histogram'].dtype, np.float64)
+    
+    def test_ndarray_input(self):
+        """ndarray 입력이 Series 입력과 같은 결과를 내는지 테스트"""
+        close = self.test_data['close']
+        values = close.to_numpy()
+        
+        np.testing.assert_allclose(self.analyzer.calculate_rsi(values).values,
+                                   self.analyzer.calculate_rsi(close).values)
+        np.testing.assert_allclose(self.analyzer.calculate_macd(values)['histogram'].values,
+                                   self.analyzer.calculate_macd(close)['histogram'].values)
+        np.testing.assert_allclose(self.analyzer.calculate_moving_averages(values)['ema_20'],
+                                   self.analyzer.calculate_moving_averages(close)['ema_20'], equal_nan=True)
+        
+        high, low = self.test_data['high'], self.test_data['low']
+        arrays = (high.to_numpy(), low.to_numpy(), values)
+        np.testing.assert_allclose(self.analyzer.calculate_atr(*arrays),
+                                   self.analyzer.calculate_atr(high, low, close), equal_nan=True)
+        np.testing.assert_allclose(self.analyzer.calculate_stochastic(*arrays)['slowk'].values,
+                                   self.analyzer.calculate_stochastic(high, low, close)['slowk'].values, equal_nan=True)
+        np.testing.assert_allclose(self.analyzer.calculate_williams_r(*arrays),
+                                   self.analyzer.calculate_williams_r(high, low, close), equal_nan=True)
+        self.assertFalse(np.isnan(self.analyzer.calculate_atr(*arrays)[-1]))
+        
+        # 연속 float64 배열은 복사 없이 그대로 talib/커널에 전달
+        for array in arrays:
+            self.assertIs(_as_float_array(array), array)
     
     def test_calculate_macd_normal_case(self):
         """MACD 정상 계산 테스트"""
@@ -93,6 +121,20 @@ class TestTechnicalAnalyzer(unittest.TestCase):
             self.assertTrue(all(bb_data['upper'][valid_data] >= bb_data['middle'][valid_data]))
             self.assertTrue(all(bb_data['middle'][valid_data] >= bb_data['lower'][valid_data]))
     
+    def test_warmup_values_filled(self):
+        """MACD/볼린저 밴드 워밍업 구간 채움 테스트"""
+        close = self.test_data['close']
+        macd_data = self.analyzer.calculate_macd(close)
+        bb_data = self.analyzer.calculate_bollinger_bands(close)
+        
+        for series in macd_data.values():
+            self.assertFalse(series.isna().any())
+        
+        warmup = self.config['bb_period'] - 1
+        for series in bb_data.values():
+            self.assertFalse(series.isna().any())
+            np.testing.assert_array_equal(series.values[:warmup], close.values[:warmup])
+    
     def test_calculate_atr(self):
         """ATR 계산 테스트"""
         atr = self.analyzer.calculate_atr(
@@ -118,6 +160,40 @@ class TestTechnicalAnalyzer(unittest.TestCase):
         for indicator in expected_indicators:
             self.assertIn(indicator, indicators)
     
+    def test_indicator_cache_by_last_candle(self):
+        """마지막 캔들 지문 기반 지표 캐시 테스트"""
+        first = self.analyzer.get_all_indicators(self.test_data)
+        self.assertIs(self.analyzer.get_all_indicators(self.test_data.copy()), first)
+        
+        # 마지막 캔들이 바뀌면 다시 계산
+        updated = self.test_data.copy()
+        updated.loc[updated.index[-1], 'close'] += 1.0
+        self.assertIsNot(self.analyzer.get_all_indicators(updated), first)
+        
+        # 캐시 크기 제한
+        self.analyzer.indicator_cache_size = 2
+        self.analyzer.get_all_indicators(self.test_data.iloc[:50])
+        self.assertEqual(len(self.analyzer._indicator_cache), 2)
+    
+    def test_get_all_indicators_batch(self):
+        """여러 심볼 일괄 계산이 심볼별 계산과 같은지 테스트"""
+        frames = {
+            'BTC/USDT': self.test_data,
+            'ETH/USDT': self.test_data.assign(close=self.test_data['close'] * 0.06),
+            'XRP/USDT': self.test_data.iloc[:60]
+        }
+        results = self.analyzer.get_all_indicators_batch(frames)
+        
+        reference = TechnicalAnalyzer(self.config)
+        for symbol, df in frames.items():
+            expected = reference.get_all_indicators(df)
+            np.testing.assert_allclose(results[symbol]['rsi'].values, expected['rsi'].values)
+            np.testing.assert_allclose(results[symbol]['ma']['sma_20'], expected['ma']['sma_20'], equal_nan=True)
+            self.assertEqual(results[symbol]['_last']['bb'], expected['_last']['bb'])
+        
+        # 일괄 계산 결과도 캐시 공유
+        self.assertIs(self.analyzer.get_all_indicators(self.test_data), results['BTC/USDT'])
+    
     def test_generate_signals(self):
         """거래 신호 생성 테스트"""
         indicators = self.analyzer.get_all_indicators(self.test_data)
@@ -132,6 +208,45 @@ class TestTechnicalAnalyzer(unittest.TestCase):
             if signal_name != 'combined_signal':
                 self.assertTrue(-1 <= signal_value <= 1)
     
+    def test_generate_signals_from_last_values(self):
+        """마지막 값 기반 신호 생성 테스트"""
+        indicators = {'_last': {
+            'rsi': 25.0,
+            'macd_hist': np.array([-0.5, 0.5]),
+            'bb': (105.0, 104.0, 96.0),
+            'slowk': float('nan')
+        }}
+        signals = self.analyzer.generate_signals(indicators)
+        
+        self.assertEqual(signals['rsi_signal'], 1.0)
+        self.assertEqual(signals['macd_signal'], 1.0)
+        self.assertEqual(signals['bb_signal'], -1.0)
+        self.assertEqual(signals['stoch_signal'], 0.0)
+        self.assertAlmostEqual(signals['combined_signal'], 0.25)
+        
+        # '_last'가 없는 지표 딕셔너리도 동일하게 처리
+        legacy = {
+            'rsi': pd.Series([50.0, 25.0]),
+            'macd': {'histogram': pd.Series([-0.5, 0.5])},
+            'bb': {'upper': np.array([104.0]), 'middle': np.array([105.0]), 'lower': np.array([96.0])},
+            'stoch': {'slowk': pd.Series([np.nan])}
+        }
+        self.assertEqual(self.analyzer.generate_signals(legacy), signals)
+        self.assertEqual(self.analyzer.generate_signals({})['combined_signal'], 0.0)
+        
+        # 경계값: RSI/스토캐스틱은 경계 제외, 볼린저 밴드는 경계 포함
+        boundary = self.analyzer.generate_signals({'_last': {
+            'rsi': 30.0, 'macd_hist': np.array([0.5, 0.0]), 'bb': (96.0, 104.0, 96.0), 'slowk': 80.0
+        }})
+        self.assertEqual([boundary[key] for key in self.analyzer._SIGNAL_KEYS[:4]], [0.0, 0.0, 1.0, 0.0])
+        
+        # NaN 입력은 별도 검사 없이 모두 중립 신호
+        nan = float('nan')
+        missing = self.analyzer.generate_signals({'_last': {
+            'rsi': nan, 'macd_hist': np.array([nan, nan]), 'bb': (nan, nan, nan), 'slowk': nan
+        }})
+        self.assertEqual(missing, dict.fromkeys(self.analyzer._SIGNAL_KEYS, 0.0))
+    
     def test_get_market_strength(self):
         """시장 강도 분석 테스트"""
         indicators = self.analyzer.get_all_indicators(self.test_data)
@@ -142,11 +257,20 @@ class TestTechnicalAnalyzer(unittest.TestCase):
         for strength_type in expected_strengths:
             if strength_type in strength:
                 self.assertIsInstance(strength[strength_type], (int, float, np.number))
+        
+        # 날짜 인덱스 Series도 위치 기반으로 조회하고 sma_50이 0이면 추세 강도 0
+        dates = pd.date_range('2024-01-01', periods=2, freq='h')
+        strength = self.analyzer.get_market_strength({
+            'ma': {'sma_20': pd.Series([1.0, 2.0], index=dates), 'sma_50': np.zeros(2)},
+            'atr': pd.Series([0.5, 0.7], index=dates),
+            'rsi': pd.Series([40.0, 75.0], index=dates)
+        })
+        self.assertEqual(strength, {'trend_strength': 0.0, 'volatility_strength': 0.7, 'momentum_strength': 0.5})
     
-    @patch('modules.technical_analysis.talib.RSI')
+    @patch('modules.technical_analysis._rsi_wilder')
     def test_calculate_rsi_exception_handling(self, mock_rsi):
         """RSI 계산 예외 처리 테스트"""
-        # talib.RSI가 예외를 발생시키도록 설정
+        # RSI 커널이 예외를 발생시키도록 설정
         mock_rsi.side_effect = Exception("Test exception")
         
         rsi = self.analyzer.calculate_rsi(self.test_data['close'])
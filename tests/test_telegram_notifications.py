@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+텔레그램 알림 모듈 단위 테스트
+"""
+
+import asyncio
+import queue
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+import time
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.telegram_notifications import TelegramBot, TelegramNotifications, _ts
+
+
+class TestTelegramNotifications(unittest.TestCase):
+    """텔레그램 알림 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        env = patch.dict(os.environ, {'TELEGRAM_BOT_TOKEN': 'token', 'TELEGRAM_CHAT_ID': '1'})
+        env.start()
+        self.addCleanup(env.stop)
+
+        response = MagicMock(status_code=200)
+        post = patch('requests.Session.post', return_value=response)
+        self.mock_post = post.start()
+        self.addCleanup(post.stop)
+
+    def sent_texts(self):
+        """전송된 메시지 본문 목록"""
+        return [call.kwargs['data']['text'] for call in self.mock_post.call_args_list]
+
+    def test_session_reused(self):
+        """keep-alive 세션 재사용 테스트"""
+        bot = TelegramBot()
+        self.assertTrue(bot.send_message('a'))
+        self.assertTrue(bot.send_message('b'))
+
+        self.assertEqual(self.mock_post.call_count, 2)
+        self.assertIn('api.telegram.org', self.mock_post.call_args.args[0])
+
+    def test_shared_session(self):
+        """모든 봇 인스턴스가 같은 연결 풀 세션을 쓰는지 테스트"""
+        first = TelegramBot()
+        notifications = TelegramNotifications()
+        notifications.send_shutdown_message()
+        self.assertIs(first.session, notifications.telegram.session)
+
+        adapter = first.session.get_adapter('https://api.telegram.org')
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.read, 0)
+
+    def test_messages_sent_in_background(self):
+        """대기열 경유 전송 및 종료 시 대기 테스트"""
+        notifications = TelegramNotifications()
+        notifications.send_trade_notification({'symbol': 'BTC/USDT', 'side': 'buy', 'size': 0.1, 'price': 50000})
+        notifications.send_shutdown_message()
+
+        # 짧은 시간 내 메시지는 순서대로 하나로 묶어 전송하고 종료 알림은 마지막에 직접 전송
+        texts = self.sent_texts()
+        self.assertEqual(len(texts), 2)
+        parts = texts[0].split('━━━━━━━━')
+        self.assertEqual(len(parts), 2)
+        self.assertIn('트레이딩 봇 시작', parts[0])
+        self.assertIn('BTC/USDT', parts[1])
+        self.assertIn('트레이딩 봇 종료', texts[1])
+
+    @patch('modules.telegram_notifications._SHUTDOWN_FLUSH_TIMEOUT', 0.2)
+    def test_shutdown_does_not_wait_for_stalled_queue(self):
+        """전송이 멈춘 경우 종료 알림이 제한 시간 후 바로 전송되는지 테스트"""
+        def post(url, data, timeout):
+            if '거래 실행' in data['text']:
+                time.sleep(1.5)
+            return MagicMock(status_code=200)
+
+        self.mock_post.side_effect = post
+        notifications = TelegramNotifications()
+        notifications.send_trade_notification({'symbol': 'BTC/USDT', 'side': 'buy', 'size': 0.1, 'price': 50000})
+        time.sleep(0.9)
+        notifications.send_error_log({'type': 'api_error', 'message': 'queued'})
+        start = time.monotonic()
+        notifications.send_shutdown_message()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(notifications._queue.qsize(), 0)
+        self.assertIn('트레이딩 봇 종료', self.sent_texts()[-1])
+        notifications._queue.join()
+
+    def test_urgent_alert_skips_batch_window(self):
+        """심각도 high/critical 알림은 묶음 대기 없이 전송하는지 테스트"""
+        notifications = TelegramNotifications()
+        start = time.monotonic()
+        notifications.send_risk_alert({'type': 'emergency_stop', 'symbol': 'BTC/USDT', 'severity': 'critical'})
+        notifications._queue.join()
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        texts = self.sent_texts()
+        self.assertEqual(len(texts), 1)
+        self.assertIn('리스크 알림', texts[0])
+
+    def test_duplicate_alerts_suppressed(self):
+        """억제 구간 내 같은 거래/리스크 알림 중복 전송 방지 테스트"""
+        notifications = TelegramNotifications()
+        trade = {'symbol': 'BTC/USDT', 'side': 'buy', 'size': 0.1, 'price': 50000}
+        alert = {'type': 'stop_loss', 'symbol': 'BTC/USDT', 'severity': 'medium', 'message': 'a'}
+        notifications.send_trade_notification(trade)
+        notifications.send_trade_notification(dict(trade))
+        notifications.send_risk_alert(alert)
+        notifications.send_risk_alert(dict(alert, message='b'))
+        notifications.send_risk_alert(dict(alert, symbol='ETH/USDT'))
+        notifications._queue.join()
+
+        text = ''.join(self.sent_texts())
+        self.assertEqual(text.count('거래 실행'), 1)
+        self.assertEqual(text.count('리스크 알림'), 2)
+
+        # 억제 구간이 지나면 다시 전송
+        key = next(iter(notifications._recent))
+        notifications._recent[key] -= 31
+        self.assertFalse(notifications._is_duplicate(key))
+
+    @patch('modules.telegram_notifications.time.sleep')
+    def test_retry_after_throttling(self, mock_sleep):
+        """429 응답의 retry_after 대기 후 재전송, 400은 재시도하지 않는지 테스트"""
+        throttled = MagicMock(status_code=429)
+        throttled.json.return_value = {'ok': False, 'parameters': {'retry_after': 3}}
+        ok = MagicMock(status_code=200)
+        notifications = TelegramNotifications()
+        notifications._queue.join()
+        self.mock_post.reset_mock()
+
+        self.mock_post.side_effect = [throttled, ok]
+        self.assertTrue(notifications._send_with_retry('a'))
+        mock_sleep.assert_called_once_with(3.2)
+
+        self.mock_post.side_effect = None
+        self.mock_post.return_value = MagicMock(status_code=400)
+        self.assertFalse(notifications._send_with_retry('b'))
+        self.assertEqual(self.mock_post.call_count, 3)
+        notifications.send_shutdown_message()
+
+    def test_post_messages_async(self):
+        """비동기 동시 전송 테스트 (httpx 미설치 시 스레드 풀, 설치 시 AsyncClient)"""
+        notifications = TelegramNotifications()
+        notifications._queue.join()
+        self.mock_post.reset_mock()
+
+        with patch('modules.telegram_notifications.httpx', None):
+            results = asyncio.run(notifications.post_messages_async(['a', 'b']))
+        self.assertEqual(results, [True, True])
+        self.assertEqual(sorted(self.sent_texts()), ['a', 'b'])
+
+        client = MagicMock()
+        client.post = AsyncMock(return_value=MagicMock(status_code=200))
+        notifications._async_client = client
+        with patch('modules.telegram_notifications.httpx', MagicMock()):
+            results = asyncio.run(notifications.post_messages_async(['c', 'd', 'e']))
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual([call.kwargs['data']['text'] for call in client.post.call_args_list], ['c', 'd', 'e'])
+        notifications.send_shutdown_message()
+
+    def test_full_queue_evicts_oldest_normal_message(self):
+        """대기열 초과 시 오래된 일반 메시지부터 교체하고 긴급 메시지는 보존하는지 테스트"""
+        with patch.dict(os.environ, {'TELEGRAM_BOT_TOKEN': ''}):
+            notifications = TelegramNotifications()
+        notifications._worker = MagicMock()
+        notifications._queue = queue.PriorityQueue(maxsize=3)
+
+        for message in ('a', 'b', 'c'):
+            notifications._enqueue(message)
+        notifications._enqueue('u1', urgent=True)
+        notifications._enqueue('d')
+        notifications._enqueue('u2', urgent=True)
+        notifications._enqueue('u3', urgent=True)
+        notifications._enqueue('e')
+        notifications._enqueue('u4', urgent=True)
+
+        self.assertEqual(notifications._queue.unfinished_tasks, 3)
+        remaining = [notifications._queue.get_nowait()[2] for _ in range(3)]
+        self.assertEqual(remaining, ['u1', 'u2', 'u3'])
+
+    def test_send_batch(self):
+        """여러 종류 이벤트를 한 메시지로 묶어 한 번에 대기열에 넣는지 테스트"""
+        with patch.dict(os.environ, {'TELEGRAM_BOT_TOKEN': ''}):
+            notifications = TelegramNotifications()
+        notifications._enqueue = MagicMock()
+        TelegramNotifications.send_batch(notifications, [
+            {'kind': 'trade', 'symbol': 'BTC/USDT', 'side': 'buy', 'size': 0.1, 'price': 50000},
+            {'kind': 'portfolio', 'current_balance': 1000, 'total_pnl': 5},
+            {'kind': 'risk', 'type': 'stop_loss', 'symbol': 'BTC/USDT', 'severity': 'high'},
+            {'kind': 'unknown'},
+        ])
+
+        notifications._enqueue.assert_called_once()
+        text, urgent = notifications._enqueue.call_args.args
+        self.assertTrue(urgent)
+        self.assertEqual(text.count('━━━━━━━━'), 2)
+        self.assertIn('거래 실행', text)
+        self.assertIn('포트폴리오 업데이트', text)
+        self.assertIn('리스크 알림', text)
+
+    def test_join_messages_respects_length_limit(self):
+        """묶음 텍스트 최대 길이 테스트"""
+        texts = TelegramNotifications._join_messages(['a' * 3000, 'b' * 900, 'c' * 200, 'd' * 5000])
+
+        self.assertEqual(len(texts), 3)
+        self.assertTrue(texts[0].startswith('a') and texts[0].endswith('b'))
+        self.assertEqual(texts[1], 'c' * 200)
+        self.assertEqual(texts[2], 'd' * 5000)
+
+    def test_timestamp_cached_per_second(self):
+        """같은 초의 시각 문자열 재사용 테스트"""
+        now = int(time.time())
+        self.assertIs(_ts(now), _ts(now))
+        self.assertEqual(_ts(now, '%H:%M:%S'), time.strftime('%H:%M:%S', time.localtime(now)))
+
+    def test_send_text_uses_queue(self):
+        """미리 만든 메시지도 대기열을 거쳐 묶음 전송되는지 테스트"""
+        notifications = TelegramNotifications()
+        notifications.send_text('<b>custom</b>')
+        self.mock_post.assert_not_called()
+        notifications.send_shutdown_message()
+
+        self.assertIn('<b>custom</b>', self.sent_texts()[0])
+
+    def test_trade_notification_without_side(self):
+        """방향 값이 None인 거래 알림 테스트"""
+        notifications = TelegramNotifications()
+        notifications.send_trade_notification({'symbol': 'BTC/USDT', 'side': None, 'exchange_type': None})
+        notifications.send_shutdown_message()
+
+        self.assertIn('방향: N/A', self.sent_texts()[0])
+        self.assertIn('거래소: SPOT', self.sent_texts()[0])
+
+    def test_disabled(self):
+        """토큰 미설정 시 전송하지 않는지 테스트"""
+        with patch.dict(os.environ, {'TELEGRAM_BOT_TOKEN': ''}):
+            notifications = TelegramNotifications()
+            notifications.send_trade_notification({'symbol': 'BTC/USDT'})
+            notifications.send_shutdown_message()
+
+        self.assertFalse(notifications.enabled)
+        self.assertIsNone(notifications._worker)
+        self.assertIs(notifications.send_risk_alert, notifications.send_error_log)
+        self.mock_post.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
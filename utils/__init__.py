@@ -12,6 +12,8 @@ from .decorators import (
     validate_parameters,
     monitor_performance
 )
+from .time_utils import to_datetime
+from .serialization import dumps
 
 __all__ = [
     'TradingLogger',
@@ -24,5 +26,7 @@ __all__ = [
     'rate_limit',
     'cache_result',
     'validate_parameters',
-    'monitor_performance'
+    'monitor_performance',
+    'to_datetime',
+    'dumps'
 ]
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+numba njit 선택적 임포트 모듈
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba 미설치 환경에서는 순수 파이썬으로 실행
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba.njit 대체 데코레이터 (no-op)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
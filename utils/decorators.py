@@ -1,7 +1,9 @@
 """
 유틸리티 데코레이터 모듈
 """
+import os
 import time
+import logging
 import functools
 from typing import Callable, Any
 import ccxt
@@ -35,13 +37,19 @@ def retry_on_network_error(max_retries: int = 3, delay: float = 1.0):
     return decorator
 
 def log_execution_time(func: Callable) -> Callable:
-    """함수 실행 시간을 로그하는 데코레이터"""
+    """함수 실행 시간을 로그하는 데코레이터 (PERF_LOG_DISABLED=1 이면 원본 함수 반환)"""
+    if os.getenv('PERF_LOG_DISABLED', '0') == '1':
+        return func
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        start_time = time.time()
+        # DEBUG 로그가 꺼져 있으면 시간 측정 생략
+        if not logger.logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = time.perf_counter() - start_time
         
         logger.debug(f"{func.__name__} 실행 시간: {execution_time:.2f}초")
         return result
@@ -65,25 +65,29 @@ class TradingLogger:
         
         return logger
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """정보 로그"""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """디버그 로그"""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """경고 로그"""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """에러 로그"""
-        self.logger.error(message, **kwargs)
+        self.logger.error(message, *args, **kwargs)
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """크리티컬 로그"""
-        self.logger.critical(message, **kwargs)
+        self.logger.critical(message, *args, **kwargs)
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """해당 레벨 로그 출력 여부"""
+        return self.logger.isEnabledFor(level)
     
     def trade_log(self, symbol: str, side: str, amount: float, price: float, 
                   trade_type: str = 'spot', pnl: float = 0):
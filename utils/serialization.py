@@ -0,0 +1,20 @@
+"""
+JSON 직렬화 유틸리티 모듈
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any) -> bytes:
+    """UTF-8 JSON 바이트로 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
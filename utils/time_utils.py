@@ -0,0 +1,10 @@
+"""
+시간 변환 유틸리티 모듈
+"""
+from datetime import datetime
+
+
+def to_datetime(ts_ns: int) -> datetime:
+    """에포크 나노초(time.time_ns()) 타임스탬프를 로컬 datetime으로 변환"""
+    seconds, nanoseconds = divmod(ts_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)